@@ -33,10 +33,6 @@ class BlogAdmin(AttachmentsAdminMixin, admin.ModelAdmin):
     search_fields = ('title', 'category', 'description')
     list_filter = ('category',)
 
-    def delete_queryset(self, request, queryset):
-        for obj in queryset:
-            obj.delete()
-
 
 # ============================================================================
 # PRODUCT SECTION
@@ -49,10 +45,6 @@ class ProductAdmin(AttachmentsAdminMixin, admin.ModelAdmin):
     list_filter = ('category', 'sub_category')
     list_editable = ('price',)
 
-    def delete_queryset(self, request, queryset):
-        for obj in queryset:
-            obj.delete()
-
 
 # ============================================================================
 # SALE SECTION
@@ -66,24 +58,25 @@ class SoldProductInline(admin.TabularInline):
 
 
 class SoldProductAdmin(admin.ModelAdmin):
-    list_display = ('product', 'quantity')
+    list_display = ('product', 'quantity', 'unit_price')
     search_fields = ('product__title',)
     list_filter = ('product__category',)
 
 
 class SaleAdmin(admin.ModelAdmin):
-    list_display = ('email', 'address', 'city', 'state', 'postal_code', 'total_products')
+    list_display = ('email', 'address', 'city', 'state', 'postal_code', 'total_products', 'total_amount')
     search_fields = ('email', 'address', 'city', 'state', 'postal_code')
     list_filter = ('state', 'city')
     inlines = [SoldProductInline]
 
     def total_products(self, obj):
-        return obj.sold_products.count()
+        return obj.item_count
     total_products.short_description = _('Total Products')
+    total_products.admin_order_field = 'item_count'
 
-    def delete_queryset(self, request, queryset):
-        for sale in queryset:
-            sale.delete()
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        form.instance.recalculate_totals()
 
 
 # ============================================================================
@@ -209,12 +202,14 @@ def start_development_phase(self, request, queryset):
     start_development_phase.short_description = _('▶ Start development phase (resets countdown)')
 
     def show_banner(self, request, queryset):
-        queryset.update(is_visible=True)
+        queryset.update(is_visible=True, updated_at=timezone.now())
+        StagingPhaseBanner.invalidate_solo_cache()
         self.message_user(request, _('Banner shown.'))
     show_banner.short_description = _('👁 Show banner')
 
     def hide_banner(self, request, queryset):
-        queryset.update(is_visible=False)
+        queryset.update(is_visible=False, updated_at=timezone.now())
+        StagingPhaseBanner.invalidate_solo_cache()
         self.message_user(request, _('Banner hidden.'))
     hide_banner.short_description = _('🙈 Hide banner')
 
@@ -4,3 +4,6 @@
 class BaseFeatureAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'base_feature_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,67 @@
+"""
+JWT authentication that trusts token claims on read-only requests.
+
+Access tokens issued by ``generate_auth_tokens`` carry the user's claims and
+``token_version``. Safe requests (GET/HEAD/OPTIONS) authenticate as a
+``ClaimsUser`` built from those claims without touching the database. Unsafe
+requests, and permission checks that call ``get_verified_user``, load the user
+row and reject the token when its version no longer matches, i.e. after the
+user's role, staff flag or active state changed.
+
+Tokens without a version claim (issued before claims were embedded) always
+take the database path.
+"""
+from django.utils.functional import cached_property
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from base_feature_app.utils.auth_utils import TOKEN_VERSION_CLAIM
+
+
+class ClaimsUser(TokenUser):
+    """Stateless user backed by the claims of a validated access token."""
+
+    @cached_property
+    def id(self):
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if request.method in SAFE_METHODS and TOKEN_VERSION_CLAIM in validated_token:
+            return ClaimsUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        version = validated_token.get(TOKEN_VERSION_CLAIM)
+        if version is not None and version != user.token_version:
+            raise AuthenticationFailed('Token claims are outdated.', code='token_outdated')
+        return user
+
+
+def get_verified_user(request):
+    """
+    Return ``request.user`` backed by the database.
+
+    A ``ClaimsUser`` is swapped for the user row, after checking that the
+    token version is still current, so permission decisions never rely on
+    stale claims.
+    """
+    user = request.user
+    if isinstance(user, ClaimsUser):
+        user = ClaimsJWTAuthentication().get_user(request.auth)
+        request.user = user
+    return user
@@ -0,0 +1,64 @@
+"""
+Query-string filtering and full-text search for the catalog list endpoints.
+
+Search runs against the full-text indexes created in migration 0007: the
+FTS5 table ``<table>_fts`` on SQLite and the FULLTEXT index on MySQL. Other
+backends fall back to ``icontains`` on the same columns.
+"""
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_PARAM = 'search'
+SEARCH_FIELDS = ('title', 'description')
+MAX_SEARCH_TERMS = 8
+TOKEN_RE = re.compile(r'\w+')
+
+
+def filter_queryset(queryset, request, fields):
+    """
+    Apply exact-match filters for every name in ``fields`` present in the query string.
+
+    :param queryset: Base queryset.
+    :param request: DRF request.
+    :param fields: Field names that may be filtered on.
+    """
+    lookups = {field: request.query_params[field] for field in fields if request.query_params.get(field)}
+    return queryset.filter(**lookups) if lookups else queryset
+
+
+def search_queryset(queryset, request):
+    """
+    Restrict ``queryset`` to rows whose title/description match ``?search=``.
+
+    Every word must match, as a prefix. Words are extracted with ``\\w+`` so
+    user input never reaches the FTS query syntax.
+    """
+    terms = TOKEN_RE.findall(request.query_params.get(SEARCH_PARAM, ''))[:MAX_SEARCH_TERMS]
+    if not terms:
+        return queryset
+
+    table = queryset.model._meta.db_table
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        fts = f'{table}_fts'
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return queryset.filter(
+            id__in=RawSQL(f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [match])
+        )
+    if vendor == 'mysql':
+        columns = ', '.join(f'{table}.{field}' for field in SEARCH_FIELDS)
+        match = ' '.join(f'+{term}*' for term in terms)
+        return queryset.filter(
+            RawSQL(f'MATCH ({columns}) AGAINST (%s IN BOOLEAN MODE)', [match], output_field=BooleanField())
+        )
+
+    condition = Q()
+    for term in terms:
+        term_condition = Q()
+        for field in SEARCH_FIELDS:
+            term_condition |= Q(**{f'{field}__icontains': term})
+        condition &= term_condition
+    return queryset.filter(condition)
@@ -0,0 +1,28 @@
+"""
+Management command to print the catalog response cache hit/miss counters.
+"""
+
+from django.core.management.base import BaseCommand
+
+from base_feature_app.utils.catalog_cache import get_cache_stats, reset_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counters of the public catalog response cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Reset the counters after printing them'
+        )
+
+    def handle(self, *args, **options):
+        stats = get_cache_stats()
+        self.stdout.write(f"Catalog cache hits:   {stats['hits']}")
+        self.stdout.write(f"Catalog cache misses: {stats['misses']}")
+        self.stdout.write(f"Hit ratio:            {stats['hit_ratio']:.2%}")
+
+        if options['reset']:
+            reset_cache_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset.'))
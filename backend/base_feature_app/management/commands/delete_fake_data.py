@@ -22,22 +22,19 @@ def handle(self, *args, **options):
         if not options.get('confirm'):
             raise CommandError('Deletion not confirmed. Re-run with --confirm.')
         
-        # Delete Sales (this will cascade to SoldProducts)
+        # Delete Sales (SaleQuerySet.delete also removes their SoldProducts)
         sales_count = Sale.objects.count()
-        for sale in Sale.objects.all():
-            sale.delete()
+        Sale.objects.all().delete()
         self.stdout.write(self.style.SUCCESS(f'Deleted {sales_count} Sale records'))
         
         # Delete Blogs
         blogs_count = Blog.objects.count()
-        for blog in Blog.objects.all():
-            blog.delete()
+        Blog.objects.all().delete()
         self.stdout.write(self.style.SUCCESS(f'Deleted {blogs_count} Blog records'))
         
         # Delete Products
         products_count = Product.objects.count()
-        for product in Product.objects.all():
-            product.delete()
+        Product.objects.all().delete()
         self.stdout.write(self.style.SUCCESS(f'Deleted {products_count} Product records'))
         
         # Delete Users (EXCEPT superusers and staff)
@@ -0,0 +1,70 @@
+"""
+Management command to pre-generate missing attachment thumbnails.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django_attachments.models import Attachment, Library
+from django_attachments.thumbnails import generate_thumbnails
+
+from base_feature_app.utils.catalog_cache import invalidate_library
+
+
+def _generate(attachment_id):
+    try:
+        attachment = Attachment.objects.filter(pk=attachment_id).first()
+        return attachment is not None and generate_thumbnails(attachment)
+    finally:
+        # Each worker thread opened its own connection.
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = 'Generate every thumbnail alias for image attachments that are not ready or lack renditions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of worker threads rendering thumbnails (default: 4).'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Regenerate thumbnails for every image, not only pending ones.'
+        )
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        if workers < 1:
+            raise CommandError('--workers must be at least 1.')
+
+        queryset = Attachment.objects.images()
+        if not options['all']:
+            # Images made ready before renditions were cached still need them.
+            queryset = queryset.filter(Q(thumbnails_ready=False) | Q(renditions=[]))
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+        if not ids:
+            self.stdout.write(self.style.WARNING('No attachments need thumbnails.'))
+            return
+
+        if workers == 1:
+            results = [generate_thumbnails(attachment) for attachment in Attachment.objects.filter(pk__in=ids)]
+        else:
+            # Pillow releases the GIL while resizing, so threads render in parallel.
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_generate, ids))
+
+        done = sum(1 for result in results if result)
+        if done:
+            # Catalog responses embed thumbnail URLs; refresh their ETags and caches.
+            library_ids = set(Attachment.objects.filter(pk__in=ids).values_list('library_id', flat=True))
+            Library.objects.filter(pk__in=library_ids).update(updated=timezone.now())
+            for library_id in library_ids:
+                invalidate_library(library_id)
+        self.stdout.write(self.style.SUCCESS(f'Generated thumbnails for {done} of {len(ids)} attachment(s).'))
@@ -0,0 +1,42 @@
+"""
+Management command to rebuild the sales rollup tables for a date range.
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from base_feature_app.models import Sale
+from base_feature_app.services import sales_rollup
+
+
+class Command(BaseCommand):
+    help = 'Recompute daily and per-product sales rollups from raw sales'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            type=date.fromisoformat,
+            help='First day (YYYY-MM-DD), inclusive. Defaults to the first sale day.'
+        )
+        parser.add_argument(
+            '--end',
+            type=date.fromisoformat,
+            help='Last day (YYYY-MM-DD), inclusive. Defaults to today.'
+        )
+
+    def handle(self, *args, **options):
+        end = options['end'] or timezone.localdate()
+        start = options['start']
+        if start is None:
+            first = Sale.objects.order_by('created_at').values_list('created_at', flat=True).first()
+            if first is None:
+                self.stdout.write(self.style.WARNING('No sales found.'))
+                return
+            start = timezone.localdate(first)
+        if start > end:
+            raise CommandError('--start must be on or before --end.')
+
+        days = sales_rollup.rebuild(start, end)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt rollups for {start}..{end} ({days} day(s) with sales).'))
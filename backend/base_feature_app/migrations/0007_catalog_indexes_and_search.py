@@ -0,0 +1,85 @@
+from django.db import migrations, models
+
+SEARCH_TABLES = ('base_feature_app_product', 'base_feature_app_blog')
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    Full-text index over title/description for the catalog ``search`` param.
+
+    SQLite gets an external-content FTS5 table kept in sync by triggers; MySQL
+    gets a FULLTEXT index. Other backends fall back to icontains at query
+    time (see base_feature_app.filters). Note that on SQLite any later
+    migration that rebuilds these tables drops the triggers and must
+    recreate them.
+    """
+    vendor = schema_editor.connection.vendor
+    for table in SEARCH_TABLES:
+        if vendor == 'sqlite':
+            fts = f'{table}_fts'
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5("
+                f"title, description, content='{table}', content_rowid='id')"
+            )
+            schema_editor.execute(
+                f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {fts}(rowid, title, description) "
+                f"VALUES (new.id, new.title, new.description); END"
+            )
+            schema_editor.execute(
+                f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, title, description) "
+                f"VALUES ('delete', old.id, old.title, old.description); END"
+            )
+            schema_editor.execute(
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, title, description) "
+                f"VALUES ('delete', old.id, old.title, old.description); "
+                f"INSERT INTO {fts}(rowid, title, description) "
+                f"VALUES (new.id, new.title, new.description); END"
+            )
+            schema_editor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        elif vendor == 'mysql':
+            schema_editor.execute(
+                f"CREATE FULLTEXT INDEX {table}_search_ft ON {table} (title, description)"
+            )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for table in SEARCH_TABLES:
+        if vendor == 'sqlite':
+            fts = f'{table}_fts'
+            for suffix in ('ai', 'ad', 'au'):
+                schema_editor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            schema_editor.execute(f"DROP TABLE IF EXISTS {fts}")
+        elif vendor == 'mysql':
+            schema_editor.execute(f"DROP INDEX {table}_search_ft ON {table}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base_feature_app', '0006_create_staging_phase_banner'),
+        ('django_attachments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(fields=['category', '-created_at'], name='blog_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'sub_category'], name='product_cat_subcat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', '-created_at'], name='product_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['price'], name='product_price_idx'),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,77 @@
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, F, OuterRef, Subquery, Sum
+
+BATCH_SIZE = 1000
+
+
+def _id_batches(queryset):
+    """Yield lists of primary keys in ascending keyset batches."""
+    last_id = 0
+    while True:
+        ids = list(
+            queryset.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:BATCH_SIZE]
+        )
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def backfill_sale_totals(apps, schema_editor):
+    """
+    Capture the current Product.price as unit_price on existing lines, then
+    compute total_amount/item_count per sale, one batch of ids at a time.
+    """
+    Product = apps.get_model('base_feature_app', 'Product')
+    SoldProduct = apps.get_model('base_feature_app', 'SoldProduct')
+    Sale = apps.get_model('base_feature_app', 'Sale')
+    Through = Sale.sold_products.through
+
+    price = Subquery(Product.objects.filter(pk=OuterRef('product_id')).values('price')[:1])
+    for ids in _id_batches(SoldProduct.objects.all()):
+        SoldProduct.objects.filter(pk__in=ids).update(unit_price=price)
+
+    for ids in _id_batches(Sale.objects.all()):
+        totals = (
+            Through.objects.filter(sale_id__in=ids)
+            .values('sale_id')
+            .annotate(
+                total=Sum(
+                    F('soldproduct__unit_price') * F('soldproduct__quantity'),
+                    output_field=DecimalField(max_digits=12, decimal_places=2),
+                ),
+                lines=Count('id'),
+            )
+        )
+        sales = [
+            Sale(pk=row['sale_id'], total_amount=row['total'] or 0, item_count=row['lines'])
+            for row in totals
+        ]
+        Sale.objects.bulk_update(sales, ['total_amount', 'item_count'], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base_feature_app', '0008_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='soldproduct',
+            name='unit_price',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='sale',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='sale',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_sale_totals, migrations.RunPython.noop),
+    ]
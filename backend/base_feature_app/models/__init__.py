@@ -2,4 +2,6 @@
 from .product import Product
 from .sale import SoldProduct, Sale
 from .user import User
-from .staging_phase_banner import StagingPhaseBanner
\ No newline at end of file
+from .staging_phase_banner import StagingPhaseBanner
+from .idempotency_key import IdempotencyKey
+from .sales_rollup import DailySalesRollup, ProductSalesRollup
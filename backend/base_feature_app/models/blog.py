@@ -2,6 +2,15 @@
 from django_attachments.models import Library
 from django_attachments.fields import SingleImageField
 
+from base_feature_app.models.media_owner import MediaOwnerQuerySet
+from base_feature_app.utils.catalog_cache import invalidate_object
+
+
+class BlogQuerySet(MediaOwnerQuerySet):
+    library_field = 'image'
+    cache_resource = 'blogs'
+
+
 class Blog(models.Model):
     """
     Blog model.
@@ -20,6 +29,8 @@ class Blog(models.Model):
     :vartype updated_at: datetime
     """
 
+    objects = BlogQuerySet.as_manager()
+
     title = models.CharField(max_length=40)
     description = models.TextField()
     category = models.CharField(max_length=40)
@@ -27,13 +38,26 @@ class Blog(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     image = SingleImageField(related_name='blog_image', on_delete=models.CASCADE)
 
+    class Meta:
+        # Backs the list_blogs category filter with newest-first ordering.
+        # Full-text search on title/description is created in migration 0007.
+        indexes = [
+            models.Index(fields=['category', '-created_at'], name='blog_cat_created_idx'),
+        ]
+
     def __str__(self):
         return self.title
     
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_object('blogs', self.pk)
+
     def delete(self, *args, **kwargs):
+        pk = self.pk
         try:
             if self.image:
                 self.image.delete()
         except Library.DoesNotExist:
             pass
-        super(Blog, self).delete(*args, **kwargs)
\ No newline at end of file
+        super(Blog, self).delete(*args, **kwargs)
+        invalidate_object('blogs', pk)
\ No newline at end of file
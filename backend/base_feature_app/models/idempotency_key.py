@@ -0,0 +1,41 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class IdempotencyKey(models.Model):
+    """
+    Stored outcome of a POST sent with an ``Idempotency-Key`` header.
+
+    The row is inserted in the same transaction as the side effects it
+    guards, so the unique constraint on ``(scope, key)`` is what stops two
+    concurrent requests from both running the handler.
+
+    :ivar scope: Endpoint the key belongs to (e.g. ``create-sale``).
+    :vartype scope: str
+    :ivar key: Client-supplied idempotency key.
+    :vartype key: str
+    :ivar request_hash: SHA-256 of the canonical JSON request payload.
+    :vartype request_hash: str
+    :ivar response_status: HTTP status of the stored response.
+    :vartype response_status: int
+    :ivar response_body: Body of the stored response.
+    :vartype response_body: dict
+    :ivar expires_at: When the key may be reused.
+    :vartype expires_at: datetime
+    """
+
+    scope = models.CharField(max_length=50)
+    key = models.CharField(max_length=255)
+    request_hash = models.CharField(max_length=64)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['scope', 'key'], name='idempotency_scope_key_uniq'),
+        ]
+
+    def __str__(self):
+        return f'{self.scope}:{self.key}'
@@ -2,6 +2,15 @@
 from django_attachments.models import Library
 from django_attachments.fields import GalleryField
 
+from base_feature_app.models.media_owner import MediaOwnerQuerySet
+from base_feature_app.utils.catalog_cache import invalidate_object
+
+
+class ProductQuerySet(MediaOwnerQuerySet):
+    library_field = 'gallery'
+    cache_resource = 'products'
+
+
 class Product(models.Model):
     """
     Product model.
@@ -21,6 +30,8 @@ class Product(models.Model):
     :ivar categoria: category of the product in Spanish.
     """
 
+    objects = ProductQuerySet.as_manager()
+
     title = models.CharField(max_length=40)
     category = models.CharField(max_length=40)
     sub_category = models.CharField(max_length=40)    
@@ -31,13 +42,28 @@ class Product(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     gallery = GalleryField(related_name='products_with_attachment', on_delete=models.CASCADE)
 
+    class Meta:
+        # Back the list_products filters and orderings. Full-text search on
+        # title/description is created in migration 0007 (FTS5 / FULLTEXT).
+        indexes = [
+            models.Index(fields=['category', 'sub_category'], name='product_cat_subcat_idx'),
+            models.Index(fields=['category', '-created_at'], name='product_cat_created_idx'),
+            models.Index(fields=['price'], name='product_price_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_object('products', self.pk)
+
     def delete(self, *args, **kwargs):
+        pk = self.pk
         try:
             if self.gallery:
                 self.gallery.delete()
         except Library.DoesNotExist:
             pass
-        super(Product, self).delete(*args, **kwargs)
\ No newline at end of file
+        super(Product, self).delete(*args, **kwargs)
+        invalidate_object('products', pk)
\ No newline at end of file
@@ -1,4 +1,11 @@
-from django.db import models
+from collections import Counter
+
+from django.conf import settings
+from django.db import models, router, transaction
+from django.db.models import Count, DecimalField, F, Sum
+from django.db.models.functions import TruncDate
+from django.db.models.signals import post_delete, pre_delete
+from django.utils import timezone
 from base_feature_app.models import Product
 
 class SoldProduct(models.Model):
@@ -7,31 +14,152 @@ class SoldProduct(models.Model):
     """
     product = models.ForeignKey(Product, on_delete=models.PROTECT)
     quantity = models.IntegerField()
+    # Product.price captured at sale time; later price changes do not alter it.
+    unit_price = models.DecimalField(max_digits=10, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f'{self.product.title} (Qty: {self.quantity})'
 
+    def save(self, *args, **kwargs):
+        if self.unit_price is None:
+            self.unit_price = self.product.price
+        super().save(*args, **kwargs)
+
+def _has_delete_listeners():
+    return any(
+        signal.has_listeners(model)
+        for signal in (pre_delete, post_delete)
+        for model in (Sale, SoldProduct)
+    )
+
+
+def _rebuild_rollups_on_commit(days, using):
+    """Recompute the sales rollups of ``days`` once the deletion commits."""
+    if not days:
+        return
+
+    def rebuild():
+        from base_feature_app.services import sales_rollup
+
+        sales_rollup.rebuild_days(days)
+
+    transaction.on_commit(rebuild, using=using)
+
+
+class SaleQuerySet(models.QuerySet):
+    def local_days(self):
+        """Return the set of local dates the sales were created on."""
+        tz = timezone.get_current_timezone()
+        return set(
+            self.order_by()
+            .annotate(day=TruncDate('created_at', tzinfo=tz))
+            .values_list('day', flat=True)
+            .distinct()
+        )
+
+    def delete(self):
+        """
+        Delete the sales and their sold products with set-based queries.
+
+        Works in chunks of ``SALE_DELETE_CHUNK_SIZE`` sale ids: the M2M rows,
+        the sales and their sold products are each removed with one DELETE per
+        chunk, all inside one transaction. When pre/post_delete receivers are
+        registered for Sale or SoldProduct, falls back to ``Sale.delete()`` per
+        instance so they still fire. Sold products still linked to a sale
+        outside the deleted set are kept. The sales rollups of the affected
+        days are rebuilt on commit.
+
+        :returns: ``(total, {model label: count})`` like ``QuerySet.delete``.
+        """
+        if self.query.is_sliced:
+            raise TypeError("Cannot use 'limit' or 'offset' with delete().")
+
+        deleted = Counter()
+        db = router.db_for_write(Sale)
+        days = self.local_days()
+        if _has_delete_listeners():
+            with transaction.atomic(using=self.db, savepoint=False):
+                for sale in self.iterator():
+                    _, counts = sale._delete_with_listeners()
+                    deleted.update(counts)
+                _rebuild_rollups_on_commit(days, self.db)
+            return sum(deleted.values()), dict(deleted)
+
+        Through = Sale.sold_products.through
+        chunk_size = getattr(settings, 'SALE_DELETE_CHUNK_SIZE', 1000)
+        pending = self.order_by().values_list('pk', flat=True)
+        with transaction.atomic(using=db, savepoint=False):
+            while True:
+                sale_ids = list(pending[:chunk_size])
+                if not sale_ids:
+                    break
+                links = Through.objects.filter(sale_id__in=sale_ids)
+                sold_product_ids = list(links.values_list('soldproduct_id', flat=True))
+                deleted[Through._meta.label] += links._raw_delete(db)
+                deleted[Sale._meta.label] += Sale.objects.filter(pk__in=sale_ids)._raw_delete(db)
+                if sold_product_ids:
+                    # The M2M schema lets a line item belong to several sales;
+                    # keep the ones another sale still links to. Nothing else
+                    # references SoldProduct, so the collector (and its
+                    # per-row SELECTs) can be skipped.
+                    orphans = SoldProduct.objects.filter(pk__in=sold_product_ids).exclude(
+                        pk__in=Through.objects.filter(soldproduct_id__in=sold_product_ids).values('soldproduct_id')
+                    )
+                    deleted[SoldProduct._meta.label] += orphans._raw_delete(db)
+            _rebuild_rollups_on_commit(days, db)
+        deleted = {label: count for label, count in deleted.items() if count}
+        return sum(deleted.values()), deleted
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
 class Sale(models.Model):
     """
     Model representing a sale.
     """
+    objects = SaleQuerySet.as_manager()
+
     email = models.EmailField()
     address = models.CharField(max_length=255)
     city = models.CharField(max_length=100)
     state = models.CharField(max_length=100)
     postal_code = models.CharField(max_length=20)
     sold_products = models.ManyToManyField(SoldProduct)
+    # Denormalized from the line items when the sale is created; see
+    # recalculate_totals() for paths that edit lines afterwards.
+    total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    item_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.email
 
+    def recalculate_totals(self, save=True):
+        """
+        Recompute ``total_amount`` and ``item_count`` from the line items.
+
+        :param save: Persist the two columns when True.
+        """
+        totals = self.sold_products.aggregate(
+            total=Sum(F('unit_price') * F('quantity'), output_field=DecimalField(max_digits=12, decimal_places=2)),
+            lines=Count('id'),
+        )
+        self.total_amount = totals['total'] or 0
+        self.item_count = totals['lines']
+        if save:
+            Sale.objects.filter(pk=self.pk).update(total_amount=self.total_amount, item_count=self.item_count)
+
     def delete(self, *args, **kwargs):
+        return Sale.objects.filter(pk=self.pk).delete()
+
+    def _delete_with_listeners(self, *args, **kwargs):
+        """Per-instance delete used while pre/post_delete receivers are registered."""
         # Delete all sold products associated with this sale
         for sold_product in self.sold_products.all():
             sold_product.delete()
         # Call the superclass delete method
-        super().delete(*args, **kwargs)
\ No newline at end of file
+        return super().delete(*args, **kwargs)
\ No newline at end of file
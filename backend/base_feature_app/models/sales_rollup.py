@@ -0,0 +1,68 @@
+from django.db import models
+
+from base_feature_app.models import Product
+
+
+class DailySalesRollup(models.Model):
+    """
+    Per-day sales summary maintained by ``services.sales_rollup``.
+
+    :ivar date: Local calendar day of the sales.
+    :vartype date: date
+    :ivar sale_count: Number of sales.
+    :vartype sale_count: int
+    :ivar item_count: Number of sale lines.
+    :vartype item_count: int
+    :ivar units: Sum of line quantities.
+    :vartype units: int
+    :ivar revenue: Sum of ``unit_price * quantity``.
+    :vartype revenue: Decimal
+    """
+
+    date = models.DateField(unique=True)
+    sale_count = models.PositiveIntegerField(default=0)
+    item_count = models.PositiveIntegerField(default=0)
+    units = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.date}: {self.revenue}'
+
+
+class ProductSalesRollup(models.Model):
+    """
+    Per-day, per-product sales summary maintained by ``services.sales_rollup``.
+
+    ``category`` is the product category at sale time, so top-category
+    queries group rollup rows only and never join the catalog.
+
+    :ivar date: Local calendar day of the sales.
+    :vartype date: date
+    :ivar product: Product sold.
+    :vartype product: Product
+    :ivar category: Product category when sold.
+    :vartype category: str
+    :ivar units: Sum of line quantities.
+    :vartype units: int
+    :ivar revenue: Sum of ``unit_price * quantity``.
+    :vartype revenue: Decimal
+    """
+
+    date = models.DateField()
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='sales_rollups')
+    category = models.CharField(max_length=40)
+    units = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'product'], name='product_rollup_date_product_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['date', 'category'], name='product_rollup_date_cat_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.date} #{self.product_id}: {self.units}'
@@ -1,10 +1,18 @@
+import time
 from datetime import timedelta
 from functools import cached_property
 from math import ceil
 
-from django.db import models
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
 from django.utils import timezone
 
+SOLO_CACHE_KEY = 'staging_banner:solo'
+
+# Process-local copy of the singleton: (instance, monotonic deadline).
+_local_solo = {}
+
 
 class StagingPhaseBanner(models.Model):
     """Singleton model controlling the staging review banner shown to clients.
@@ -68,17 +76,54 @@ def is_expired(self):
     def phase_labels(self):
         return self.PHASE_LABELS_I18N.get(self.current_phase, {'es': '', 'en': ''})
 
+    @property
+    def seconds_until_change(self):
+        """Seconds until ``days_remaining``/``is_expired`` next change, or None if static."""
+        if self.expires_at is None:
+            return None
+        remaining = (self.expires_at - timezone.now()).total_seconds()
+        if remaining <= 0:
+            return None
+        return ceil(remaining % 86400) or 86400
+
     def save(self, *args, **kwargs):
         self.pk = 1
         # cached_property persists on the instance; invalidate on save so
         # admins editing started_at see fresh values on the next access.
         self.__dict__.pop('expires_at', None)
         super().save(*args, **kwargs)
+        self.invalidate_solo_cache()
+
+    @classmethod
+    def invalidate_solo_cache(cls):
+        """
+        Drop the cached singleton in this process and in the shared cache.
+
+        Call after any write that bypasses ``save()`` (e.g. ``queryset.update``).
+        Other processes keep their local copy for at most
+        ``STAGING_BANNER_LOCAL_TTL`` seconds.
+        """
+        _local_solo.clear()
+        cache.delete(SOLO_CACHE_KEY)
+        transaction.on_commit(lambda: cache.delete(SOLO_CACHE_KEY))
 
     @classmethod
     def get_solo(cls):
-        try:
-            return cls.objects.get(pk=1)
-        except cls.DoesNotExist:
+        """
+        Return the singleton row, creating it on first access.
+
+        Served from a short-lived process-local copy, then the shared cache,
+        then the database. The returned instance is shared; do not mutate it
+        outside ``save()``.
+        """
+        cached = _local_solo.get('entry')
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        instance = cache.get(SOLO_CACHE_KEY)
+        if instance is None:
             instance, _ = cls.objects.get_or_create(pk=1)
-            return instance
+            cache.set(SOLO_CACHE_KEY, instance, getattr(settings, 'STAGING_BANNER_CACHE_TTL', 300))
+        local_ttl = getattr(settings, 'STAGING_BANNER_LOCAL_TTL', 5)
+        _local_solo['entry'] = (instance, time.monotonic() + local_ttl)
+        return instance
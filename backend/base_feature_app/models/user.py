@@ -5,13 +5,17 @@
 
 
 class UserManager(BaseUserManager):
-    def create_user(self, email, password=None, **extra_fields):
+    def create_user(self, email, password=None, *, encoded_password=None, **extra_fields):
         if not email:
             raise ValueError('The Email field must be set')
 
         email = self.normalize_email(email)
         user = self.model(email=email, **extra_fields)
-        user.set_password(password)
+        if encoded_password is not None:
+            # Already hashed by the caller (see services.passwords).
+            user.password = encoded_password
+        else:
+            user.set_password(password)
         user.save(using=self._db)
         return user
 
@@ -44,11 +48,35 @@ class Role(models.TextChoices):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(default=timezone.now)
+    # Stamped into access tokens; bumped when a claim that grants access
+    # changes so tokens carrying the old claims stop authenticating.
+    token_version = models.PositiveIntegerField(default=0)
 
     objects = UserManager()
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
+    VERSIONED_FIELDS = ('role', 'is_active', 'is_staff')
 
     def __str__(self):
         return self.email
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if all(field in field_names for field in cls.VERSIONED_FIELDS):
+            instance._loaded_access = instance._access_state()
+        return instance
+
+    def _access_state(self):
+        return tuple(self.__dict__.get(field) for field in self.VERSIONED_FIELDS)
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_access', None)
+        if loaded is not None and loaded != self._access_state():
+            self.token_version += 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'token_version'}
+        super().save(*args, **kwargs)
+        self._loaded_access = self._access_state()
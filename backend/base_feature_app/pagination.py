@@ -0,0 +1,54 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Keyset pagination over ``-id`` for the CRUD list endpoints.
+
+    The cursor is DRF's opaque base64 token, so page N costs the same indexed
+    range scan as page 1 and no ``COUNT(*)`` is ever issued. The response body
+    stays a plain JSON list (what clients received before pagination existed);
+    navigation links travel in the RFC 8288 ``Link`` header.
+
+    Query params:
+        cursor: Opaque token taken from a previous ``Link`` header.
+        page_size: Rows per page, capped at ``API_MAX_PAGE_SIZE``.
+        ordering: One of ``ordering_fields``, optionally prefixed with ``-``;
+            unknown values fall back to ``-id``. ``id`` breaks ties so pages
+            stay stable when the sort column has duplicates.
+    """
+
+    ordering = '-id'
+    ordering_param = 'ordering'
+    ordering_fields = ()
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'API_MAX_PAGE_SIZE', 100)
+
+    def __init__(self, ordering_fields=None):
+        if ordering_fields is not None:
+            self.ordering_fields = tuple(ordering_fields)
+
+    def get_ordering(self, request, queryset, view):
+        value = request.query_params.get(self.ordering_param, '')
+        if value.lstrip('-') in self.ordering_fields:
+            return (value, '-id' if value.startswith('-') else 'id')
+        return (self.ordering,)
+
+    def get_link_header(self):
+        links = []
+        next_link = self.get_next_link()
+        previous_link = self.get_previous_link()
+        if next_link:
+            links.append(f'<{next_link}>; rel="next"')
+        if previous_link:
+            links.append(f'<{previous_link}>; rel="previous"')
+        return ', '.join(links)
+
+    def get_paginated_response(self, data):
+        headers = {}
+        link_header = self.get_link_header()
+        if link_header:
+            headers['Link'] = link_header
+        return Response(data, headers=headers)
@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from base_feature_app.authentication import get_verified_user
+
 
 class IsAdminOrReadOnly(BasePermission):
     """
@@ -10,7 +12,7 @@ class IsAdminOrReadOnly(BasePermission):
     def has_permission(self, request, view):
         if request.method in SAFE_METHODS:
             return True
-        return bool(request.user and request.user.is_authenticated and request.user.is_staff)
+        return bool(request.user and request.user.is_authenticated and get_verified_user(request).is_staff)
 
 
 class IsAdminUser(BasePermission):
@@ -19,4 +21,4 @@ class IsAdminUser(BasePermission):
     """
 
     def has_permission(self, request, view):
-        return bool(request.user and request.user.is_authenticated and request.user.is_staff)
+        return bool(request.user and request.user.is_authenticated and get_verified_user(request).is_staff)
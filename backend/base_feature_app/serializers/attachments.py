@@ -0,0 +1,137 @@
+"""
+Batched attachment resolution for serializers that expose gallery/image URLs.
+
+Product and Blog keep their media in a ``django_attachments`` Library. Reading
+``obj.gallery.attachment_set`` per row turns every list response into 1+N (or
+2N) queries. The helpers below prefetch all libraries and their attachments
+for a whole page in a fixed number of queries, ordered the same way the
+``(library, rank)`` index is laid out.
+"""
+from django.db.models import Prefetch, QuerySet, prefetch_related_objects
+from django.db.models.manager import BaseManager
+from django_attachments.models import Attachment
+from django_attachments.thumbnails import rendition_urls, thumbnail_urls
+from rest_framework import serializers
+
+ORDERED_ATTACHMENTS_ATTR = 'ordered_attachments'
+
+
+def ordered_attachments_prefetch(library_path):
+    """
+    Build the Prefetch that loads ``<library_path>.attachment_set`` by rank.
+
+    :param library_path: Lookup path from the serialized model to its Library
+        (e.g. ``'gallery'`` or ``'product__gallery'``).
+    :return: Prefetch storing the attachments on ``ordered_attachments``.
+    """
+    return Prefetch(
+        f'{library_path}__attachment_set',
+        queryset=Attachment.objects.order_by('rank', 'id'),
+        to_attr=ORDERED_ATTACHMENTS_ATTR,
+    )
+
+
+def prefetch_ordered_attachments(data, library_paths):
+    """
+    Attach ordered attachments to every instance of ``data``.
+
+    Querysets (and related managers) get the prefetch added lazily; already
+    materialised sequences (e.g. a paginated page) are prefetched in place.
+
+    :param data: QuerySet, manager or iterable of model instances.
+    :param library_paths: Iterable of Library lookup paths to prefetch.
+    :return: The queryset or list to iterate for serialization.
+    """
+    prefetches = [ordered_attachments_prefetch(path) for path in library_paths]
+    if isinstance(data, BaseManager):
+        data = data.all()
+    if isinstance(data, QuerySet):
+        return data.prefetch_related(*prefetches)
+    instances = list(data)
+    prefetch_related_objects(instances, *prefetches)
+    return instances
+
+
+def get_ordered_attachments(library):
+    """
+    Return the attachments of ``library`` ordered by rank.
+
+    Uses the prefetched list when present and falls back to a query otherwise,
+    so single-object serialization keeps working without a prefetch.
+    """
+    if library is None:
+        return []
+    prefetched = getattr(library, ORDERED_ATTACHMENTS_ATTR, None)
+    if prefetched is not None:
+        return prefetched
+    return library.attachment_set.order_by('rank', 'id')
+
+
+def get_first_attachment(library):
+    """
+    Return the lowest-ranked attachment of ``library`` or None.
+    """
+    if library is None:
+        return None
+    prefetched = getattr(library, ORDERED_ATTACHMENTS_ATTR, None)
+    if prefetched is not None:
+        return prefetched[0] if prefetched else None
+    return library.attachment_set.order_by('rank', 'id').first()
+
+
+def get_thumbnail_urls(attachment, request):
+    """
+    Return ``{alias: absolute url}`` of the pre-generated thumbnails of ``attachment``.
+
+    Built from the names stored on the attachment, so no image is opened;
+    empty while the thumbnails are still being generated.
+    """
+    return {key: request.build_absolute_uri(url) for key, url in thumbnail_urls(attachment).items()}
+
+
+def get_responsive_image(attachment, request):
+    """
+    Return a ``srcset``-style description of ``attachment`` for API payloads.
+
+    Dimensions come from the attachment row and the renditions cached on it
+    by the thumbnail task, so no file is opened or stat'ed. Until the
+    thumbnails are ready only the original is listed.
+
+    :return: Dict with ``url``, ``width``, ``height``, ``renditions``
+        (``alias``/``url``/``width``/``height``, narrowest first) and
+        ``srcset``.
+    """
+    original = {
+        'url': request.build_absolute_uri(attachment.file.url),
+        'width': attachment.image_width,
+        'height': attachment.image_height,
+    }
+    renditions = [
+        {**rendition, 'url': request.build_absolute_uri(rendition['url'])}
+        for rendition in rendition_urls(attachment)
+    ]
+    candidates = {}
+    for item in renditions + [original]:
+        if item['width']:
+            candidates.setdefault(item['width'], item['url'])
+    return {
+        **original,
+        'renditions': renditions,
+        'srcset': ', '.join(f'{url} {width}w' for width, url in candidates.items()),
+    }
+
+
+class AttachmentPrefetchListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer that prefetches the child's attachment libraries in bulk.
+
+    Child serializers declare ``attachment_library_paths`` with the lookups
+    to their Library fields; every page is then resolved in a constant number
+    of queries regardless of how many rows it contains.
+    """
+
+    def to_representation(self, data):
+        library_paths = getattr(self.child, 'attachment_library_paths', ())
+        if library_paths:
+            data = prefetch_ordered_attachments(data, library_paths)
+        return super().to_representation(data)
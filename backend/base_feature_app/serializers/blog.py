@@ -1,5 +1,11 @@
 from rest_framework import serializers
 from base_feature_app.models import Blog
+from base_feature_app.serializers.attachments import (
+    AttachmentPrefetchListSerializer,
+    get_first_attachment,
+    get_responsive_image,
+    get_thumbnail_urls,
+)
 
 class BlogSerializer(serializers.ModelSerializer):
     """
@@ -9,10 +15,14 @@ class BlogSerializer(serializers.ModelSerializer):
     """
 
     image_url = serializers.SerializerMethodField()
+    image_thumbnails = serializers.SerializerMethodField()
+    image_responsive = serializers.SerializerMethodField()
+    attachment_library_paths = ('image',)
 
     class Meta:
         model = Blog
         fields = '__all__'
+        list_serializer_class = AttachmentPrefetchListSerializer
 
     def get_image_url(self, obj):
         """
@@ -25,7 +35,33 @@ def get_image_url(self, obj):
         if not request:
             return None
         if obj.image:
-            attachment = obj.image.attachment_set.order_by('rank', 'id').first()
+            attachment = get_first_attachment(obj.image)
             if attachment:
                 return request.build_absolute_uri(attachment.file.url)
         return None
+
+    def get_image_thumbnails(self, obj):
+        """
+        Retrieves the thumbnail URLs of the Blog image, keyed by alias.
+
+        :param obj: The Blog instance.
+        :return: A ``{alias: url}`` dict, empty until thumbnails are generated.
+        """
+        request = self.context.get('request')
+        if not request or not obj.image:
+            return {}
+        attachment = get_first_attachment(obj.image)
+        return get_thumbnail_urls(attachment, request) if attachment else {}
+
+    def get_image_responsive(self, obj):
+        """
+        Retrieves responsive image data (size and thumbnail srcset) for the Blog image.
+
+        :param obj: The Blog instance.
+        :return: A ``get_responsive_image`` dict, or None without an image.
+        """
+        request = self.context.get('request')
+        if not request or not obj.image:
+            return None
+        attachment = get_first_attachment(obj.image)
+        return get_responsive_image(attachment, request) if attachment else None
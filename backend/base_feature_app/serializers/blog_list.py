@@ -1,21 +1,36 @@
 from rest_framework import serializers
 
 from base_feature_app.models import Blog
+from base_feature_app.serializers.attachments import (
+    AttachmentPrefetchListSerializer,
+    get_first_attachment,
+    get_responsive_image,
+)
 
 
 class BlogListSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_responsive = serializers.SerializerMethodField()
+    attachment_library_paths = ('image',)
 
     class Meta:
         model = Blog
-        fields = ('id', 'title', 'category', 'image_url')
+        fields = ('id', 'title', 'category', 'image_url', 'image_responsive')
+        list_serializer_class = AttachmentPrefetchListSerializer
 
     def get_image_url(self, obj):
         request = self.context.get('request')
         if not request:
             return None
         if obj.image:
-            attachment = obj.image.attachment_set.first()
+            attachment = get_first_attachment(obj.image)
             if attachment:
                 return request.build_absolute_uri(attachment.file.url)
         return None
+
+    def get_image_responsive(self, obj):
+        request = self.context.get('request')
+        if not request or not obj.image:
+            return None
+        attachment = get_first_attachment(obj.image)
+        return get_responsive_image(attachment, request) if attachment else None
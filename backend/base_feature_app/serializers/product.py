@@ -1,13 +1,23 @@
 from rest_framework import serializers
 from base_feature_app.models import Product
+from base_feature_app.serializers.attachments import (
+    AttachmentPrefetchListSerializer,
+    get_ordered_attachments,
+    get_responsive_image,
+    get_thumbnail_urls,
+)
 
 class ProductSerializer(serializers.ModelSerializer):
 
     gallery_urls = serializers.SerializerMethodField()
+    gallery_thumbnails = serializers.SerializerMethodField()
+    gallery_responsive = serializers.SerializerMethodField()
+    attachment_library_paths = ('gallery',)
     
     class Meta:
         model = Product
         fields = '__all__'
+        list_serializer_class = AttachmentPrefetchListSerializer
 
     def get_gallery_urls(self, obj):
         """
@@ -20,6 +30,30 @@ def get_gallery_urls(self, obj):
         if not request:
             return []
         if obj.gallery:
-            attachments = obj.gallery.attachment_set.order_by('rank', 'id')
+            attachments = get_ordered_attachments(obj.gallery)
             return [request.build_absolute_uri(attachment.file.url) for attachment in attachments]
-        return []
\ No newline at end of file
+        return []
+
+    def get_gallery_thumbnails(self, obj):
+        """
+        Retrieves the thumbnail URLs of every image in the gallery, keyed by alias.
+
+        :param obj: The Product instance.
+        :return: A list with one ``{alias: url}`` dict per gallery image.
+        """
+        request = self.context.get('request')
+        if not request or not obj.gallery:
+            return []
+        return [get_thumbnail_urls(attachment, request) for attachment in get_ordered_attachments(obj.gallery)]
+
+    def get_gallery_responsive(self, obj):
+        """
+        Retrieves responsive image data (size and thumbnail srcset) for every gallery image.
+
+        :param obj: The Product instance.
+        :return: A list with one ``get_responsive_image`` dict per gallery image.
+        """
+        request = self.context.get('request')
+        if not request or not obj.gallery:
+            return []
+        return [get_responsive_image(attachment, request) for attachment in get_ordered_attachments(obj.gallery)]
@@ -1,19 +1,42 @@
 from rest_framework import serializers
 
 from base_feature_app.models import Product
+from base_feature_app.serializers.attachments import (
+    AttachmentPrefetchListSerializer,
+    get_ordered_attachments,
+    get_responsive_image,
+    get_thumbnail_urls,
+)
 
 
 class ProductDetailSerializer(serializers.ModelSerializer):
     gallery_urls = serializers.SerializerMethodField()
+    gallery_thumbnails = serializers.SerializerMethodField()
+    gallery_responsive = serializers.SerializerMethodField()
+    attachment_library_paths = ('gallery',)
 
     class Meta:
         model = Product
         fields = '__all__'
+        list_serializer_class = AttachmentPrefetchListSerializer
 
     def get_gallery_urls(self, obj):
         request = self.context.get('request')
         if not request:
             return []
         if obj.gallery:
-            return [request.build_absolute_uri(a.file.url) for a in obj.gallery.attachment_set.all()]
+            attachments = get_ordered_attachments(obj.gallery)
+            return [request.build_absolute_uri(a.file.url) for a in attachments]
         return []
+
+    def get_gallery_thumbnails(self, obj):
+        request = self.context.get('request')
+        if not request or not obj.gallery:
+            return []
+        return [get_thumbnail_urls(a, request) for a in get_ordered_attachments(obj.gallery)]
+
+    def get_gallery_responsive(self, obj):
+        request = self.context.get('request')
+        if not request or not obj.gallery:
+            return []
+        return [get_responsive_image(a, request) for a in get_ordered_attachments(obj.gallery)]
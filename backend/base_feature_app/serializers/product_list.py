@@ -1,20 +1,34 @@
 from rest_framework import serializers
 
 from base_feature_app.models import Product
+from base_feature_app.serializers.attachments import (
+    AttachmentPrefetchListSerializer,
+    get_ordered_attachments,
+    get_responsive_image,
+)
 
 
 class ProductListSerializer(serializers.ModelSerializer):
     gallery_urls = serializers.SerializerMethodField()
+    gallery_responsive = serializers.SerializerMethodField()
+    attachment_library_paths = ('gallery',)
 
     class Meta:
         model = Product
-        fields = ('id', 'title', 'category', 'sub_category', 'price', 'gallery_urls')
+        fields = ('id', 'title', 'category', 'sub_category', 'price', 'gallery_urls', 'gallery_responsive')
+        list_serializer_class = AttachmentPrefetchListSerializer
 
     def get_gallery_urls(self, obj):
         request = self.context.get('request')
         if not request:
             return []
         if obj.gallery:
-            attachments = obj.gallery.attachment_set.order_by('rank', 'id')
+            attachments = get_ordered_attachments(obj.gallery)
             return [request.build_absolute_uri(a.file.url) for a in attachments]
         return []
+
+    def get_gallery_responsive(self, obj):
+        request = self.context.get('request')
+        if not request or not obj.gallery:
+            return []
+        return [get_responsive_image(a, request) for a in get_ordered_attachments(obj.gallery)]
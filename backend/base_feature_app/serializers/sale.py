@@ -1,14 +1,22 @@
+from decimal import Decimal
+
+from django.db import connection, transaction
 from rest_framework import serializers
 from base_feature_app.models import Sale, SoldProduct, Product
+from base_feature_app.serializers.attachments import AttachmentPrefetchListSerializer
 from base_feature_app.serializers.product import ProductSerializer
+from base_feature_app.tasks import apply_sale_to_rollups
 
 class SoldProductSerializer(serializers.ModelSerializer):
     product_id = serializers.IntegerField(write_only=True)
     product = ProductSerializer(read_only=True)
+    attachment_library_paths = ('product__gallery',)
 
     class Meta:
         model = SoldProduct
-        fields = ['product_id', 'product', 'quantity']
+        fields = ['product_id', 'product', 'quantity', 'unit_price']
+        read_only_fields = ['unit_price']
+        list_serializer_class = AttachmentPrefetchListSerializer
 
 class SaleSerializer(serializers.ModelSerializer):
     sold_products = SoldProductSerializer(many=True)
@@ -16,13 +24,55 @@ class SaleSerializer(serializers.ModelSerializer):
     class Meta:
         model = Sale
         fields = '__all__'
+        read_only_fields = ['total_amount', 'item_count']
+
+    def validate_sold_products(self, value):
+        """
+        Resolve every ``product_id`` with one query and reject unknown ids.
+        """
+        product_ids = {item['product_id'] for item in value}
+        self._products = Product.objects.in_bulk(product_ids)
+        missing = sorted(product_ids - self._products.keys())
+        if missing:
+            raise serializers.ValidationError(
+                f'Unknown product_id: {", ".join(str(pk) for pk in missing)}.'
+            )
+        return value
 
     def create(self, validated_data):
+        """
+        Create the sale, its sold products and the M2M links atomically.
+
+        The query count is constant in the number of line items, except on
+        backends that cannot return primary keys from a bulk insert (MySQL),
+        where sold products are inserted one by one.
+        """
         sold_products_data = validated_data.pop('sold_products')
-        sale = Sale.objects.create(**validated_data)
-        for sold_product_data in sold_products_data:
-            product_id = sold_product_data.pop('product_id')
-            product = Product.objects.get(id=product_id)
-            sold_product = SoldProduct.objects.create(product=product, **sold_product_data)
-            sale.sold_products.add(sold_product)
+        products = getattr(self, '_products', None)
+        if products is None:
+            products = Product.objects.in_bulk({item['product_id'] for item in sold_products_data})
+        sold_products = [
+            SoldProduct(
+                product=products[item['product_id']],
+                quantity=item['quantity'],
+                unit_price=products[item['product_id']].price,
+            )
+            for item in sold_products_data
+        ]
+        validated_data['total_amount'] = sum(
+            (line.unit_price * line.quantity for line in sold_products), Decimal('0')
+        )
+        validated_data['item_count'] = len(sold_products)
+        with transaction.atomic():
+            sale = Sale.objects.create(**validated_data)
+            if connection.features.can_return_rows_from_bulk_insert:
+                SoldProduct.objects.bulk_create(sold_products)
+            else:
+                for sold_product in sold_products:
+                    sold_product.save()
+            Through = Sale.sold_products.through
+            Through.objects.bulk_create(
+                Through(sale_id=sale.pk, soldproduct_id=sold_product.pk) for sold_product in sold_products
+            )
+            transaction.on_commit(lambda: apply_sale_to_rollups(sale.pk))
         return sale
\ No newline at end of file
@@ -6,4 +6,4 @@
 class SaleListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Sale
-        fields = ('id', 'email', 'city', 'state', 'postal_code')
+        fields = ('id', 'email', 'city', 'state', 'postal_code', 'total_amount', 'item_count')
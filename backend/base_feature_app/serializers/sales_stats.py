@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+
+class SalesStatsQuerySerializer(serializers.Serializer):
+    """Validates the ``start``/``end`` query params of the stats endpoint."""
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        end = attrs.get('end') or timezone.localdate()
+        start = attrs.get('start') or end - timedelta(days=29)
+        if start > end:
+            raise serializers.ValidationError('start must be on or before end.')
+        max_days = getattr(settings, 'SALES_STATS_MAX_DAYS', 366)
+        if (end - start).days + 1 > max_days:
+            raise serializers.ValidationError(f'Range cannot exceed {max_days} days.')
+        return {'start': start, 'end': end}
+
+
+class SalesTotalsSerializer(serializers.Serializer):
+    sale_count = serializers.IntegerField()
+    item_count = serializers.IntegerField()
+    units = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class DailySalesSerializer(SalesTotalsSerializer):
+    date = serializers.DateField()
+
+
+class TopProductSerializer(serializers.Serializer):
+    product_id = serializers.IntegerField()
+    title = serializers.CharField()
+    units = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class TopCategorySerializer(serializers.Serializer):
+    category = serializers.CharField()
+    units = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class SalesStatsSerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+    totals = SalesTotalsSerializer()
+    daily = DailySalesSerializer(many=True)
+    top_products = TopProductSerializer(many=True)
+    top_categories = TopCategorySerializer(many=True)
@@ -1,9 +1,8 @@
-import requests as http_requests
 from django.conf import settings
-from google.auth.transport import requests as google_requests
-from google.oauth2 import id_token
 
 from base_feature_app.models import User
+from base_feature_app.services.google_id_token import verify_google_id_token
+from base_feature_app.services.passwords import hash_password, verify_password
 
 
 def register_user(email: str, password: str, first_name: str = '', last_name: str = '') -> User:
@@ -25,7 +24,7 @@ def register_user(email: str, password: str, first_name: str = '', last_name: st
 
     return User.objects.create_user(
         email=email,
-        password=password,
+        encoded_password=hash_password(password),
         first_name=first_name,
         last_name=last_name,
     )
@@ -35,26 +34,39 @@ def authenticate_user(email: str, password: str):
     """
     Verify email/password credentials and return the user if valid.
 
+    The user is loaded with a single query and the password checked through
+    ``services.passwords``; hashes made by a non-preferred hasher are
+    upgraded transparently.
+
     :param email: User email address.
     :param password: Plain-text password.
     :returns: User instance if credentials are valid, None otherwise.
     :raises PermissionError: If the account is disabled.
     """
-    try:
-        user_check = User.objects.get(email=email)
-        if not user_check.is_active:
-            raise PermissionError('Account is disabled')
-    except User.DoesNotExist:
-        pass
-
-    from django.contrib.auth import authenticate
-    return authenticate(username=email, password=password)
+    user = User.objects.filter(email=email).first()
+    if user is None:
+        # Hash anyway so unknown emails take as long as wrong passwords.
+        hash_password(password)
+        return None
+    if not user.is_active:
+        raise PermissionError('Account is disabled')
+
+    valid, needs_rehash = verify_password(password, user.password)
+    if not valid:
+        return None
+    if needs_rehash:
+        user.password = hash_password(password)
+        user.save(update_fields=['password'])
+    return user
 
 
 def _resolve_google_payload(credential: str) -> dict:
     """
     Verify a Google credential token and return its payload.
 
+    The signature is checked locally against Google's cached JWKS keyset;
+    the audience is checked only when ``GOOGLE_OAUTH_CLIENT_ID`` is set.
+
     :param credential: Google ID token string.
     :returns: Token payload dict with email, given_name, family_name, picture.
     :raises ValueError: If the token is invalid or verification fails.
@@ -62,21 +74,7 @@ def _resolve_google_payload(credential: str) -> dict:
     client_id = getattr(settings, 'GOOGLE_OAUTH_CLIENT_ID', '')
 
     try:
-        if client_id:
-            payload = id_token.verify_oauth2_token(
-                credential,
-                google_requests.Request(),
-                client_id,
-            )
-        else:
-            response = http_requests.get(
-                'https://oauth2.googleapis.com/tokeninfo',
-                params={'id_token': credential},
-                timeout=5,
-            )
-            if response.status_code != 200:
-                raise ValueError('Invalid Google credential')
-            payload = response.json()
+        payload = verify_google_id_token(credential, audience=client_id)
     except ValueError:
         raise
     except Exception as exc:
@@ -0,0 +1,116 @@
+"""
+Local verification of Google ID tokens against a cached JWKS keyset.
+
+Google's signing keys are fetched from ``GOOGLE_JWKS_URL`` and kept in a
+process-local dict and in the shared cache for as long as the response's
+``Cache-Control: max-age`` allows. Tokens are then verified with PyJWT in
+process, so a login makes no outbound call unless the keyset expired or the
+token names a ``kid`` we have not seen yet (Google rotated its keys).
+"""
+import re
+import threading
+import time
+
+import jwt
+import requests as http_requests
+from django.conf import settings
+from django.core.cache import cache
+
+GOOGLE_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+JWKS_CACHE_KEY = 'google_id_token:jwks'
+MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+_local_jwks = {}
+_fetch_lock = threading.Lock()
+
+
+def _jwks_url() -> str:
+    return getattr(settings, 'GOOGLE_JWKS_URL', 'https://www.googleapis.com/oauth2/v3/certs')
+
+
+def _max_age(response) -> int:
+    match = MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+    return int(match.group(1)) if match else getattr(settings, 'GOOGLE_JWKS_DEFAULT_TTL', 3600)
+
+
+def _store(keyset: dict) -> dict:
+    _local_jwks.clear()
+    _local_jwks.update(keyset)
+    return keyset
+
+
+def _fetch_keyset() -> dict:
+    response = http_requests.get(_jwks_url(), timeout=5)
+    response.raise_for_status()
+    max_age = _max_age(response)
+    now = time.time()
+    keyset = {
+        'keys': {key['kid']: key for key in response.json().get('keys', []) if key.get('kid')},
+        'expires_at': now + max_age,
+        'fetched_at': now,
+    }
+    if max_age > 0:
+        cache.set(JWKS_CACHE_KEY, keyset, max_age)
+    return _store(keyset)
+
+
+def get_keyset(refresh: bool = False) -> dict:
+    """
+    Return ``{'keys': {kid: jwk}, 'expires_at': ..., 'fetched_at': ...}``.
+
+    Reads the process-local copy, then the shared cache, and only fetches
+    when both are missing or expired (or ``refresh`` is set).
+    """
+    now = time.time()
+    if not refresh:
+        if _local_jwks and _local_jwks['expires_at'] > now:
+            return _local_jwks
+        shared = cache.get(JWKS_CACHE_KEY)
+        if shared and shared['expires_at'] > now:
+            return _store(shared)
+    with _fetch_lock:
+        # Another thread may have refreshed while we waited.
+        if _local_jwks and _local_jwks['expires_at'] > now and (
+            not refresh or _local_jwks['fetched_at'] >= now
+        ):
+            return _local_jwks
+        return _fetch_keyset()
+
+
+def _signing_key(kid: str):
+    keyset = get_keyset()
+    jwk = keyset['keys'].get(kid)
+    if jwk is None:
+        # Unknown kid: Google may have rotated keys before our copy expired.
+        # Refetch, at most once per GOOGLE_JWKS_MIN_REFRESH_INTERVAL.
+        min_interval = getattr(settings, 'GOOGLE_JWKS_MIN_REFRESH_INTERVAL', 60)
+        if time.time() - keyset['fetched_at'] >= min_interval:
+            jwk = get_keyset(refresh=True)['keys'].get(kid)
+    if jwk is None:
+        raise ValueError('Invalid Google credential')
+    return jwt.PyJWK(jwk).key
+
+
+def verify_google_id_token(credential: str, audience: str = '') -> dict:
+    """
+    Verify a Google ID token locally and return its claims.
+
+    :param credential: Google ID token string.
+    :param audience: Expected ``aud`` (the OAuth client ID); skipped when empty.
+    :returns: Token claims.
+    :raises ValueError: If the token is malformed, expired, wrongly signed or
+        issued for another audience.
+    """
+    try:
+        kid = jwt.get_unverified_header(credential).get('kid')
+        return jwt.decode(
+            credential,
+            _signing_key(kid),
+            algorithms=['RS256'],
+            audience=audience or None,
+            issuer=GOOGLE_ISSUERS,
+            options={'verify_aud': bool(audience), 'require': ['exp', 'iat', 'iss']},
+            leeway=getattr(settings, 'GOOGLE_ID_TOKEN_LEEWAY', 10),
+        )
+    except jwt.PyJWTError as exc:
+        raise ValueError('Invalid Google credential') from exc
@@ -0,0 +1,116 @@
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from base_feature_app.models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+
+
+class _DiscardKey(Exception):
+    """Roll back the key row so a failed request does not pin its key."""
+
+    def __init__(self, response):
+        self.response = response
+
+
+def hash_payload(payload) -> str:
+    """
+    Return the SHA-256 of ``payload`` serialized as canonical JSON.
+
+    :param payload: Parsed request body.
+    :returns: Hex digest.
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), cls=DjangoJSONEncoder)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _replay(record, request_hash):
+    if record.request_hash != request_hash:
+        return Response(
+            {'detail': 'Idempotency-Key was already used with a different payload.'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    response = Response(record.response_body, status=record.response_status)
+    response[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def _live_record(scope, key):
+    record = IdempotencyKey.objects.filter(scope=scope, key=key).first()
+    if record is not None and record.expires_at <= timezone.now():
+        record.delete()
+        return None
+    return record
+
+
+def idempotent_response(scope: str, key: str, payload, handler) -> Response:
+    """
+    Run ``handler`` at most once per ``(scope, key)`` and replay its response.
+
+    Retries cost one indexed lookup. The key row is inserted inside the same
+    transaction as the handler's writes: a concurrent duplicate blocks on the
+    unique index until the first request commits, then replays its stored
+    response. Only 2xx responses are stored; on any other outcome the key is
+    released so the client can correct the request and retry.
+
+    :param scope: Endpoint name the key is bound to.
+    :param key: Value of the ``Idempotency-Key`` header.
+    :param payload: Parsed request body, hashed to detect key reuse.
+    :param handler: Zero-argument callable returning a DRF ``Response``.
+    :returns: The handler's response, a replay of it, or 422 when the key was
+        used with a different payload.
+    """
+    if len(key) > MAX_KEY_LENGTH:
+        return Response(
+            {'detail': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters.'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    request_hash = hash_payload(payload)
+    record = _live_record(scope, key)
+    if record is not None:
+        return _replay(record, request_hash)
+
+    ttl = getattr(settings, 'IDEMPOTENCY_KEY_TTL', 86400)
+    try:
+        with transaction.atomic():
+            record = IdempotencyKey.objects.create(
+                scope=scope,
+                key=key,
+                request_hash=request_hash,
+                expires_at=timezone.now() + timedelta(seconds=ttl),
+            )
+            response = handler()
+            if not status.is_success(response.status_code):
+                raise _DiscardKey(response)
+            record.response_status = response.status_code
+            record.response_body = response.data
+            record.save(update_fields=['response_status', 'response_body'])
+    except _DiscardKey as discarded:
+        return discarded.response
+    except IntegrityError:
+        record = _live_record(scope, key)
+        if record is None:
+            raise
+        return _replay(record, request_hash)
+    return response
+
+
+def purge_expired_keys() -> int:
+    """
+    Delete idempotency keys past their ``expires_at``.
+
+    :returns: Number of rows deleted.
+    """
+    deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted
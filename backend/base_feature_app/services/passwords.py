@@ -0,0 +1,80 @@
+"""
+Password hashing off the request thread.
+
+With ``PASSWORD_HASH_WORKERS`` set, hashing and verification run in a bounded
+pool of worker processes, so a burst of sign-ins burns CPU there instead of
+holding the GIL of the worker serving other requests. With 0 (the default)
+everything runs inline, exactly like ``User.set_password``/``check_password``.
+"""
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _init_worker():
+    # Spawned workers start without the app registry; forked ones inherit it.
+    django.setup()
+
+
+def _get_pool():
+    global _pool
+    workers = getattr(settings, 'PASSWORD_HASH_WORKERS', 0)
+    if workers <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    return _pool
+
+
+def _run(func, *args):
+    pool = _get_pool()
+    if pool is None:
+        return func(*args)
+    return pool.submit(func, *args).result()
+
+
+def _verify(password: str, encoded: str) -> tuple[bool, bool]:
+    if not check_password(password, encoded):
+        return False, False
+    preferred = get_hasher('default')
+    hasher = identify_hasher(encoded)
+    return True, hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def hash_password(password: str) -> str:
+    """
+    Hash ``password`` with the preferred hasher.
+
+    :param password: Plain-text password.
+    :returns: Encoded hash, as stored in ``User.password``.
+    """
+    return _run(make_password, password)
+
+
+def verify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    """
+    Check ``password`` against an encoded hash.
+
+    :param password: Plain-text password.
+    :param encoded: Stored hash.
+    :returns: ``(valid, needs_rehash)``; ``needs_rehash`` is True when the hash
+        was made by another hasher or with outdated parameters.
+    """
+    return _run(_verify, password, encoded)
+
+
+def shutdown_pool():
+    """Stop the worker processes, if any were started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
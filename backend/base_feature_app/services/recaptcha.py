@@ -0,0 +1,128 @@
+"""
+Google reCAPTCHA verification client.
+
+Tokens are checked against ``siteverify`` over one keep-alive ``requests``
+session per process, so logins reuse pooled TLS connections instead of
+opening a new one each time. Verdicts are cached per token for
+``RECAPTCHA_VERDICT_TTL`` seconds, so a double-submitted form is not
+re-verified (Google rejects a reused token as ``timeout-or-duplicate``).
+Failures are served from the cache freely; a pass is consumed by its first
+reuse, so one solved captcha cannot be replayed across logins.
+
+A circuit breaker shared through the cache protects worker capacity during
+provider outages: after ``RECAPTCHA_BREAKER_THRESHOLD`` consecutive errors the
+provider is skipped for ``RECAPTCHA_BREAKER_COOLDOWN`` seconds. Errors and an
+open breaker resolve to ``RECAPTCHA_FAIL_OPEN`` (reject by default).
+"""
+import hashlib
+import threading
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+RECAPTCHA_VERIFY_URL = 'https://www.google.com/recaptcha/api/siteverify'
+VERDICT_CACHE_PREFIX = 'recaptcha:verdict:'
+BREAKER_FAILURES_KEY = 'recaptcha:breaker:failures'
+BREAKER_OPEN_KEY = 'recaptcha:breaker:open'
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide keep-alive session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=getattr(settings, 'RECAPTCHA_POOL_SIZE', 10),
+                    max_retries=0,
+                ))
+                _session = session
+    return _session
+
+
+def _verdict_key(token: str) -> str:
+    return VERDICT_CACHE_PREFIX + hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def _outage_verdict() -> bool:
+    return getattr(settings, 'RECAPTCHA_FAIL_OPEN', False)
+
+
+def _record_failure():
+    cooldown = getattr(settings, 'RECAPTCHA_BREAKER_COOLDOWN', 30)
+    cache.add(BREAKER_FAILURES_KEY, 0, cooldown)
+    try:
+        failures = cache.incr(BREAKER_FAILURES_KEY)
+    except ValueError:
+        # The counter expired between add() and incr().
+        cache.set(BREAKER_FAILURES_KEY, 1, cooldown)
+        failures = 1
+    if failures >= getattr(settings, 'RECAPTCHA_BREAKER_THRESHOLD', 5):
+        cache.set(BREAKER_OPEN_KEY, True, cooldown)
+        cache.delete(BREAKER_FAILURES_KEY)
+
+
+def verify_recaptcha(token: str) -> bool:
+    """Verify a reCAPTCHA token with Google's API.
+
+    Args:
+        token: The reCAPTCHA response token from the frontend.
+
+    Returns:
+        bool: True if verification succeeds, False otherwise. While the
+        provider is failing, the ``RECAPTCHA_FAIL_OPEN`` policy decides.
+    """
+    secret_key = getattr(settings, 'RECAPTCHA_SECRET_KEY', '')
+    if not secret_key:
+        return True
+
+    if not token:
+        return False
+
+    verdict_key = _verdict_key(token)
+    state = cache.get_many([verdict_key, BREAKER_OPEN_KEY, BREAKER_FAILURES_KEY])
+    if verdict_key in state:
+        if not state[verdict_key]:
+            return False
+        # A pass is good for one more use (verify_captcha then sign_in), like
+        # the single-use token itself; delete() makes concurrent reuse lose.
+        if cache.delete(verdict_key):
+            return True
+    if state.get(BREAKER_OPEN_KEY):
+        return _outage_verdict()
+
+    try:
+        response = get_session().post(
+            RECAPTCHA_VERIFY_URL,
+            data={
+                'secret': secret_key,
+                'response': token,
+            },
+            timeout=getattr(settings, 'RECAPTCHA_TIMEOUT', 3),
+        )
+        success = bool(response.json().get('success', False))
+    except (requests.RequestException, ValueError):
+        _record_failure()
+        return _outage_verdict()
+
+    if state.get(BREAKER_FAILURES_KEY):
+        cache.delete(BREAKER_FAILURES_KEY)
+    cache.set(verdict_key, success, getattr(settings, 'RECAPTCHA_VERDICT_TTL', 120))
+    return success
+
+
+async def averify_recaptcha(token: str) -> bool:
+    """Async variant of ``verify_recaptcha`` for ASGI views.
+
+    The blocking HTTP call runs in a worker thread, so the event loop keeps
+    serving other requests while Google answers.
+    """
+    return await sync_to_async(verify_recaptcha, thread_sensitive=False)(token)
@@ -0,0 +1,196 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from base_feature_app.models import DailySalesRollup, ProductSalesRollup, Sale
+
+LINE_REVENUE = ExpressionWrapper(
+    F('soldproduct__unit_price') * F('soldproduct__quantity'),
+    output_field=DecimalField(max_digits=14, decimal_places=2),
+)
+
+
+def _day_bounds(start: date, end: date):
+    """Return aware datetimes covering local days ``start`` through ``end``."""
+    tz = timezone.get_current_timezone()
+    return (
+        timezone.make_aware(datetime.combine(start, time.min), tz),
+        timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min), tz),
+    )
+
+
+def _get_or_create_row(model, defaults=None, **lookup):
+    try:
+        with transaction.atomic():
+            return model.objects.get_or_create(defaults=defaults, **lookup)[0]
+    except IntegrityError:
+        return model.objects.get(**lookup)
+
+
+def apply_sale(sale_id: int) -> None:
+    """
+    Add one committed sale to the rollup tables.
+
+    Counters are bumped with ``F()`` updates so concurrent sales on the same
+    day never lose increments. Running this twice for the same sale double
+    counts it; the periodic rebuild corrects any such drift.
+
+    :param sale_id: Primary key of a committed Sale.
+    """
+    sale = Sale.objects.filter(pk=sale_id).values('created_at', 'total_amount', 'item_count').first()
+    if sale is None:
+        return
+    day = timezone.localdate(sale['created_at'])
+    lines = (
+        Sale.sold_products.through.objects.filter(sale_id=sale_id)
+        .values('soldproduct__product_id', 'soldproduct__product__category')
+        .annotate(units=Sum('soldproduct__quantity'), revenue=Sum(LINE_REVENUE))
+    )
+
+    with transaction.atomic():
+        units = 0
+        for line in lines:
+            units += line['units']
+            row = _get_or_create_row(
+                ProductSalesRollup,
+                date=day,
+                product_id=line['soldproduct__product_id'],
+                defaults={'category': line['soldproduct__product__category']},
+            )
+            ProductSalesRollup.objects.filter(pk=row.pk).update(
+                units=F('units') + line['units'],
+                revenue=F('revenue') + line['revenue'],
+            )
+        row = _get_or_create_row(DailySalesRollup, date=day)
+        DailySalesRollup.objects.filter(pk=row.pk).update(
+            sale_count=F('sale_count') + 1,
+            item_count=F('item_count') + sale['item_count'],
+            units=F('units') + units,
+            revenue=F('revenue') + sale['total_amount'],
+        )
+
+
+def rebuild(start: date, end: date) -> int:
+    """
+    Recompute the rollup rows for local days ``start`` through ``end`` from raw sales.
+
+    :param start: First day, inclusive.
+    :param end: Last day, inclusive.
+    :returns: Number of daily rows written.
+    """
+    since, until = _day_bounds(start, end)
+    tz = timezone.get_current_timezone()
+    product_rows = (
+        Sale.sold_products.through.objects.filter(sale__created_at__gte=since, sale__created_at__lt=until)
+        .annotate(day=TruncDate('sale__created_at', tzinfo=tz))
+        .values('day', 'soldproduct__product_id', 'soldproduct__product__category')
+        .annotate(units=Sum('soldproduct__quantity'), revenue=Sum(LINE_REVENUE))
+    )
+    daily_rows = (
+        Sale.objects.filter(created_at__gte=since, created_at__lt=until)
+        .annotate(day=TruncDate('created_at', tzinfo=tz))
+        .values('day')
+        .annotate(sale_count=Count('id'), item_count=Sum('item_count'), revenue=Sum('total_amount'))
+    )
+
+    units_by_day = defaultdict(int)
+    product_rollups = []
+    for row in product_rows:
+        units_by_day[row['day']] += row['units']
+        product_rollups.append(ProductSalesRollup(
+            date=row['day'],
+            product_id=row['soldproduct__product_id'],
+            category=row['soldproduct__product__category'],
+            units=row['units'],
+            revenue=row['revenue'] or Decimal('0'),
+        ))
+    daily_rollups = [
+        DailySalesRollup(
+            date=row['day'],
+            sale_count=row['sale_count'],
+            item_count=row['item_count'] or 0,
+            units=units_by_day[row['day']],
+            revenue=row['revenue'] or Decimal('0'),
+        )
+        for row in daily_rows
+    ]
+
+    with transaction.atomic():
+        DailySalesRollup.objects.filter(date__range=(start, end)).delete()
+        ProductSalesRollup.objects.filter(date__range=(start, end)).delete()
+        DailySalesRollup.objects.bulk_create(daily_rollups, batch_size=500)
+        ProductSalesRollup.objects.bulk_create(product_rollups, batch_size=500)
+    return len(daily_rollups)
+
+
+def rebuild_days(days) -> int:
+    """
+    Recompute the rollup rows of the given local days, e.g. after sales were deleted.
+
+    Consecutive days are rebuilt as one range.
+
+    :param days: Iterable of dates.
+    :returns: Number of daily rows written.
+    """
+    written = 0
+    ordered = sorted(set(days))
+    while ordered:
+        start = end = ordered.pop(0)
+        while ordered and ordered[0] == end + timedelta(days=1):
+            end = ordered.pop(0)
+        written += rebuild(start, end)
+    return written
+
+
+def get_stats(start: date, end: date, limit: int = 10) -> dict:
+    """
+    Answer a stats range query from the rollup tables only.
+
+    :param start: First day, inclusive.
+    :param end: Last day, inclusive.
+    :param limit: Number of top products and categories.
+    :returns: Dict with ``totals``, ``daily``, ``top_products`` and ``top_categories``.
+    """
+    daily = list(
+        DailySalesRollup.objects.filter(date__range=(start, end))
+        .order_by('date')
+        .values('date', 'sale_count', 'item_count', 'units', 'revenue')
+    )
+    totals = {
+        'sale_count': sum(row['sale_count'] for row in daily),
+        'item_count': sum(row['item_count'] for row in daily),
+        'units': sum(row['units'] for row in daily),
+        'revenue': sum((row['revenue'] for row in daily), Decimal('0')),
+    }
+    product_rows = ProductSalesRollup.objects.filter(date__range=(start, end))
+    top_products = list(
+        product_rows.values('product_id', 'product__title')
+        .annotate(units=Sum('units'), revenue=Sum('revenue'))
+        .order_by('-revenue', 'product_id')[:limit]
+    )
+    top_categories = list(
+        product_rows.values('category')
+        .annotate(units=Sum('units'), revenue=Sum('revenue'))
+        .order_by('-revenue', 'category')[:limit]
+    )
+    return {
+        'start': start,
+        'end': end,
+        'totals': totals,
+        'daily': daily,
+        'top_products': [
+            {
+                'product_id': row['product_id'],
+                'title': row['product__title'],
+                'units': row['units'],
+                'revenue': row['revenue'],
+            }
+            for row in top_products
+        ],
+        'top_categories': top_categories,
+    }
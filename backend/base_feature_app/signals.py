@@ -0,0 +1,61 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django_attachments.models import Attachment, Library
+from django_attachments.signals import attachments_reordered
+
+from base_feature_app.models import Sale
+from base_feature_app.utils.catalog_cache import invalidate_library
+
+
+def touch_library(library_id):
+    """
+    Bump ``Library.updated`` so catalog ETags change with the media.
+
+    Uses ``update()`` to skip ``Library.save()`` and its signals.
+    """
+    Library.objects.filter(pk=library_id).update(updated=timezone.now())
+
+
+@receiver(post_save, sender=Attachment)
+@receiver(post_delete, sender=Attachment)
+def invalidate_catalog_on_attachment_change(sender, instance, **kwargs):
+    """Drop cached catalog responses that embed this attachment's library."""
+    touch_library(instance.library_id)
+    invalidate_library(instance.library_id)
+
+
+@receiver(post_save, sender=Attachment)
+def enqueue_attachment_thumbnails(sender, instance, raw=False, **kwargs):
+    """Render the thumbnails of a new or replaced image once the save commits."""
+    if raw or not instance.is_image or instance.thumbnails_ready:
+        return
+    from base_feature_app.tasks import generate_attachment_thumbnails
+
+    attachment_id = instance.pk
+    transaction.on_commit(lambda: generate_attachment_thumbnails(attachment_id))
+
+
+@receiver(attachments_reordered, sender=Library)
+def invalidate_catalog_on_reorder(sender, library, **kwargs):
+    """Drop cached catalog responses after a bulk rank update."""
+    touch_library(library.pk)
+    invalidate_library(library.pk)
+
+
+@receiver(m2m_changed, sender=Sale.sold_products.through)
+def refresh_sale_totals(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep Sale.total_amount/item_count in sync when lines are linked via the M2M API.
+
+    SaleSerializer bulk-inserts the through rows and sets the totals itself,
+    so this only runs for ad-hoc ``sale.sold_products.add()``/``remove()`` calls.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        instance.recalculate_totals()
+    elif pk_set:
+        for sale in Sale.objects.filter(pk__in=pk_set):
+            sale.recalculate_totals()
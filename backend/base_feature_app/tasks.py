@@ -0,0 +1,110 @@
+"""
+Huey tasks for base_feature_app (autodiscovered by huey.contrib.djhuey).
+
+Tasks:
+  - purge_expired_idempotency_keys: Hourly cleanup of expired Idempotency-Key rows
+  - apply_sale_to_rollups: Adds a committed sale to the sales rollup tables
+  - rebuild_recent_sales_rollups: Nightly rebuild of the last days of rollups (02:30)
+  - delete_media_files: Removes attachment files/thumbnails after bulk catalog deletes
+  - generate_attachment_thumbnails: Renders every thumbnail alias of a saved attachment
+  - purge_stale_attachment_uploads: Hourly cleanup of abandoned chunked uploads
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from huey import crontab
+from huey.contrib.djhuey import db_periodic_task, db_task
+
+logger = logging.getLogger(__name__)
+
+
+@db_periodic_task(crontab(minute='15'))
+def purge_expired_idempotency_keys():
+    """
+    Delete Idempotency-Key rows past their TTL so the table stays small.
+    """
+    from base_feature_app.services.idempotency import purge_expired_keys
+
+    deleted = purge_expired_keys()
+    if deleted:
+        logger.info('Purged %d expired idempotency key(s).', deleted)
+    return deleted
+
+
+@db_task()
+def apply_sale_to_rollups(sale_id):
+    """
+    Add one committed sale to the daily and per-product rollups.
+    """
+    from base_feature_app.services import sales_rollup
+
+    sales_rollup.apply_sale(sale_id)
+
+
+@db_periodic_task(crontab(hour='2', minute='30'))
+def rebuild_recent_sales_rollups():
+    """
+    Rebuild the rollups of the last SALES_ROLLUP_REBUILD_DAYS days from raw sales.
+
+    Corrects drift from sales written outside create-sale (admin, scripts,
+    deletions) and from retried incremental updates.
+    """
+    from base_feature_app.services import sales_rollup
+
+    end = timezone.localdate()
+    start = end - timedelta(days=getattr(settings, 'SALES_ROLLUP_REBUILD_DAYS', 2) - 1)
+    days = sales_rollup.rebuild(start, end)
+    logger.info('Rebuilt sales rollups for %s..%s (%d day(s) with sales).', start, end, days)
+    return days
+
+
+@db_task()
+def delete_media_files(names):
+    """
+    Delete attachment files, their thumbnails and emptied directories.
+
+    Enqueued on commit by ``MediaOwnerQuerySet.delete`` in batches.
+    """
+    from django_attachments.cleanup import delete_files_batch
+
+    deleted = delete_files_batch(names)
+    logger.info('Deleted %d media file(s) for %d attachment(s).', deleted, len(names))
+    return deleted
+
+
+@db_task()
+def generate_attachment_thumbnails(attachment_id):
+    """
+    Pre-generate the thumbnails of one attachment and mark it ready.
+
+    Enqueued on commit when an image attachment is saved. Catalog responses
+    embedding the library are invalidated so they pick up the new URLs.
+    """
+    from django_attachments.models import Attachment
+    from django_attachments.thumbnails import generate_thumbnails
+
+    from base_feature_app.signals import touch_library
+    from base_feature_app.utils.catalog_cache import invalidate_library
+
+    attachment = Attachment.objects.filter(pk=attachment_id).first()
+    if attachment is None or not generate_thumbnails(attachment):
+        return False
+    touch_library(attachment.library_id)
+    invalidate_library(attachment.library_id)
+    return True
+
+
+@db_periodic_task(crontab(minute='45'))
+def purge_stale_attachment_uploads():
+    """
+    Remove chunked upload sessions (and their partial files) left idle.
+    """
+    from django_attachments.uploads import purge_stale_uploads
+
+    purged = purge_stale_uploads()
+    if purged:
+        logger.info('Purged %d stale attachment upload(s).', purged)
+    return purged
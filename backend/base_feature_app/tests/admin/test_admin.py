@@ -9,11 +9,12 @@
     BlogAdmin,
     ProductAdmin,
     SaleAdmin,
+    StagingPhaseBannerAdmin,
     BaseFeatureUserAdmin,
     BaseFeatureAdminSite,
     admin_site,
 )
-from base_feature_app.models import Blog, Product, Sale, SoldProduct
+from base_feature_app.models import Blog, Product, Sale, SoldProduct, StagingPhaseBanner
 from django_attachments.models import Library
 
 
@@ -45,6 +46,22 @@ def test_blogadmin_delete_queryset_deletes_objects(db):
     assert Blog.objects.count() == 0
 
 
+@pytest.mark.parametrize('action, expected', [('hide_banner', False), ('show_banner', True)])
+def test_staging_banner_admin_bulk_actions_invalidate_cached_singleton(db, action, expected):
+    """Bulk show/hide use queryset.update, so they must drop the cached singleton themselves."""
+    banner = StagingPhaseBanner.get_solo()
+    StagingPhaseBanner.objects.filter(pk=banner.pk).update(is_visible=not expected)
+    StagingPhaseBanner.invalidate_solo_cache()
+    StagingPhaseBanner.get_solo()
+    user = get_user_model().objects.create_superuser(email='banner@example.com', password='pass12345')
+    request = _request_with_messages(user)
+    admin = StagingPhaseBannerAdmin(StagingPhaseBanner, admin_site)
+
+    getattr(admin, action)(request, StagingPhaseBanner.objects.all())
+
+    assert StagingPhaseBanner.get_solo().is_visible is expected
+
+
 def test_productadmin_delete_queryset_deletes_objects(db):
     """Verifies that ProductAdmin.delete_queryset removes all products from the database."""
     request = _staff_request(db)
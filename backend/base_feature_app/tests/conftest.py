@@ -1,8 +1,25 @@
+from unittest.mock import MagicMock
+
 import pytest
+from django.core.cache import cache
 from django_attachments.models import Library
 from rest_framework.test import APIClient
 
 from base_feature_app.models import Blog, Product, User
+from base_feature_app.models.staging_phase_banner import _local_solo
+from base_feature_app.services.google_id_token import _local_jwks
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from responses and counters cached by earlier tests."""
+    cache.clear()
+    _local_solo.clear()
+    _local_jwks.clear()
+    yield
+    cache.clear()
+    _local_solo.clear()
+    _local_jwks.clear()
 
 
 @pytest.fixture
@@ -50,6 +67,13 @@ def admin_client(api_client, admin_user):
     return api_client
 
 
+@pytest.fixture
+def media_root(settings, tmp_path):
+    """Store uploaded files in a per-test temporary MEDIA_ROOT."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
 def library(db):
     """A reusable django_attachments Library instance."""
@@ -79,3 +103,56 @@ def blog(db):
         category='Tech',
         image=lib,
     )
+
+
+@pytest.fixture
+def google_keyset(monkeypatch):
+    """
+    Local stand-in for Google's JWKS endpoint.
+
+    Returns a helper with ``sign(claims, kid=...)`` to mint ID tokens,
+    ``rotate()`` to publish a new key and ``fetches`` counting keyset downloads.
+    """
+    import time
+
+    import jwt
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    class Keyset:
+        def __init__(self):
+            self.keys = {}
+            self.fetches = 0
+            self.max_age = 3600
+            self.rotate('kid-1')
+
+        def rotate(self, kid='kid-2'):
+            self.keys[kid] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+            return kid
+
+        def sign(self, claims=None, kid='kid-1', key=None):
+            now = int(time.time())
+            payload = {
+                'iss': 'https://accounts.google.com',
+                'aud': 'client-id',
+                'iat': now,
+                'exp': now + 600,
+                'email': 'payload@example.com',
+                'given_name': 'Payload',
+                'family_name': 'User',
+                **(claims or {}),
+            }
+            return jwt.encode(payload, key or self.keys[kid], algorithm='RS256', headers={'kid': kid})
+
+        def response(self, *args, **kwargs):
+            self.fetches += 1
+            keys = []
+            for kid, key in self.keys.items():
+                jwk = jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key(), as_dict=True)
+                keys.append({**jwk, 'kid': kid, 'alg': 'RS256', 'use': 'sig'})
+            response = MagicMock(status_code=200, headers={'Cache-Control': f'public, max-age={self.max_age}'})
+            response.json.return_value = {'keys': keys}
+            return response
+
+    keyset = Keyset()
+    monkeypatch.setattr('base_feature_app.services.google_id_token.http_requests.get', keyset.response)
+    return keyset
@@ -1,5 +1,9 @@
+from io import BytesIO
+
 import factory
-from django_attachments.models import Library
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django_attachments.models import Attachment, Library
+from PIL import Image
 
 from base_feature_app.models import Blog, Product, Sale, SoldProduct, User
 
@@ -13,6 +17,27 @@ class Meta:
     title = factory.Sequence(lambda n: f'Library {n}')
 
 
+def jpeg_bytes(size):
+    """Return a blank JPEG of ``size`` (width, height)."""
+    data = BytesIO()
+    Image.new('RGB', size).save(data, 'JPEG')
+    return data.getvalue()
+
+
+class AttachmentFactory(factory.django.DjangoModelFactory):
+    """Factory for attachments stored through the real file field."""
+
+    class Meta:
+        model = Attachment
+
+    class Params:
+        filename = 'upload.txt'
+        data = b'data'
+
+    library = factory.SubFactory(LibraryFactory)
+    file = factory.LazyAttribute(lambda o: SimpleUploadedFile(o.filename, o.data))
+
+
 class UserFactory(factory.django.DjangoModelFactory):
     """Factory for regular (non-staff) users."""
 
@@ -74,6 +99,7 @@ class Meta:
 
     product = factory.SubFactory(ProductFactory)
     quantity = 1
+    unit_price = factory.SelfAttribute('product.price')
 
 
 class SaleFactory(factory.django.DjangoModelFactory):
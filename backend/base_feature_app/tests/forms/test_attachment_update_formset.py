@@ -0,0 +1,25 @@
+import pytest
+from django_attachments.forms import AttachmentUpdateFormSet
+
+from base_feature_app.tests.factories import AttachmentFactory
+
+
+@pytest.mark.django_db
+def test_update_formset_reorders_and_deletes(media_root, library):
+    attachments = AttachmentFactory.create_batch(3, library=library)
+    data = {
+        'form-TOTAL_FORMS': '3',
+        'form-INITIAL_FORMS': '3',
+        'form-0-id': attachments[0].pk, 'form-0-ORDER': '3',
+        'form-1-id': attachments[1].pk, 'form-1-ORDER': '1', 'form-1-DELETE': 'on',
+        'form-2-id': attachments[2].pk, 'form-2-ORDER': '2',
+    }
+    formset = AttachmentUpdateFormSet(data, queryset=library.attachment_set.all())
+
+    assert formset.is_valid()
+    formset.save()
+
+    ranked = list(library.attachment_set.order_by('rank').values_list('pk', 'rank'))
+    assert ranked == [(attachments[2].pk, 0), (attachments[0].pk, 1)]
+    library.refresh_from_db()
+    assert library.primary_attachment_id == attachments[2].pk
@@ -6,10 +6,12 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.core.files.base import ContentFile
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.utils import timezone
 from freezegun import freeze_time
+from PIL import Image
 from django_attachments.models import Attachment, Library
 
 from base_feature_app.management.commands import create_fake_blogs as create_blogs_module
@@ -310,3 +312,89 @@ def test_silk_garbage_collect_reports_zero_when_no_old_records_exist(mock_reques
     mock_request.objects.filter.assert_called_once()
     assert 'Requests to delete: 0' in out.getvalue()
     assert 'Deleted 0 records' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_catalog_cache_stats_command_prints_and_resets_counters(api_client):
+    from base_feature_app.utils.catalog_cache import get_cache_stats
+
+    api_client.get('/api/products/')
+    api_client.get('/api/products/')
+    out = StringIO()
+
+    call_command('catalog_cache_stats', '--reset', stdout=out)
+
+    assert 'Catalog cache hits:   1' in out.getvalue()
+    assert 'Catalog cache misses: 1' in out.getvalue()
+    assert get_cache_stats()['hits'] == 0
+
+
+@pytest.mark.django_db
+def test_rebuild_sales_rollups_command_defaults_to_first_sale_day():
+    from base_feature_app.models import DailySalesRollup
+
+    sale = Sale.objects.create(
+        email='rollup@example.com', address='A', city='C', state='S', postal_code='1',
+        total_amount=10, item_count=1,
+    )
+    out = StringIO()
+
+    call_command('rebuild_sales_rollups', stdout=out)
+
+    assert DailySalesRollup.objects.get(date=timezone.localdate(sale.created_at)).sale_count == 1
+    assert '1 day(s) with sales' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rebuild_sales_rollups_command_rejects_inverted_range():
+    with pytest.raises(CommandError):
+        call_command('rebuild_sales_rollups', '--start', '2026-02-01', '--end', '2026-01-01')
+
+
+@pytest.mark.django_db
+def test_generate_thumbnails_command_backfills_pending_images(settings, tmp_path):
+    from base_feature_app.tests.factories import ProductFactory
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    buffer = io.BytesIO()
+    Image.new('RGB', (300, 300)).save(buffer, format='PNG')
+    attachment = Attachment.objects.create(
+        library=ProductFactory().gallery,
+        file=ContentFile(buffer.getvalue(), name='pending.png'),
+        original_name='pending.png',
+        rank=0,
+    )
+    out = StringIO()
+
+    call_command('generate_thumbnails', '--workers', '1', stdout=out)
+
+    attachment.refresh_from_db()
+    assert attachment.thumbnails_ready is True
+    assert 'Generated thumbnails for 1 of 1' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_generate_thumbnails_command_backfills_missing_renditions(settings, tmp_path):
+    from base_feature_app.tests.factories import ProductFactory
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    buffer = io.BytesIO()
+    Image.new('RGB', (300, 300)).save(buffer, format='PNG')
+    attachment = Attachment.objects.create(
+        library=ProductFactory().gallery,
+        file=ContentFile(buffer.getvalue(), name='ready.png'),
+        original_name='ready.png',
+        rank=0,
+    )
+    Attachment.objects.filter(pk=attachment.pk).update(thumbnails_ready=True)
+
+    call_command('generate_thumbnails', '--workers', '1', stdout=StringIO())
+
+    attachment.refresh_from_db()
+    assert [r['alias'] for r in attachment.renditions] == ['small', 'medium', 'large']
+
+
+@pytest.mark.django_db
+def test_generate_thumbnails_command_rejects_zero_workers():
+    with pytest.raises(CommandError):
+        call_command('generate_thumbnails', '--workers', '0')
@@ -0,0 +1,73 @@
+"""Content-addressed attachment storage (``ATTACHMENTS_DEDUPLICATE``)."""
+from pathlib import Path
+
+import pytest
+from django_attachments.blobs import BLOB_DIRECTORY
+from django_attachments.cleanup import delete_files_batch
+from django_attachments.models import Attachment
+
+from base_feature_app.tests.factories import AttachmentFactory, jpeg_bytes
+
+
+@pytest.fixture
+def deduplicate(settings, media_root):
+    settings.ATTACHMENTS_DEDUPLICATE = True
+    return media_root
+
+
+def _stored_files(media_root):
+    return [path for path in (media_root / BLOB_DIRECTORY).rglob('*') if path.is_file()]
+
+
+@pytest.mark.django_db
+def test_identical_uploads_share_one_blob(deduplicate):
+    data = jpeg_bytes((6, 4))
+    first = AttachmentFactory(filename='logo.jpg', data=data)
+    Attachment.objects.filter(pk=first.pk).update(thumbnails={'small': 'x.jpg'}, thumbnails_ready=True)
+
+    second = AttachmentFactory(filename='logo-copy.JPG', data=data)
+
+    assert first.file.name == second.file.name
+    assert first.file.name.startswith(BLOB_DIRECTORY + '/')
+    assert first.content_hash == second.content_hash
+    assert (second.image_width, second.image_height) == (6, 4)
+    assert second.thumbnails_ready is True
+    assert second.original_name == 'logo-copy.JPG'
+    assert len(_stored_files(deduplicate)) == 1
+
+
+@pytest.mark.django_db
+def test_blob_is_deleted_with_its_last_reference(deduplicate):
+    first = AttachmentFactory(filename='a.txt', data=b'same bytes')
+    second = AttachmentFactory(filename='b.txt', data=b'same bytes')
+    path = first.file.path
+
+    first.delete()
+    assert Path(path).exists()
+    second.delete()
+    assert not Path(path).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_file_delete_keeps_referenced_blobs(deduplicate):
+    kept = AttachmentFactory(filename='a.txt', data=b'shared')
+    removed = AttachmentFactory(filename='b.txt', data=b'shared')
+    orphan = AttachmentFactory(filename='c.txt', data=b'orphan')
+    names = [removed.file.name, orphan.file.name]
+    Attachment.objects.filter(pk__in=[removed.pk, orphan.pk]).delete()
+
+    delete_files_batch(names)
+
+    assert Path(kept.file.path).exists()
+    assert not Path(orphan.file.path).exists()
+
+
+@pytest.mark.django_db
+def test_disabled_keeps_separate_files(media_root, settings):
+    settings.ATTACHMENTS_DEDUPLICATE = False
+
+    first = AttachmentFactory(filename='a.txt', data=b'same')
+    second = AttachmentFactory(filename='b.txt', data=b'same')
+
+    assert first.file.name != second.file.name
+    assert first.content_hash == ''
@@ -0,0 +1,50 @@
+import hashlib
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django_attachments.models import Attachment
+from django_attachments.utils import get_image_size
+from PIL import Image
+
+from base_feature_app.tests.factories import AttachmentFactory, jpeg_bytes
+
+
+class CountingFile(BytesIO):
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def test_get_image_size_reads_the_header_only():
+    # Incompressible pixels, so the PNG is megabytes long.
+    noise = b''.join(hashlib.sha256(i.to_bytes(4, 'big')).digest() for i in range(93750))
+    data = BytesIO()
+    Image.frombytes('RGB', (1000, 1000), noise).save(data, 'PNG')
+    source = CountingFile(data.getvalue())
+
+    assert get_image_size(source) == (1000, 1000)
+    assert source.bytes_read < 64 * 1024
+    assert source.tell() == 0
+
+
+@pytest.mark.django_db
+def test_metadata_is_recomputed_only_when_the_file_changes(media_root):
+    attachment = AttachmentFactory(filename='image.jpg', data=jpeg_bytes((5, 10)))
+    AttachmentFactory(library=attachment.library)
+    attachment = Attachment.objects.get(pk=attachment.pk)
+
+    with patch('django_attachments.models.get_image_size') as probe:
+        attachment.move_to(1)
+        attachment.title = 'Renamed'
+        attachment.save()
+    probe.assert_not_called()
+
+    attachment.file = SimpleUploadedFile('other.jpg', jpeg_bytes((7, 3)))
+    attachment.save()
+    attachment.refresh_from_db()
+    assert (attachment.image_width, attachment.image_height) == (7, 3)
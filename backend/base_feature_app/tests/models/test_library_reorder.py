@@ -0,0 +1,41 @@
+import pytest
+
+from base_feature_app.tests.factories import AttachmentFactory
+
+
+def _ranked(library):
+    return list(library.attachment_set.order_by('rank').values_list('pk', flat=True))
+
+
+@pytest.mark.django_db
+def test_reorder_rewrites_ranks_in_one_update(media_root, library, django_assert_num_queries):
+    attachments = AttachmentFactory.create_batch(4, library=library)
+    ordering = [attachments[2].pk, attachments[0].pk, attachments[3].pk, attachments[1].pk]
+
+    # savepoint, lock, current ranks, CASE update, primary attachment, release
+    with django_assert_num_queries(6):
+        library.reorder(ordering)
+
+    assert _ranked(library) == ordering
+    library.refresh_from_db()
+    assert library.primary_attachment_id == attachments[2].pk
+
+
+@pytest.mark.django_db
+def test_reorder_keeps_unlisted_attachments_after_listed_ones(media_root, library):
+    attachments = AttachmentFactory.create_batch(3, library=library)
+
+    library.reorder([attachments[2].pk])
+
+    assert _ranked(library) == [attachments[2].pk, attachments[0].pk, attachments[1].pk]
+
+
+@pytest.mark.django_db
+def test_reorder_rejects_foreign_attachments(media_root, library):
+    attachments = AttachmentFactory.create_batch(2, library=library)
+    foreign = AttachmentFactory()
+
+    with pytest.raises(ValueError):
+        library.reorder([foreign.pk, attachments[1].pk])
+
+    assert _ranked(library) == [attachments[0].pk, attachments[1].pk]
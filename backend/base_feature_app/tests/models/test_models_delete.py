@@ -1,8 +1,16 @@
+import os
+
 import pytest
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models import ProtectedError
+from django.db.models.signals import post_delete
+from django.test.utils import CaptureQueriesContext
 
-from django_attachments.models import Library
+from django_attachments.models import Attachment, Library
 
 from base_feature_app.models import Blog, Product, Sale, SoldProduct
+from base_feature_app.tests.factories import BlogFactory, ProductFactory, SaleFactory, SoldProductFactory
 
 
 @pytest.mark.django_db
@@ -67,3 +75,141 @@ def test_sale_delete_also_deletes_sold_products(db):
     sale.delete()
 
     assert not SoldProduct.objects.filter(id=sold.id).exists()
+
+
+def _sales_with_lines(count, lines_per_sale=2):
+    sales = SaleFactory.create_batch(count)
+    for sale in sales:
+        sale.sold_products.add(*SoldProductFactory.create_batch(lines_per_sale))
+    return sales
+
+
+@pytest.mark.django_db
+def test_sale_queryset_delete_is_set_based(settings):
+    """Query count depends on the number of chunks, not on the number of sales."""
+    settings.SALE_DELETE_CHUNK_SIZE = 10
+    _sales_with_lines(25)
+
+    with CaptureQueriesContext(connection) as ctx:
+        total, counts = Sale.objects.all().delete()
+
+    deletes = [q for q in ctx.captured_queries if q['sql'].startswith('DELETE')]
+    assert len(deletes) == 3 * 3  # three chunks x (links, sales, sold products)
+    assert counts == {
+        'base_feature_app.Sale_sold_products': 50,
+        'base_feature_app.Sale': 25,
+        'base_feature_app.SoldProduct': 50,
+    }
+    assert total == 125
+    assert not Sale.objects.exists()
+    assert not SoldProduct.objects.exists()
+
+
+@pytest.mark.django_db
+def test_sale_queryset_delete_only_touches_filtered_sales():
+    kept, removed = _sales_with_lines(2)
+
+    Sale.objects.filter(pk=removed.pk).delete()
+
+    assert list(Sale.objects.values_list('pk', flat=True)) == [kept.pk]
+    assert kept.sold_products.count() == 2
+    assert SoldProduct.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_sale_queryset_delete_keeps_line_items_shared_with_other_sales():
+    kept, removed = _sales_with_lines(2, lines_per_sale=1)
+    shared = removed.sold_products.get()
+    kept.sold_products.add(shared)
+
+    Sale.objects.filter(pk=removed.pk).delete()
+
+    assert kept.sold_products.filter(pk=shared.pk).exists()
+    assert SoldProduct.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_sale_queryset_delete_fires_signals_when_receivers_exist():
+    """With a post_delete receiver registered, every instance is deleted individually."""
+    _sales_with_lines(2, lines_per_sale=1)
+    seen = []
+
+    def receiver(sender, instance, **kwargs):
+        seen.append(sender)
+
+    post_delete.connect(receiver, sender=SoldProduct)
+    try:
+        Sale.objects.all().delete()
+    finally:
+        post_delete.disconnect(receiver, sender=SoldProduct)
+
+    assert seen == [SoldProduct, SoldProduct]
+    assert not Sale.objects.exists()
+
+
+def _attach(library, count):
+    attachments = []
+    for rank in range(count):
+        attachment = Attachment.objects.create(
+            library=library, file=ContentFile(b'data', name=f'f{rank}.txt'), original_name=f'f{rank}.txt', rank=rank,
+        )
+        attachments.append(attachment)
+    library.primary_attachment = attachments[0]
+    library.save()
+    return attachments
+
+
+def _product_delete_queries(count, attachments_per_product):
+    for _ in range(count):
+        _attach(ProductFactory().gallery, attachments_per_product)
+    with CaptureQueriesContext(connection) as ctx:
+        Product.objects.all().delete()
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_product_queryset_delete_query_count_ignores_attachment_count(settings, tmp_path):
+    """Deleting products costs the same number of queries however many images they hold."""
+    settings.MEDIA_ROOT = str(tmp_path)
+
+    few = _product_delete_queries(3, 1)
+    many = _product_delete_queries(3, 5)
+
+    assert few == many
+    assert not Attachment.objects.exists()
+    assert not Library.objects.exists()
+
+
+@pytest.mark.django_db
+def test_blog_queryset_delete_removes_files_after_commit(settings, tmp_path, django_capture_on_commit_callbacks):
+    """Files stay on disk until commit, then the background task removes them."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    blog = BlogFactory()
+    paths = [attachment.file.path for attachment in _attach(blog.image, 2)]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        total, counts = Blog.objects.filter(pk=blog.pk).delete()
+        assert all(os.path.exists(path) for path in paths)
+
+    assert counts == {
+        'base_feature_app.Blog': 1,
+        'django_attachments.Attachment': 2,
+        'django_attachments.Library': 1,
+    }
+    assert total == 4
+    assert not any(os.path.exists(path) for path in paths)
+
+
+@pytest.mark.django_db
+def test_product_queryset_delete_respects_protected_sales(settings, tmp_path):
+    """A product referenced by a sale line is protected and nothing is removed."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    product = ProductFactory()
+    _attach(product.gallery, 1)
+    SoldProductFactory(product=product)
+
+    with pytest.raises(ProtectedError):
+        Product.objects.all().delete()
+
+    assert Product.objects.filter(pk=product.pk).exists()
+    assert Attachment.objects.filter(library=product.gallery).count() == 1
@@ -1,7 +1,12 @@
+import importlib
+from decimal import Decimal
+
 import pytest
+from django.apps import apps as django_apps
 from django.db.models.deletion import ProtectedError
 
 from base_feature_app.models import Product, Sale, SoldProduct
+from base_feature_app.tests.factories import ProductFactory, SaleFactory, SoldProductFactory
 from django_attachments.models import Library
 
 
@@ -147,3 +152,50 @@ def test_sold_product_protect_on_product_delete(self):
         
         # SoldProduct should still exist
         assert SoldProduct.objects.filter(id=sold_product.id).exists()
+
+
+@pytest.mark.django_db
+def test_sold_product_captures_price_at_sale_time():
+    """unit_price defaults to the product price and ignores later price changes."""
+    product = ProductFactory(price=Decimal('12.50'))
+    sold = SoldProduct.objects.create(product=product, quantity=2)
+
+    product.price = Decimal('99.00')
+    product.save()
+    sold.refresh_from_db()
+
+    assert sold.unit_price == Decimal('12.50')
+
+
+@pytest.mark.django_db
+def test_sale_totals_follow_m2m_add_and_remove():
+    """Lines linked through the M2M API keep total_amount/item_count current."""
+    sale = SaleFactory()
+    first = SoldProductFactory(product=ProductFactory(price=Decimal('10.00')), quantity=3)
+    second = SoldProductFactory(product=ProductFactory(price=Decimal('2.50')), quantity=2)
+
+    sale.sold_products.add(first, second)
+    sale.refresh_from_db()
+    assert (sale.total_amount, sale.item_count) == (Decimal('35.00'), 2)
+
+    sale.sold_products.remove(first)
+    sale.refresh_from_db()
+    assert (sale.total_amount, sale.item_count) == (Decimal('5.00'), 1)
+
+
+@pytest.mark.django_db
+def test_backfill_migration_fills_prices_and_totals(monkeypatch):
+    """The 0009 data migration backfills in batches from current product prices."""
+    migration = importlib.import_module('base_feature_app.migrations.0009_sale_totals')
+    monkeypatch.setattr(migration, 'BATCH_SIZE', 1)
+    sales = SaleFactory.create_batch(2)
+    for sale in sales:
+        line = SoldProductFactory(product=ProductFactory(price=Decimal('4.00')), quantity=2)
+        sale.sold_products.add(line)
+    SoldProduct.objects.update(unit_price=0)
+    Sale.objects.update(total_amount=0, item_count=0)
+
+    migration.backfill_sale_totals(django_apps, None)
+
+    assert set(SoldProduct.objects.values_list('unit_price', flat=True)) == {Decimal('4.00')}
+    assert set(Sale.objects.values_list('total_amount', 'item_count')) == {(Decimal('8.00'), 1)}
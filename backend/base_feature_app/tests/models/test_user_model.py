@@ -86,3 +86,19 @@ def test_admin_user_role(self):
         )
         assert admin.role == User.Role.ADMIN
         assert admin.is_staff is True
+
+    def test_access_changes_bump_token_version(self):
+        user = User.objects.create_user(email='version@example.com', password='pass1234')
+        user = User.objects.get(pk=user.pk)
+
+        user.first_name = 'Renamed'
+        user.save()
+        assert user.token_version == 0
+
+        user.role = User.Role.ADMIN
+        user.save()
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+
+        user.refresh_from_db()
+        assert user.token_version == 2
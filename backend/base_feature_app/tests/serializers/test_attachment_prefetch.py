@@ -0,0 +1,110 @@
+"""Query-count guards for the batched attachment resolution in list serializers."""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_attachments.models import Attachment
+from rest_framework.test import APIRequestFactory
+
+from base_feature_app.models import Product, Sale
+from base_feature_app.serializers.blog import BlogSerializer
+from base_feature_app.serializers.product import ProductSerializer
+from base_feature_app.serializers.sale_detail import SaleDetailSerializer
+from base_feature_app.tests.factories import (
+    AttachmentFactory,
+    BlogFactory,
+    ProductFactory,
+    SaleFactory,
+    SoldProductFactory,
+    jpeg_bytes,
+)
+
+
+def _with_attachments(library, count=2):
+    AttachmentFactory.create_batch(count, library=library, filename='img.jpg', data=jpeg_bytes((4, 4)))
+
+
+def _count_queries(func):
+    with CaptureQueriesContext(connection) as ctx:
+        func()
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_list_products_query_count_is_constant(api_client, media_root):
+    """list_products resolves every gallery in a fixed number of queries."""
+    for _ in range(2):
+        _with_attachments(ProductFactory().gallery)
+    url = reverse('list-products')
+    small = _count_queries(lambda: api_client.get(url))
+
+    for _ in range(5):
+        _with_attachments(ProductFactory().gallery)
+    large = _count_queries(lambda: api_client.get(url))
+
+    assert large == small
+
+
+@pytest.mark.django_db
+def test_list_blogs_query_count_is_constant(api_client, media_root):
+    """list_blogs resolves every image library in a fixed number of queries."""
+    for _ in range(2):
+        _with_attachments(BlogFactory().image, count=1)
+    url = reverse('list-blogs')
+    small = _count_queries(lambda: api_client.get(url))
+
+    for _ in range(5):
+        _with_attachments(BlogFactory().image, count=1)
+    large = _count_queries(lambda: api_client.get(url))
+
+    assert large == small
+
+
+@pytest.mark.django_db
+def test_product_serializer_many_uses_three_queries(media_root):
+    """Products, their galleries and all attachments are loaded in three queries."""
+    for _ in range(4):
+        _with_attachments(ProductFactory().gallery)
+    request = APIRequestFactory().get('/api/products/')
+
+    with CaptureQueriesContext(connection) as ctx:
+        data = ProductSerializer(Product.objects.all(), many=True, context={'request': request}).data
+
+    assert len(ctx.captured_queries) == 3
+    assert all(len(item['gallery_urls']) == 2 for item in data)
+
+
+@pytest.mark.django_db
+def test_blog_serializer_many_returns_lowest_rank_image(media_root):
+    """Batched blog image lookup keeps the rank ordering of the single-row path."""
+    blog = BlogFactory()
+    AttachmentFactory(library=blog.image, filename='second.jpg', data=jpeg_bytes((4, 4)), rank=0)
+    AttachmentFactory(library=blog.image, filename='first.jpg', data=jpeg_bytes((4, 4)), rank=0)
+    request = APIRequestFactory().get('/api/blogs/')
+
+    data = BlogSerializer([blog], many=True, context={'request': request}).data
+
+    first = Attachment.objects.get(library=blog.image, rank=0)
+    assert data[0]['image_url'].endswith(first.file.url)
+
+
+@pytest.mark.django_db
+def test_sale_detail_nested_products_query_count_is_constant(media_root):
+    """Nested ProductSerializer inside SoldProductSerializer is batched per sale."""
+    request = APIRequestFactory().get('/api/sales/1/')
+
+    def build_sale(lines):
+        sale = SaleFactory()
+        for _ in range(lines):
+            sold = SoldProductFactory()
+            _with_attachments(sold.product.gallery)
+            sale.sold_products.add(sold)
+        return Sale.objects.get(pk=sale.pk)
+
+    small_sale = build_sale(1)
+    large_sale = build_sale(6)
+
+    small = _count_queries(lambda: SaleDetailSerializer(small_sale, context={'request': request}).data)
+    large = _count_queries(lambda: SaleDetailSerializer(large_sale, context={'request': request}).data)
+
+    assert large == small
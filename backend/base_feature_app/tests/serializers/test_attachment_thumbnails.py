@@ -0,0 +1,158 @@
+"""Background thumbnail pre-generation and responsive image payloads built without touching files."""
+import io
+import os
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django_attachments.models import Attachment
+from django_attachments.thumbnails import generate_thumbnails, get_thumbnail_options
+from easy_thumbnails.files import Thumbnailer
+from PIL import Image
+from rest_framework.test import APIRequestFactory
+
+from base_feature_app.models import Product
+from base_feature_app.serializers.blog import BlogSerializer
+from base_feature_app.serializers.product import ProductSerializer
+from base_feature_app.serializers.product_list import ProductListSerializer
+from base_feature_app.tests.factories import BlogFactory, ProductFactory
+
+
+def _image_file(name='img.png'):
+    image = Image.new('RGB', (600, 400), color=(10, 120, 200))
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return ContentFile(buffer.getvalue(), name=name)
+
+
+def _attach(library, name='img.png'):
+    return Attachment.objects.create(library=library, file=_image_file(name), original_name=name, rank=0)
+
+
+@pytest.mark.django_db
+def test_saving_an_image_enqueues_thumbnail_generation(media_root, django_capture_on_commit_callbacks):
+    """On commit every alias is rendered and the attachment is marked ready."""
+    product = ProductFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        attachment = _attach(product.gallery)
+
+    attachment.refresh_from_db()
+    assert attachment.thumbnails_ready is True
+    assert set(attachment.thumbnails) == set(get_thumbnail_options())
+    for name in attachment.thumbnails.values():
+        assert os.path.exists(os.path.join(media_root, name))
+
+
+@pytest.mark.django_db
+def test_non_image_attachments_are_not_queued(media_root, monkeypatch, django_capture_on_commit_callbacks):
+    task = MagicMock()
+    monkeypatch.setattr('base_feature_app.tasks.generate_attachment_thumbnails', task)
+    product = ProductFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Attachment.objects.create(
+            library=product.gallery, file=ContentFile(b'data', name='notes.txt'), original_name='notes.txt', rank=0,
+        )
+
+    task.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_serializers_return_responsive_images_without_touching_files(media_root, monkeypatch):
+    """Ready attachments expose cached renditions as a srcset; pending ones list only the original."""
+    product = ProductFactory()
+    blog = BlogFactory()
+    ready = _attach(product.gallery)
+    generate_thumbnails(ready)
+    pending = _attach(blog.image)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('file touched during serialization')
+
+    monkeypatch.setattr(Thumbnailer, 'get_thumbnail', fail)
+    monkeypatch.setattr(FileSystemStorage, 'exists', fail)
+    monkeypatch.setattr(FileSystemStorage, 'size', fail)
+    request = APIRequestFactory().get('/')
+    product_data = ProductSerializer(product, context={'request': request}).data
+    blog_data = BlogSerializer(blog, context={'request': request}).data
+
+    def url(name):
+        return request.build_absolute_uri(f'/media/{name}')
+
+    image = product_data['gallery_responsive'][0]
+    assert (image['url'], image['width'], image['height']) == (url(ready.file.name), 600, 400)
+    assert [(r['alias'], r['width'], r['height']) for r in image['renditions']] == [
+        ('small', 50, 50), ('medium', 200, 200), ('large', 500, 333),
+    ]
+    assert image['srcset'] == ', '.join([
+        f"{url(ready.thumbnails['small'])} 50w",
+        f"{url(ready.thumbnails['medium'])} 200w",
+        f"{url(ready.thumbnails['large'])} 500w",
+        f'{url(ready.file.name)} 600w',
+    ])
+    assert blog_data['image_responsive'] == {
+        'url': url(pending.file.name),
+        'width': 600,
+        'height': 400,
+        'renditions': [],
+        'srcset': f'{url(pending.file.name)} 600w',
+    }
+
+
+@pytest.mark.django_db
+def test_serializers_return_thumbnail_urls_next_to_responsive_images(media_root):
+    """Ready attachments resolve alias URLs from stored names; pending ones return nothing."""
+    product = ProductFactory()
+    blog = BlogFactory()
+    ready = _attach(product.gallery)
+    generate_thumbnails(ready)
+    _attach(blog.image)
+    request = APIRequestFactory().get('/')
+
+    product_data = ProductSerializer(product, context={'request': request}).data
+    blog_data = BlogSerializer(blog, context={'request': request}).data
+
+    assert product_data['gallery_thumbnails'] == [
+        {key: request.build_absolute_uri(f'/media/{name}') for key, name in ready.thumbnails.items()}
+    ]
+    assert blog_data['image_thumbnails'] == {}
+
+
+@pytest.mark.django_db
+def test_list_serializers_include_responsive_images(media_root):
+    product = ProductFactory()
+    generate_thumbnails(_attach(product.gallery))
+
+    data = ProductListSerializer(
+        Product.objects.filter(pk=product.pk), many=True, context={'request': APIRequestFactory().get('/')}
+    ).data
+
+    assert [r['alias'] for r in data[0]['gallery_responsive'][0]['renditions']] == ['small', 'medium', 'large']
+
+
+@pytest.mark.django_db
+def test_replacing_the_file_resets_readiness(media_root):
+    attachment = _attach(ProductFactory().gallery)
+    generate_thumbnails(attachment)
+
+    attachment.file = _image_file('other.png')
+    attachment.save()
+
+    attachment.refresh_from_db()
+    assert attachment.thumbnails_ready is False
+    assert attachment.thumbnails == {}
+
+
+@pytest.mark.django_db
+def test_generate_thumbnails_skips_a_file_replaced_meanwhile(media_root):
+    """A stale task does not mark the new file as ready."""
+    attachment = _attach(ProductFactory().gallery)
+    stale = Attachment.objects.get(pk=attachment.pk)
+    attachment.file = _image_file('other.png')
+    attachment.save()
+
+    assert generate_thumbnails(stale) is False
+    attachment.refresh_from_db()
+    assert attachment.thumbnails_ready is False
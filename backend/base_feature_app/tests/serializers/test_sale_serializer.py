@@ -1,12 +1,36 @@
+from decimal import Decimal
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from base_feature_app.models import Product, Sale
+from base_feature_app.models import Product, Sale, SoldProduct
 from base_feature_app.serializers.sale import SaleSerializer
 from base_feature_app.serializers.sale_list import SaleListSerializer
 from base_feature_app.serializers.sale_detail import SaleDetailSerializer
+from base_feature_app.tests.factories import ProductFactory
 from django_attachments.models import Library
 
 
+def _sale_payload(products):
+    return {
+        'email': 'bench@example.com',
+        'address': 'Address',
+        'city': 'City',
+        'state': 'State',
+        'postal_code': '12345',
+        'sold_products': [{'product_id': p.id, 'quantity': 1} for p in products],
+    }
+
+
+def _queries_to_create_sale(products):
+    with CaptureQueriesContext(connection) as ctx:
+        serializer = SaleSerializer(data=_sale_payload(products))
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+    return len(ctx.captured_queries)
+
+
 @pytest.mark.django_db
 class TestSaleSerializer:
     def test_sale_serializer_creates_sold_products(self):
@@ -77,7 +101,7 @@ def test_sale_serializer_multiple_products(self):
         assert sale.sold_products.count() == 2
 
     def test_sale_serializer_invalid_product_id(self):
-        """Test that invalid product_id raises an error during save"""
+        """Unknown product ids are rejected at validation time, before anything is written."""
         payload = {
             'email': 'test@example.com',
             'address': 'Address',
@@ -88,11 +112,43 @@ def test_sale_serializer_invalid_product_id(self):
         }
 
         serializer = SaleSerializer(data=payload)
-        assert serializer.is_valid()  # Validation passes, but save will fail
-        
-        # Should raise DoesNotExist when trying to get non-existent product
-        with pytest.raises(Product.DoesNotExist):
-            serializer.save()
+
+        assert not serializer.is_valid()
+        assert 'sold_products' in serializer.errors
+        assert Sale.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_sale_serializer_query_count_does_not_scale_with_cart_size():
+    """Benchmark: a 30-item cart costs the same number of queries as a 1-item cart."""
+    if not connection.features.can_return_rows_from_bulk_insert:
+        pytest.skip('Backend inserts sold products one by one.')
+    products = ProductFactory.create_batch(30)
+
+    single = _queries_to_create_sale(products[:1])
+    full_cart = _queries_to_create_sale(products)
+
+    assert full_cart == single
+    assert Sale.objects.get(email='bench@example.com', sold_products__product=products[-1])
+
+
+@pytest.mark.django_db
+def test_sale_serializer_rolls_back_when_link_insert_fails(monkeypatch):
+    """A failure after the sale row is written leaves no partial sale behind."""
+    product = ProductFactory()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('boom')
+
+    monkeypatch.setattr(Sale.sold_products.through.objects, 'bulk_create', fail)
+    serializer = SaleSerializer(data=_sale_payload([product]))
+    assert serializer.is_valid(), serializer.errors
+
+    with pytest.raises(RuntimeError):
+        serializer.save()
+
+    assert Sale.objects.count() == 0
+    assert SoldProduct.objects.count() == 0
 
 
 @pytest.mark.django_db
@@ -157,3 +213,21 @@ def test_sale_detail_serializer_includes_sold_products(self):
         assert data['email'] == 'detail@example.com'
         assert len(data['sold_products']) == 1
         assert data['sold_products'][0]['quantity'] == 5
+
+
+@pytest.mark.django_db
+def test_sale_serializer_stores_line_prices_and_totals():
+    """Creation captures unit prices and the denormalized order totals."""
+    cheap = ProductFactory(price=Decimal('5.00'))
+    dear = ProductFactory(price=Decimal('20.00'))
+    payload = _sale_payload([cheap, dear])
+    payload['sold_products'][1]['quantity'] = 3
+
+    serializer = SaleSerializer(data=payload)
+    assert serializer.is_valid(), serializer.errors
+    sale = serializer.save()
+
+    assert sale.total_amount == Decimal('65.00')
+    assert sale.item_count == 2
+    assert sorted(sale.sold_products.values_list('unit_price', flat=True)) == [Decimal('5.00'), Decimal('20.00')]
+    assert SaleListSerializer(sale).data['total_amount'] == '65.00'
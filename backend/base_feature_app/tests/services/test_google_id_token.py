@@ -0,0 +1,84 @@
+import time
+
+import pytest
+from django.core.cache import cache
+
+from base_feature_app.services.google_id_token import (
+    JWKS_CACHE_KEY,
+    _local_jwks,
+    verify_google_id_token,
+)
+
+
+def test_verify_returns_claims_and_checks_audience(google_keyset):
+    claims = verify_google_id_token(google_keyset.sign(), audience='client-id')
+
+    assert claims['email'] == 'payload@example.com'
+    with pytest.raises(ValueError):
+        verify_google_id_token(google_keyset.sign({'aud': 'other'}), audience='client-id')
+
+
+def test_verify_without_audience_skips_aud_check(google_keyset):
+    claims = verify_google_id_token(google_keyset.sign({'aud': 'other'}))
+
+    assert claims['aud'] == 'other'
+
+
+def test_keyset_is_fetched_once_and_reused(google_keyset):
+    verify_google_id_token(google_keyset.sign())
+    verify_google_id_token(google_keyset.sign())
+
+    assert google_keyset.fetches == 1
+
+
+def test_shared_cache_serves_other_processes(google_keyset):
+    verify_google_id_token(google_keyset.sign())
+    _local_jwks.clear()
+
+    verify_google_id_token(google_keyset.sign())
+
+    assert google_keyset.fetches == 1
+
+
+def test_zero_max_age_is_not_cached(google_keyset):
+    google_keyset.max_age = 0
+
+    verify_google_id_token(google_keyset.sign())
+    verify_google_id_token(google_keyset.sign())
+
+    assert cache.get(JWKS_CACHE_KEY) is None
+    assert google_keyset.fetches == 2
+
+
+def test_unknown_kid_refreshes_the_keyset_once(google_keyset, settings):
+    settings.GOOGLE_JWKS_MIN_REFRESH_INTERVAL = 0
+    verify_google_id_token(google_keyset.sign())
+    kid = google_keyset.rotate()
+
+    verify_google_id_token(google_keyset.sign(kid=kid))
+    verify_google_id_token(google_keyset.sign(kid=kid))
+
+    assert google_keyset.fetches == 2
+
+
+def test_unknown_kid_refresh_is_rate_limited(google_keyset, settings):
+    settings.GOOGLE_JWKS_MIN_REFRESH_INTERVAL = 60
+    verify_google_id_token(google_keyset.sign())
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            verify_google_id_token(google_keyset.sign(kid='unknown', key=google_keyset.keys['kid-1']))
+
+    assert google_keyset.fetches == 1
+
+
+def test_expired_or_forged_tokens_are_rejected(google_keyset):
+    past = int(time.time()) - 3600
+    forged_key = google_keyset.keys[google_keyset.rotate('forger')]
+
+    with pytest.raises(ValueError):
+        verify_google_id_token(google_keyset.sign({'iat': past - 600, 'exp': past}))
+    with pytest.raises(ValueError):
+        verify_google_id_token(google_keyset.sign(key=forged_key))
+    with pytest.raises(ValueError):
+        verify_google_id_token(google_keyset.sign({'iss': 'https://evil.example.com'}))
@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from base_feature_app.models import IdempotencyKey
+from base_feature_app.services import idempotency
+from base_feature_app.services.idempotency import hash_payload, idempotent_response, purge_expired_keys
+
+
+@pytest.mark.django_db
+def test_idempotent_response_replays_row_committed_by_concurrent_request(monkeypatch):
+    """Losing the insert race replays the winner's stored response."""
+    payload = {'a': 1}
+    calls = []
+
+    def fake_live_record(scope, key):
+        calls.append(key)
+        if len(calls) == 1:
+            # First lookup misses; the concurrent winner commits right after.
+            IdempotencyKey.objects.create(
+                scope=scope,
+                key=key,
+                request_hash=hash_payload(payload),
+                response_status=201,
+                response_body={'id': 7},
+                expires_at=timezone.now() + timedelta(hours=1),
+            )
+            return None
+        return IdempotencyKey.objects.get(scope=scope, key=key)
+
+    monkeypatch.setattr(idempotency, '_live_record', fake_live_record)
+
+    def handler():
+        raise AssertionError('handler must not run for a duplicate')
+
+    response = idempotent_response('test', 'race', payload, handler)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data == {'id': 7}
+
+
+@pytest.mark.django_db
+def test_expired_key_runs_handler_again():
+    """Keys past their TTL are treated as unused."""
+    IdempotencyKey.objects.create(
+        scope='test',
+        key='old',
+        request_hash=hash_payload({}),
+        response_status=201,
+        response_body={'id': 1},
+        expires_at=timezone.now() - timedelta(seconds=1),
+    )
+
+    response = idempotent_response('test', 'old', {}, lambda: Response({'id': 2}, status=201))
+
+    assert response.data == {'id': 2}
+    assert IdempotencyKey.objects.get(key='old').response_body == {'id': 2}
+
+
+@pytest.mark.django_db
+def test_purge_expired_keys_keeps_live_rows():
+    now = timezone.now()
+    IdempotencyKey.objects.create(scope='test', key='live', request_hash='x', expires_at=now + timedelta(hours=1))
+    IdempotencyKey.objects.create(scope='test', key='dead', request_hash='x', expires_at=now - timedelta(hours=1))
+
+    assert purge_expired_keys() == 1
+    assert list(IdempotencyKey.objects.values_list('key', flat=True)) == ['live']
+
+
+def test_hash_payload_ignores_key_order():
+    assert hash_payload({'a': 1, 'b': [1, 2]}) == hash_payload({'b': [1, 2], 'a': 1})
@@ -0,0 +1,71 @@
+import pytest
+from django.contrib.auth.hashers import check_password, make_password
+
+from base_feature_app.models import User
+from base_feature_app.services import passwords
+from base_feature_app.services.auth_service import authenticate_user, register_user
+from base_feature_app.services.passwords import hash_password, shutdown_pool, verify_password
+
+
+@pytest.fixture
+def password_pool(settings):
+    settings.PASSWORD_HASH_WORKERS = 1
+    yield
+    shutdown_pool()
+
+
+def test_verify_password_reports_outdated_hashers():
+    assert verify_password('pass12345', make_password('pass12345')) == (True, False)
+    assert verify_password('pass12345', make_password('pass12345', hasher='pbkdf2_sha1')) == (True, True)
+    assert verify_password('wrong', make_password('pass12345')) == (False, False)
+
+
+def test_inline_hashing_uses_no_pool(settings):
+    settings.PASSWORD_HASH_WORKERS = 0
+
+    assert check_password('pass12345', hash_password('pass12345'))
+    assert passwords._pool is None
+
+
+def test_hashing_runs_in_the_worker_pool(password_pool):
+    encoded = hash_password('pass12345')
+
+    assert passwords._pool is not None
+    assert verify_password('pass12345', encoded) == (True, False)
+
+
+@pytest.mark.django_db
+def test_authenticate_user_uses_a_single_query(user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert authenticate_user('user@example.com', 'pass12345') == user
+
+
+@pytest.mark.django_db
+def test_authenticate_user_rehashes_outdated_hashes(user):
+    User.objects.filter(pk=user.pk).update(password=make_password('pass12345', hasher='pbkdf2_sha1'))
+
+    assert authenticate_user('user@example.com', 'pass12345') == user
+
+    user.refresh_from_db()
+    assert user.password.startswith('pbkdf2_sha256$')
+    assert user.check_password('pass12345')
+
+
+@pytest.mark.django_db
+def test_authenticate_user_keeps_hash_on_wrong_password(user):
+    outdated = make_password('pass12345', hasher='pbkdf2_sha1')
+    User.objects.filter(pk=user.pk).update(password=outdated)
+
+    assert authenticate_user('user@example.com', 'wrong-pass') is None
+
+    user.refresh_from_db()
+    assert user.password == outdated
+
+
+@pytest.mark.django_db
+def test_register_and_authenticate_through_the_pool(password_pool):
+    user = register_user(email='pooled@example.com', password='pass12345')
+
+    assert user.check_password('pass12345')
+    assert authenticate_user('pooled@example.com', 'pass12345') == user
+    assert authenticate_user('missing@example.com', 'pass12345') is None
@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from base_feature_app.services import recaptcha
+from base_feature_app.services.recaptcha import averify_recaptcha, get_session, verify_recaptcha
+
+
+def _response(success=True):
+    response = MagicMock()
+    response.json.return_value = {'success': success}
+    return response
+
+
+@pytest.fixture
+def recaptcha_settings(settings):
+    settings.RECAPTCHA_SECRET_KEY = 'secret'
+    settings.RECAPTCHA_BREAKER_THRESHOLD = 2
+    settings.RECAPTCHA_FAIL_OPEN = False
+    return settings
+
+
+def test_session_is_shared_and_pooled(monkeypatch, settings):
+    monkeypatch.setattr(recaptcha, '_session', None)
+    settings.RECAPTCHA_POOL_SIZE = 4
+
+    session = get_session()
+
+    assert get_session() is session
+    assert session.get_adapter('https://www.google.com')._pool_maxsize == 4
+
+
+def test_verdicts_are_cached_per_token(recaptcha_settings):
+    with patch.object(get_session(), 'post', return_value=_response(True)) as mock_post:
+        assert verify_recaptcha('token') is True
+        assert verify_recaptcha('token') is True
+        assert verify_recaptcha('other') is True
+
+    assert mock_post.call_count == 2
+
+
+def test_cached_pass_is_single_use(recaptcha_settings):
+    """A solved captcha covers one double-submit, then Google decides again."""
+    with patch.object(get_session(), 'post', return_value=_response(True)):
+        assert verify_recaptcha('token') is True
+    with patch.object(get_session(), 'post', return_value=_response(False)) as mock_post:
+        assert verify_recaptcha('token') is True
+        assert verify_recaptcha('token') is False
+        assert verify_recaptcha('token') is False
+
+    mock_post.assert_called_once()
+
+
+def test_negative_verdicts_are_cached(recaptcha_settings):
+    with patch.object(get_session(), 'post', return_value=_response(False)) as mock_post:
+        assert verify_recaptcha('token') is False
+        assert verify_recaptcha('token') is False
+
+    mock_post.assert_called_once()
+
+
+def test_breaker_opens_after_consecutive_errors(recaptcha_settings):
+    with patch.object(get_session(), 'post', side_effect=requests.Timeout) as mock_post:
+        assert verify_recaptcha('a') is False
+        assert verify_recaptcha('b') is False
+        assert verify_recaptcha('c') is False
+
+    assert mock_post.call_count == 2
+
+
+def test_open_breaker_applies_fail_open_policy(recaptcha_settings):
+    recaptcha_settings.RECAPTCHA_FAIL_OPEN = True
+    with patch.object(get_session(), 'post', side_effect=requests.ConnectionError):
+        assert verify_recaptcha('a') is True
+        assert verify_recaptcha('b') is True
+
+    with patch.object(get_session(), 'post') as mock_post:
+        assert verify_recaptcha('c') is True
+    mock_post.assert_not_called()
+
+
+def test_outage_verdicts_are_not_cached(recaptcha_settings):
+    recaptcha_settings.RECAPTCHA_BREAKER_THRESHOLD = 5
+    with patch.object(get_session(), 'post', side_effect=requests.Timeout):
+        assert verify_recaptcha('token') is False
+
+    with patch.object(get_session(), 'post', return_value=_response(True)):
+        assert verify_recaptcha('token') is True
+
+
+def test_success_resets_the_failure_count(recaptcha_settings):
+    with patch.object(get_session(), 'post', side_effect=requests.Timeout):
+        verify_recaptcha('a')
+    with patch.object(get_session(), 'post', return_value=_response(True)):
+        verify_recaptcha('b')
+    with patch.object(get_session(), 'post', side_effect=requests.Timeout):
+        verify_recaptcha('c')
+
+    with patch.object(get_session(), 'post', return_value=_response(True)) as mock_post:
+        assert verify_recaptcha('d') is True
+    mock_post.assert_called_once()
+
+
+def test_invalid_provider_response_counts_as_error(recaptcha_settings):
+    response = MagicMock()
+    response.json.side_effect = ValueError
+    with patch.object(get_session(), 'post', return_value=response):
+        assert verify_recaptcha('token') is False
+
+
+def test_async_variant(recaptcha_settings):
+    with patch.object(get_session(), 'post', return_value=_response(True)) as mock_post:
+        assert asyncio.run(averify_recaptcha('token')) is True
+
+    mock_post.assert_called_once()
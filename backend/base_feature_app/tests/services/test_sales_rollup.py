@@ -0,0 +1,115 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+
+from base_feature_app.models import DailySalesRollup, ProductSalesRollup, Sale
+from base_feature_app.serializers.sale import SaleSerializer
+from base_feature_app.services import sales_rollup
+from base_feature_app.tests.factories import ProductFactory
+
+
+def _create_sale(lines, capture):
+    payload = {
+        'email': 'rollup@example.com',
+        'address': 'Address',
+        'city': 'City',
+        'state': 'State',
+        'postal_code': '12345',
+        'sold_products': [{'product_id': p.id, 'quantity': q} for p, q in lines],
+    }
+    serializer = SaleSerializer(data=payload)
+    assert serializer.is_valid(), serializer.errors
+    with capture(execute=True):
+        return serializer.save()
+
+
+@pytest.mark.django_db
+def test_create_sale_updates_rollups_on_commit(django_capture_on_commit_callbacks):
+    """Committed sales are added to the daily and per-product rows."""
+    lamp = ProductFactory(price=Decimal('10.00'), category='Home')
+    mug = ProductFactory(price=Decimal('4.00'), category='Kitchen')
+
+    _create_sale([(lamp, 2), (mug, 1)], django_capture_on_commit_callbacks)
+    _create_sale([(lamp, 1)], django_capture_on_commit_callbacks)
+
+    daily = DailySalesRollup.objects.get(date=timezone.localdate())
+    assert (daily.sale_count, daily.item_count, daily.units, daily.revenue) == (2, 3, 4, Decimal('34.00'))
+    lamp_row = ProductSalesRollup.objects.get(product=lamp)
+    assert (lamp_row.units, lamp_row.revenue, lamp_row.category) == (3, Decimal('30.00'), 'Home')
+
+
+@pytest.mark.django_db
+def test_rebuild_matches_incremental_rollups(django_capture_on_commit_callbacks):
+    """A rebuild from raw sales reproduces what the incremental path wrote."""
+    lamp = ProductFactory(price=Decimal('10.00'), category='Home')
+    mug = ProductFactory(price=Decimal('4.00'), category='Kitchen')
+    _create_sale([(lamp, 2), (mug, 3)], django_capture_on_commit_callbacks)
+    _create_sale([(mug, 1)], django_capture_on_commit_callbacks)
+    incremental = list(DailySalesRollup.objects.values('date', 'sale_count', 'item_count', 'units', 'revenue'))
+    per_product = sorted(ProductSalesRollup.objects.values_list('product_id', 'units', 'revenue'))
+
+    today = timezone.localdate()
+    sales_rollup.rebuild(today - timedelta(days=1), today)
+
+    assert list(DailySalesRollup.objects.values('date', 'sale_count', 'item_count', 'units', 'revenue')) == incremental
+    assert sorted(ProductSalesRollup.objects.values_list('product_id', 'units', 'revenue')) == per_product
+
+
+@pytest.mark.django_db
+def test_rebuild_drops_rows_for_days_without_sales():
+    """Stale rows inside the rebuilt range are removed."""
+    day = timezone.localdate() - timedelta(days=3)
+    DailySalesRollup.objects.create(date=day, sale_count=5, revenue=Decimal('50.00'))
+
+    sales_rollup.rebuild(day, day)
+
+    assert not DailySalesRollup.objects.filter(date=day).exists()
+
+
+@pytest.mark.django_db
+def test_deleting_sales_rebuilds_their_days_on_commit(django_capture_on_commit_callbacks):
+    """Days older than the nightly rebuild window are corrected too."""
+    lamp = ProductFactory(price=Decimal('10.00'), category='Home')
+    old = _create_sale([(lamp, 2)], django_capture_on_commit_callbacks)
+    kept = _create_sale([(lamp, 1)], django_capture_on_commit_callbacks)
+    old_day = timezone.localdate() - timedelta(days=30)
+    Sale.objects.filter(pk=old.pk).update(created_at=old.created_at - timedelta(days=30))
+    sales_rollup.rebuild(old_day, timezone.localdate())
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Sale.objects.filter(pk=old.pk).delete()
+
+    assert not DailySalesRollup.objects.filter(date=old_day).exists()
+    assert not ProductSalesRollup.objects.filter(date=old_day).exists()
+    today = DailySalesRollup.objects.get(date=timezone.localdate())
+    assert (today.sale_count, today.revenue) == (1, kept.total_amount)
+
+
+def test_rebuild_days_merges_consecutive_days(monkeypatch):
+    calls = []
+    monkeypatch.setattr(sales_rollup, 'rebuild', lambda start, end: calls.append((start, end)) or 1)
+    day = timezone.localdate()
+
+    written = sales_rollup.rebuild_days([day, day - timedelta(days=1), day - timedelta(days=5), day])
+
+    assert calls == [(day - timedelta(days=5), day - timedelta(days=5)), (day - timedelta(days=1), day)]
+    assert written == 2
+
+
+@pytest.mark.django_db
+def test_get_stats_ranks_products_and_categories():
+    today = timezone.localdate()
+    lamp = ProductFactory(title='Lamp')
+    mug = ProductFactory(title='Mug')
+    DailySalesRollup.objects.create(date=today, sale_count=2, item_count=2, units=5, revenue=Decimal('40.00'))
+    ProductSalesRollup.objects.create(date=today, product=lamp, category='Home', units=1, revenue=Decimal('30.00'))
+    ProductSalesRollup.objects.create(date=today, product=mug, category='Kitchen', units=4, revenue=Decimal('10.00'))
+
+    stats = sales_rollup.get_stats(today, today)
+
+    assert stats['totals']['revenue'] == Decimal('40.00')
+    assert [row['title'] for row in stats['top_products']] == ['Lamp', 'Mug']
+    assert [row['category'] for row in stats['top_categories']] == ['Home', 'Kitchen']
+    assert Sale.objects.count() == 0
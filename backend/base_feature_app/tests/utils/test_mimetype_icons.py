@@ -0,0 +1,37 @@
+from unittest.mock import patch
+
+import pytest
+from django_attachments.utils import _mimetype_icon, parse_mimetype
+
+
+@pytest.fixture(autouse=True)
+def icon_cache():
+    _mimetype_icon.cache_clear()
+    yield _mimetype_icon
+    _mimetype_icon.cache_clear()
+
+
+@pytest.mark.parametrize('filename, mimetype, icon', [
+    ('report.pdf', 'application/pdf', 'django_attachments/img/mimetypes/application/pdf.png'),
+    ('notes.unknownext', '', 'application/octet-stream.png'),
+    ('photo.jpg', 'image/jpeg', 'application/octet-stream.png'),
+])
+def test_icons_resolve_without_finder_lookups(filename, mimetype, icon):
+    with patch('django.contrib.staticfiles.finders.find', side_effect=AssertionError('finder lookup')):
+        parsed = parse_mimetype(filename)
+
+    assert parsed['mimetype'] == mimetype
+    assert parsed['mimetype_url'].endswith(icon)
+
+
+def test_distinct_filenames_of_one_type_hit_the_cache(icon_cache):
+    for i in range(100):
+        parse_mimetype(f'report-{i}.PDF')
+
+    assert icon_cache.cache_info().misses == 1
+
+
+def test_callers_get_their_own_dict():
+    parse_mimetype('report.pdf')['mimetype'] = 'changed'
+
+    assert parse_mimetype('report.pdf')['mimetype'] == 'application/pdf'
@@ -184,6 +184,30 @@ def test_settings_prod_enables_security_headers(monkeypatch):
     assert module.SECURE_HSTS_PRELOAD is True
 
 
+@pytest.mark.parametrize('hasher, library', [('argon2', 'argon2'), ('bcrypt', 'bcrypt')])
+def test_settings_reject_hasher_without_its_library(monkeypatch, hasher, library):
+    monkeypatch.setenv('DJANGO_PASSWORD_HASHER', hasher)
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util, 'find_spec', lambda name, *args: None if name == library else real_find_spec(name, *args),
+    )
+
+    with pytest.raises(ImproperlyConfigured, match=f"needs the '{library}' package"):
+        _reload_settings_module('base_feature_project.settings_dev')
+
+
+def test_settings_prefer_configured_hasher_when_installed(monkeypatch):
+    monkeypatch.setenv('DJANGO_PASSWORD_HASHER', 'argon2')
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util, 'find_spec', lambda name, *args: object() if name == 'argon2' else real_find_spec(name, *args),
+    )
+
+    module = _reload_settings_module('base_feature_project.settings_dev')
+
+    assert module.PASSWORD_HASHERS[0] == 'django.contrib.auth.hashers.Argon2PasswordHasher'
+
+
 def test_settings_dev_sets_allowed_hosts_wildcard(monkeypatch):
     module = _reload_settings_module('base_feature_project.settings_dev')
 
@@ -0,0 +1,145 @@
+"""Resumable chunked uploads through the attachments admin edit API."""
+from io import BytesIO
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+from django_attachments.models import Attachment, UploadSession
+from django_attachments.uploads import finish_upload, start_upload, write_part
+
+from base_feature_app.models import User
+
+CONTENT = bytes(range(256)) * 1200  # 300 KB
+
+
+@pytest.fixture
+def upload_dirs(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path / 'media')
+    settings.ATTACHMENTS_UPLOAD_TEMP_DIR = str(tmp_path / 'parts')
+    return tmp_path
+
+
+@pytest.fixture
+def chunked(client, library, upload_dirs):
+    client.force_login(User.objects.create_superuser(email='admin@example.com', password='pass12345'))
+    url = reverse('admin:attachments_library_edit_api', args=[library.pk])
+
+    class Api:
+        def post(self, data):
+            return client.post(url, data, HTTP_ACCEPT='application/json')
+
+        def start(self, size, filename='big.bin'):
+            return self.post({'action': 'upload_start', 'filename': filename, 'size': size}).json()['upload']
+
+        def put(self, upload, offset, data):
+            return client.post(
+                f'{url}?action=upload_part&upload={upload}&offset={offset}',
+                data,
+                content_type='application/octet-stream',
+                HTTP_ACCEPT='application/json',
+            )
+
+        def finish(self, upload):
+            return self.post({'action': 'upload_finish', 'upload': upload})
+
+    return Api()
+
+
+@pytest.mark.django_db
+def test_upload_in_parts_resumes_from_the_reported_offset(chunked, upload_dirs):
+    upload = chunked.start(len(CONTENT))
+    chunked.put(upload, 0, CONTENT[:100 * 1024])
+
+    gap = chunked.put(upload, 200 * 1024, CONTENT[200 * 1024:])
+    offset = chunked.post({'action': 'upload_status', 'upload': upload}).json()['offset']
+
+    assert (gap.status_code, gap.json()['offset'], offset) == (409, 100 * 1024, 100 * 1024)
+    chunked.put(upload, offset, CONTENT[offset:])
+    assert chunked.finish(upload).status_code == 200
+    attachment = Attachment.objects.get()
+    assert (attachment.original_name, attachment.filesize) == ('big.bin', len(CONTENT))
+    with attachment.file.open('rb') as fp:
+        assert fp.read() == CONTENT
+    assert not UploadSession.objects.exists()
+    assert list((upload_dirs / 'parts').iterdir()) == []
+
+
+@pytest.mark.django_db
+def test_resent_part_does_not_move_the_offset_back(chunked):
+    upload = chunked.start(len(CONTENT))
+    chunked.put(upload, 0, CONTENT[:200 * 1024])
+
+    response = chunked.put(upload, 0, CONTENT[:100 * 1024])
+
+    assert response.json()['offset'] == 200 * 1024
+    assert UploadSession.objects.get().received == 200 * 1024
+
+
+@pytest.mark.django_db
+def test_finish_rejects_incomplete_upload(chunked):
+    upload = chunked.start(10, 'a.txt')
+    chunked.put(upload, 0, b'12345')
+
+    response = chunked.finish(upload)
+
+    assert response.status_code == 409
+    assert response.json()['offset'] == 5
+    assert not Attachment.objects.exists()
+
+
+@pytest.mark.django_db
+def test_second_finish_creates_no_second_attachment(chunked):
+    upload = chunked.start(4, 'a.txt')
+    chunked.put(upload, 0, b'1234')
+
+    assert chunked.finish(upload).status_code == 200
+    assert chunked.finish(upload).status_code == 404
+    assert Attachment.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_failed_save_keeps_the_session_for_a_retry(library, upload_dirs):
+    session = start_upload(library, 'a.txt', 4)
+    write_part(session.pk, library, 0, BytesIO(b'1234'), 4)
+
+    def save(upload):
+        raise OSError('storage unavailable')
+
+    with pytest.raises(OSError):
+        finish_upload(session.pk, library, save)
+
+    assert UploadSession.objects.get().received == 4
+    assert finish_upload(session.pk, library, lambda upload: upload.read()) == b'1234'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_part_is_streamed_outside_a_transaction(library, upload_dirs):
+    session = start_upload(library, 'a.txt', 4)
+    in_transaction = []
+
+    class Stream(BytesIO):
+        def read(self, size=-1):
+            in_transaction.append(connection.in_atomic_block)
+            return super().read(size)
+
+    write_part(session.pk, library, 0, Stream(b'1234'), 4)
+
+    assert in_transaction == [False]
+
+
+@pytest.mark.django_db
+def test_part_beyond_declared_size_is_rejected(chunked):
+    upload = chunked.start(4, 'a.txt')
+
+    response = chunked.put(upload, 0, b'123456')
+
+    assert response.status_code == 400
+    assert UploadSession.objects.get().received == 0
+
+
+@pytest.mark.django_db
+def test_unknown_upload(chunked):
+    response = chunked.post({'action': 'upload_status', 'upload': 'not-a-uuid'})
+
+    assert response.status_code == 404
+
@@ -0,0 +1,137 @@
+"""Sliding-window rate limits on the public auth endpoints."""
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from base_feature_app.throttling import SlidingWindowRateThrottle, parse_rate
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_020.0]
+    monkeypatch.setattr(SlidingWindowRateThrottle, 'timer', staticmethod(lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def throttle_rates(settings):
+    def configure(**rates):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], **rates},
+        }
+    return configure
+
+
+def _sign_in(api_client, email, remote_addr='10.0.0.1', **extra):
+    return api_client.post(
+        reverse('sign_in'), {'email': email, 'password': 'wrong-pass'}, format='json', REMOTE_ADDR=remote_addr,
+        **extra,
+    )
+
+
+def test_parse_rate_supports_period_multipliers():
+    assert parse_rate('10/15m') == (10, 900)
+    assert parse_rate('5/hour') == (5, 3600)
+    assert parse_rate('') == (None, None)
+
+
+@pytest.mark.django_db
+@patch('base_feature_app.views.auth.authenticate_user', return_value=None)
+@patch('base_feature_app.views.auth.verify_recaptcha')
+def test_sign_in_is_limited_per_email_before_captcha_and_hashing(
+    mock_captcha, mock_authenticate, api_client, throttle_rates, clock,
+):
+    throttle_rates(sign_in='100/m', sign_in_email='2/m')
+
+    assert _sign_in(api_client, 'victim@example.com').status_code == status.HTTP_401_UNAUTHORIZED
+    assert _sign_in(api_client, 'Victim@Example.com ', '10.0.0.2').status_code == status.HTTP_401_UNAUTHORIZED
+    response = _sign_in(api_client, 'victim@example.com', '10.0.0.3')
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response['Retry-After']) > 0
+    assert mock_captcha.call_count == 2
+    assert mock_authenticate.call_count == 2
+    assert _sign_in(api_client, 'other@example.com').status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+@patch('base_feature_app.views.auth.authenticate_user', return_value=None)
+@patch('base_feature_app.views.auth.verify_recaptcha', return_value=True)
+def test_sign_in_is_limited_per_ip(mock_captcha, mock_authenticate, api_client, throttle_rates, clock):
+    throttle_rates(sign_in='2/m', sign_in_email='100/m')
+
+    _sign_in(api_client, 'a@example.com')
+    _sign_in(api_client, 'b@example.com')
+
+    assert _sign_in(api_client, 'c@example.com').status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert _sign_in(api_client, 'c@example.com', '10.0.0.9').status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('num_proxies, remote_addr', [(None, '10.0.0.1'), (1, '10.0.0.254')])
+@patch('base_feature_app.views.auth.authenticate_user', return_value=None)
+@patch('base_feature_app.views.auth.verify_recaptcha', return_value=True)
+def test_rotating_forwarded_for_does_not_bypass_ip_limit(
+    mock_captcha, mock_authenticate, num_proxies, remote_addr, api_client, settings, throttle_rates, clock,
+):
+    """By default REMOTE_ADDR identifies the client; behind proxies, the hop the last one appended."""
+    throttle_rates(sign_in='2/m', sign_in_email='')
+    if num_proxies is not None:
+        settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, 'NUM_PROXIES': num_proxies}
+
+    statuses = [
+        _sign_in(
+            api_client, f'{n}@example.com', remote_addr, HTTP_X_FORWARDED_FOR=f'198.51.100.{n}, 203.0.113.7',
+        ).status_code
+        for n in range(4)
+    ]
+
+    assert statuses[2:] == [status.HTTP_429_TOO_MANY_REQUESTS] * 2
+
+
+@pytest.mark.django_db
+@patch('base_feature_app.views.auth.authenticate_user', return_value=None)
+@patch('base_feature_app.views.auth.verify_recaptcha', return_value=True)
+def test_previous_window_slides_out(mock_captcha, mock_authenticate, api_client, throttle_rates, clock):
+    """Hits of the previous window count in proportion to its overlap with the sliding window."""
+    throttle_rates(sign_in='2/m', sign_in_email='')
+    clock[0] = 1_000_020.0  # 0s into a window (1_000_020 is a multiple of 60)
+    _sign_in(api_client, 'a@example.com')
+    _sign_in(api_client, 'a@example.com')
+
+    clock[0] += 90  # 30s into the next window: the previous two weigh 1
+    assert _sign_in(api_client, 'a@example.com').status_code == status.HTTP_401_UNAUTHORIZED
+    response = _sign_in(api_client, 'a@example.com')
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    # The denied hit counts too: this window alone is full until it half slides out.
+    assert response['Retry-After'] == '60'
+
+    clock[0] += 60
+    assert _sign_in(api_client, 'a@example.com').status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+@patch('base_feature_app.views.captcha_views.verify_recaptcha', return_value=True)
+def test_verify_captcha_is_limited_per_ip(mock_verify, api_client, throttle_rates, clock):
+    throttle_rates(captcha='1/m')
+    url = reverse('captcha-verify')
+
+    assert api_client.post(url, {'token': 't'}, format='json').status_code == status.HTTP_200_OK
+    response = api_client.post(url, {'token': 't'}, format='json')
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert 'Retry-After' in response
+    mock_verify.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_sign_up_and_google_login_are_throttled(api_client, throttle_rates, clock):
+    throttle_rates(sign_up='0/m', google_login='0/m')
+
+    assert api_client.post(reverse('sign_up'), {}, format='json').status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert api_client.post(reverse('google_login'), {}, format='json').status_code == (
+        status.HTTP_429_TOO_MANY_REQUESTS
+    )
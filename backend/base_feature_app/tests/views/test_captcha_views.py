@@ -75,7 +75,7 @@ def test_verify_recaptcha_returns_false_without_token():
 def test_verify_recaptcha_returns_false_on_request_exception():
     """Return false when captcha provider request raises an exception."""
     with override_settings(RECAPTCHA_SECRET_KEY='secret'):
-        with patch('base_feature_app.views.captcha_views.requests.post', side_effect=requests.RequestException) as mock_post:
+        with patch('base_feature_app.services.recaptcha.requests.Session.post', side_effect=requests.RequestException) as mock_post:
             assert verify_recaptcha('token') is False
         mock_post.assert_called_once()
 
@@ -88,7 +88,7 @@ def json(self):
             return {'success': False}
 
     with override_settings(RECAPTCHA_SECRET_KEY='secret'):
-        with patch('base_feature_app.views.captcha_views.requests.post', return_value=ApiFailureResponse()) as mock_post:
+        with patch('base_feature_app.services.recaptcha.requests.Session.post', return_value=ApiFailureResponse()) as mock_post:
             assert verify_recaptcha('token') is False
         mock_post.assert_called_once()
 
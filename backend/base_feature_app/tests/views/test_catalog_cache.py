@@ -0,0 +1,112 @@
+"""Read-through cache for the public product and blog endpoints."""
+import pytest
+from django.urls import reverse
+from django_attachments.models import Library
+from django_attachments.signals import attachments_reordered
+
+from base_feature_app.tests.factories import AttachmentFactory, BlogFactory, ProductFactory
+from base_feature_app.utils.catalog_cache import get_cache_stats
+
+
+@pytest.mark.django_db
+def test_list_products_second_request_is_served_from_cache(api_client):
+    """Identical GETs hit the cache and are counted."""
+    ProductFactory()
+    url = reverse('list-products')
+
+    first = api_client.get(url)
+    second = api_client.get(url)
+
+    assert first['X-Cache'] == 'MISS'
+    assert second['X-Cache'] == 'HIT'
+    assert second.json() == first.json()
+    assert get_cache_stats() == {'hits': 1, 'misses': 1, 'hit_ratio': 0.5}
+
+
+@pytest.mark.django_db
+def test_cached_list_keeps_pagination_link_header(api_client):
+    """The Link header is replayed on cache hits."""
+    ProductFactory.create_batch(3)
+    url = reverse('list-products')
+
+    first = api_client.get(url, {'page_size': 1})
+    second = api_client.get(url, {'page_size': 1})
+
+    assert second['X-Cache'] == 'HIT'
+    assert second['Link'] == first['Link']
+
+
+@pytest.mark.django_db
+def test_cache_key_includes_host(api_client):
+    """Absolute gallery URLs differ per host, so hosts do not share entries."""
+    ProductFactory()
+    url = reverse('list-products')
+
+    api_client.get(url)
+    response = api_client.get(url, HTTP_HOST='shop.example.com')
+
+    assert response['X-Cache'] == 'MISS'
+
+
+@pytest.mark.django_db
+def test_product_update_invalidates_list_and_detail(api_client, admin_client):
+    """Saving a product drops its cached detail and every list page."""
+    product = ProductFactory(title='Old title')
+    list_url = reverse('list-products')
+    detail_url = reverse('retrieve-product', kwargs={'product_id': product.id})
+    api_client.get(list_url)
+    api_client.get(detail_url)
+
+    admin_client.patch(
+        reverse('update-product', kwargs={'product_id': product.id}), {'title': 'New title'}, format='json',
+    )
+
+    list_response = api_client.get(list_url)
+    detail_response = api_client.get(detail_url)
+    assert list_response['X-Cache'] == 'MISS'
+    assert list_response.json()[0]['title'] == 'New title'
+    assert detail_response['X-Cache'] == 'MISS'
+    assert detail_response.json()['title'] == 'New title'
+
+
+@pytest.mark.django_db
+def test_other_product_detail_stays_cached_after_update(api_client):
+    """Invalidation is scoped to the changed object."""
+    untouched = ProductFactory()
+    changed = ProductFactory()
+    detail_url = reverse('retrieve-product', kwargs={'product_id': untouched.id})
+    api_client.get(detail_url)
+
+    changed.title = 'Changed'
+    changed.save()
+
+    assert api_client.get(detail_url)['X-Cache'] == 'HIT'
+
+
+@pytest.mark.django_db
+def test_blog_delete_invalidates_list(api_client):
+    """Deleting a blog removes it from the cached list."""
+    blog = BlogFactory()
+    url = reverse('list-blogs')
+    api_client.get(url)
+
+    blog.delete()
+
+    response = api_client.get(url)
+    assert response['X-Cache'] == 'MISS'
+    assert response.json() == []
+
+
+@pytest.mark.django_db
+def test_attachment_changes_invalidate_owning_product(api_client, media_root):
+    """Adding an attachment and bulk re-ranking both refresh the gallery."""
+    product = ProductFactory()
+    detail_url = reverse('retrieve-product', kwargs={'product_id': product.id})
+    api_client.get(detail_url)
+
+    AttachmentFactory(library=product.gallery, filename='x.txt', data=b'x', rank=0)
+    assert api_client.get(detail_url)['X-Cache'] == 'MISS'
+    assert api_client.get(detail_url)['X-Cache'] == 'HIT'
+
+    attachments_reordered.send(sender=Library, library=product.gallery)
+    assert api_client.get(detail_url)['X-Cache'] == 'MISS'
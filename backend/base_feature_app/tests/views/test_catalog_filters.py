@@ -0,0 +1,139 @@
+"""Server-side filtering, ordering and full-text search on the catalog lists."""
+import re
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from base_feature_app.tests.factories import BlogFactory, ProductFactory
+
+NEXT_LINK_RE = re.compile(r'<([^>]+)>; rel="next"')
+
+
+def _ids(response):
+    return [item['id'] for item in response.json()]
+
+
+def _list_query_plans(api_client, url_name, params, pages=2):
+    """EXPLAIN the row query a list view runs for its first ``pages`` cursor pages."""
+    plans = []
+    url, data = reverse(url_name), params
+    while url and len(plans) < pages:
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(url, data)
+        sql = next(q['sql'] for q in ctx.captured_queries if ' ORDER BY ' in q['sql'] and ' LIMIT ' in q['sql'])
+        with connection.cursor() as cursor:
+            cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}')
+            plans.append(' '.join(str(row) for row in cursor.fetchall()))
+        match = NEXT_LINK_RE.search(response.headers.get('Link', ''))
+        url, data = (match.group(1) if match else None), None
+    return plans
+
+
+@pytest.mark.django_db
+def test_list_products_filters_by_category_and_sub_category(api_client):
+    """Only rows matching every filter are returned."""
+    match = ProductFactory(category='Shoes', sub_category='Running')
+    ProductFactory(category='Shoes', sub_category='Trail')
+    ProductFactory(category='Hats', sub_category='Running')
+
+    response = api_client.get(reverse('list-products'), {'category': 'Shoes', 'sub_category': 'Running'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert _ids(response) == [match.id]
+
+
+@pytest.mark.django_db
+def test_list_products_orders_by_price_across_cursor_pages(api_client):
+    """Price ordering survives cursor pagination, with ties broken by id."""
+    prices = ['30.00', '10.00', '20.00', '10.00']
+    products = [ProductFactory(price=Decimal(price)) for price in prices]
+    expected = [p.id for p in sorted(products, key=lambda p: (p.price, p.id))]
+
+    response = api_client.get(reverse('list-products'), {'ordering': 'price', 'page_size': 2})
+    seen = _ids(response)
+    match = NEXT_LINK_RE.search(response.headers.get('Link', ''))
+    while match:
+        response = api_client.get(match.group(1))
+        seen.extend(_ids(response))
+        match = NEXT_LINK_RE.search(response.headers.get('Link', ''))
+
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_list_products_unknown_ordering_falls_back_to_newest_first(api_client):
+    """Unsupported ordering values are ignored."""
+    products = ProductFactory.create_batch(3)
+
+    response = api_client.get(reverse('list-products'), {'ordering': 'description'})
+
+    assert _ids(response) == [p.id for p in reversed(products)]
+
+
+@pytest.mark.django_db
+def test_list_products_search_matches_title_prefix_and_description(api_client):
+    """Every search word must match title or description, as a prefix."""
+    by_title = ProductFactory(title='Waterproof jacket', description='Warm')
+    by_description = ProductFactory(title='Shell', description='A waterproof layer')
+    ProductFactory(title='Cotton shirt', description='Light')
+
+    response = api_client.get(reverse('list-products'), {'search': 'waterpr'})
+
+    assert sorted(_ids(response)) == sorted([by_title.id, by_description.id])
+
+
+@pytest.mark.django_db
+def test_list_products_search_tracks_updates_and_ignores_query_syntax(api_client):
+    """Index triggers follow edits; FTS syntax in the input is stripped."""
+    product = ProductFactory(title='Old name')
+    product.title = 'Renamed lamp'
+    product.save()
+
+    renamed = api_client.get(reverse('list-products'), {'search': 'lamp'})
+    stale = api_client.get(reverse('list-products'), {'search': 'old'})
+    syntax = api_client.get(reverse('list-products'), {'search': '"lamp*'})
+
+    assert _ids(renamed) == [product.id]
+    assert _ids(stale) == []
+    assert syntax.status_code == status.HTTP_200_OK
+    assert _ids(syntax) == [product.id]
+
+
+@pytest.mark.django_db
+def test_list_blogs_filters_searches_and_orders(api_client):
+    """Blogs support category, search and created_at ordering."""
+    older = BlogFactory(category='News', title='Launch notes')
+    newer = BlogFactory(category='News', title='Launch recap')
+    BlogFactory(category='Guides', title='Launch guide')
+
+    response = api_client.get(
+        reverse('list-blogs'), {'category': 'News', 'search': 'launch', 'ordering': 'created_at'}
+    )
+
+    assert _ids(response) == [older.id, newer.id]
+
+
+@pytest.mark.parametrize(
+    'url_name, factory, params, index',
+    [
+        ('list-products', ProductFactory, {'category': 'Shoes', 'ordering': '-created_at'}, 'product_cat_created_idx'),
+        ('list-products', ProductFactory, {'category': 'Shoes', 'sub_category': 'Running'}, 'product_cat_subcat_idx'),
+        ('list-products', ProductFactory, {'ordering': 'price'}, 'product_price_idx'),
+        ('list-blogs', BlogFactory, {'category': 'News', 'ordering': '-created_at'}, 'blog_cat_created_idx'),
+    ],
+)
+@pytest.mark.django_db
+def test_list_queries_use_indexes_across_cursor_pages(api_client, url_name, factory, params, index):
+    """EXPLAIN of the SQL each list view runs, first and cursor page, names the index."""
+    fields = {'category': 'Shoes', 'sub_category': 'Running'} if factory is ProductFactory else {'category': 'News'}
+    factory.create_batch(3, **fields)
+
+    plans = _list_query_plans(api_client, url_name, {**params, 'page_size': 1})
+
+    assert len(plans) == 2
+    assert all(index in plan for plan in plans), plans
+    assert not any('TEMP B-TREE FOR ORDER BY' in plan for plan in plans), plans
@@ -0,0 +1,111 @@
+"""Claims-based JWT authentication: stateless safe requests, versioned claims."""
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from base_feature_app.utils.auth_utils import generate_auth_tokens
+
+User = get_user_model()
+
+
+def _bearer(api_client, token):
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return api_client
+
+
+@pytest.mark.django_db
+def test_access_token_embeds_user_claims(admin_user):
+    token = AccessToken(generate_auth_tokens(admin_user)['access'])
+
+    assert token['email'] == admin_user.email
+    assert token['role'] == admin_user.role
+    assert token['is_staff'] is True
+    assert token['token_version'] == admin_user.token_version
+
+
+@pytest.mark.django_db
+def test_validate_token_uses_claims_without_queries(api_client, user, django_assert_num_queries):
+    _bearer(api_client, generate_auth_tokens(user)['access'])
+
+    with django_assert_num_queries(0):
+        response = api_client.get(reverse('validate_token'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['user'] == {
+        'id': user.id,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'role': user.role,
+        'is_staff': False,
+    }
+
+
+@pytest.mark.django_db
+def test_admin_endpoints_reject_outdated_claims(api_client, admin_user):
+    _bearer(api_client, generate_auth_tokens(admin_user)['access'])
+    assert api_client.get(reverse('list-users')).status_code == status.HTTP_200_OK
+
+    admin_user.is_staff = False
+    admin_user.save()
+
+    response = api_client.get(reverse('list-users'))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_unsafe_requests_reject_outdated_claims(api_client, admin_user):
+    _bearer(api_client, generate_auth_tokens(admin_user)['access'])
+    User.objects.filter(pk=admin_user.pk).update(token_version=admin_user.token_version + 1)
+
+    response = api_client.post(reverse('create-user'), {'email': 'new@example.com'}, format='json')
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_tokens_without_claims_still_authenticate(api_client, user):
+    _bearer(api_client, RefreshToken.for_user(user).access_token)
+
+    response = api_client.get(reverse('validate_token'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['user']['email'] == user.email
+
+
+@pytest.mark.django_db
+def test_refresh_issues_current_claims(api_client, user):
+    refresh = generate_auth_tokens(user)['refresh']
+    user.role = User.Role.ADMIN
+    user.save()
+
+    response = api_client.post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    access = AccessToken(response.json()['access'])
+    assert access['role'] == User.Role.ADMIN
+    assert access['token_version'] == user.token_version
+    assert 'refresh' in response.json()
+
+
+@pytest.mark.django_db
+def test_refresh_refuses_inactive_users(api_client, user):
+    refresh = generate_auth_tokens(user)['refresh']
+    user.is_active = False
+    user.save()
+
+    response = api_client.post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_token_obtain_embeds_claims(api_client, user):
+    response = api_client.post(
+        reverse('token_obtain_pair'), {'email': user.email, 'password': 'pass12345'}, format='json',
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert AccessToken(response.json()['access'])['email'] == user.email
@@ -0,0 +1,152 @@
+"""ETag / Last-Modified conditional GET on the catalog and banner endpoints."""
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+
+from base_feature_app.models import StagingPhaseBanner, User
+from base_feature_app.tests.factories import AttachmentFactory, BlogFactory, ProductFactory
+
+
+@pytest.mark.django_db
+def test_list_products_revalidation_returns_304_without_serializing(api_client):
+    """A matching If-None-Match short-circuits before the view body runs."""
+    ProductFactory.create_batch(2)
+    url = reverse('list-products')
+    etag = api_client.get(url)['ETag']
+
+    with patch('base_feature_app.views.product_crud.ProductListSerializer') as serializer:
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b''
+    serializer.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_list_products_etag_changes_on_update_and_delete(api_client):
+    """Edits and deletions both move the list ETag."""
+    products = ProductFactory.create_batch(2)
+    url = reverse('list-products')
+    initial = api_client.get(url)['ETag']
+
+    products[0].title = 'Renamed'
+    products[0].save()
+    after_update = api_client.get(url)['ETag']
+    products[1].delete()
+    after_delete = api_client.get(url)['ETag']
+
+    assert len({initial, after_update, after_delete}) == 3
+
+
+@pytest.mark.django_db
+def test_list_products_etag_differs_per_page(api_client):
+    """Each cursor page is a separate representation."""
+    ProductFactory.create_batch(3)
+    url = reverse('list-products')
+
+    first = api_client.get(url, {'page_size': 1})
+    second = api_client.get(url, {'page_size': 2})
+
+    assert first['ETag'] != second['ETag']
+    assert 'Last-Modified' not in first
+
+
+@pytest.mark.django_db
+def test_list_blogs_etag_changes_when_attachment_is_added(api_client, media_root):
+    """Adding media to a library moves the list ETag."""
+    blog = BlogFactory()
+    url = reverse('list-blogs')
+    initial = api_client.get(url)['ETag']
+
+    AttachmentFactory(library=blog.image, filename='x.txt', data=b'x')
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=initial)
+    assert response.status_code == status.HTTP_200_OK
+    assert response['ETag'] != initial
+
+
+@pytest.mark.django_db
+def test_retrieve_product_honours_if_modified_since(api_client):
+    """Detail views emit Last-Modified from the product or its gallery."""
+    product = ProductFactory()
+    url = reverse('retrieve-product', kwargs={'product_id': product.id})
+    first = api_client.get(url)
+
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response['ETag'] == first['ETag']
+
+
+@pytest.mark.django_db
+def test_retrieve_blog_stale_etag_returns_fresh_body(api_client):
+    """Saving the blog invalidates the previous ETag."""
+    blog = BlogFactory(title='Before')
+    url = reverse('retrieve-blog', kwargs={'blog_id': blog.id})
+    etag = api_client.get(url)['ETag']
+
+    blog.title = 'After'
+    blog.save()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['title'] == 'After'
+
+
+@pytest.mark.django_db
+def test_retrieve_missing_product_still_returns_404(api_client):
+    """Unknown ids carry no validators and fall through to the 404."""
+    url = reverse('retrieve-product', kwargs={'product_id': 999999})
+
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=http_date())
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_staging_banner_revalidation_returns_304(api_client):
+    """Polling the banner with its ETag collapses to header-only responses."""
+    StagingPhaseBanner.get_solo()
+    url = reverse('staging-banner')
+    etag = api_client.get(url)['ETag']
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_staging_banner_etag_changes_with_admin_edit(api_client):
+    """Editing the banner produces a new ETag."""
+    banner = StagingPhaseBanner.get_solo()
+    url = reverse('staging-banner')
+    etag = api_client.get(url)['ETag']
+
+    banner.is_visible = False
+    banner.save()
+
+    assert api_client.get(url)['ETag'] != etag
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('action, visible', [('hide_banner', True), ('show_banner', False)])
+def test_staging_banner_etag_changes_with_admin_bulk_action(api_client, client, action, visible):
+    """The show/hide admin actions update the row in bulk; polls must not get a stale 304."""
+    banner = StagingPhaseBanner.get_solo()
+    StagingPhaseBanner.objects.filter(pk=banner.pk).update(is_visible=visible)
+    StagingPhaseBanner.invalidate_solo_cache()
+    url = reverse('staging-banner')
+    etag = api_client.get(url)['ETag']
+    client.force_login(User.objects.create_superuser(email='banner@example.com', password='pass12345'))
+
+    client.post(
+        reverse('myadmin:base_feature_app_stagingphasebanner_changelist'),
+        {'action': action, '_selected_action': [banner.pk]},
+    )
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['is_visible'] is not visible
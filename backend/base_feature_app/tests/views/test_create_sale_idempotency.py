@@ -0,0 +1,84 @@
+"""Idempotency-Key contract for POST /api/create-sale/."""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from base_feature_app.models import IdempotencyKey, Sale
+
+
+def _payload(product, quantity=1):
+    return {
+        'email': 'buyer@example.com',
+        'address': '123 Main St',
+        'city': 'City',
+        'state': 'State',
+        'postal_code': '12345',
+        'sold_products': [{'product_id': product.id, 'quantity': quantity}],
+    }
+
+
+@pytest.mark.django_db
+def test_retry_with_same_key_replays_first_response(api_client, product):
+    """A retried checkout returns the stored 201 and writes no second sale."""
+    url = reverse('create-sale')
+
+    first = api_client.post(url, _payload(product), format='json', HTTP_IDEMPOTENCY_KEY='checkout-1')
+    retry = api_client.post(url, _payload(product), format='json', HTTP_IDEMPOTENCY_KEY='checkout-1')
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert retry.status_code == status.HTTP_201_CREATED
+    assert retry.json() == first.json()
+    assert retry['Idempotent-Replayed'] == 'true'
+    assert Sale.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_retry_costs_a_single_lookup(api_client, product):
+    """Replays never re-run validation or the create path."""
+    url = reverse('create-sale')
+    api_client.post(url, _payload(product), format='json', HTTP_IDEMPOTENCY_KEY='checkout-2')
+
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.post(url, _payload(product), format='json', HTTP_IDEMPOTENCY_KEY='checkout-2')
+
+    assert len(ctx.captured_queries) == 1
+
+
+@pytest.mark.django_db
+def test_same_key_with_different_payload_returns_422(api_client, product):
+    """Reusing a key for another cart is rejected."""
+    url = reverse('create-sale')
+    api_client.post(url, _payload(product), format='json', HTTP_IDEMPOTENCY_KEY='checkout-3')
+
+    response = api_client.post(url, _payload(product, quantity=5), format='json', HTTP_IDEMPOTENCY_KEY='checkout-3')
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert Sale.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_validation_error_does_not_consume_key(api_client, product):
+    """A 400 releases the key so the corrected request can use it."""
+    url = reverse('create-sale')
+    invalid = {**_payload(product), 'email': 'not-an-email'}
+
+    rejected = api_client.post(url, invalid, format='json', HTTP_IDEMPOTENCY_KEY='checkout-4')
+    accepted = api_client.post(url, _payload(product), format='json', HTTP_IDEMPOTENCY_KEY='checkout-4')
+
+    assert rejected.status_code == status.HTTP_400_BAD_REQUEST
+    assert accepted.status_code == status.HTTP_201_CREATED
+    assert IdempotencyKey.objects.filter(key='checkout-4').count() == 1
+
+
+@pytest.mark.django_db
+def test_requests_without_key_are_not_deduplicated(api_client, product):
+    """The header is opt-in; plain POSTs behave as before."""
+    url = reverse('create-sale')
+
+    api_client.post(url, _payload(product), format='json')
+    api_client.post(url, _payload(product), format='json')
+
+    assert Sale.objects.count() == 2
+    assert IdempotencyKey.objects.count() == 0
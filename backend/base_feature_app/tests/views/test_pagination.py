@@ -0,0 +1,80 @@
+"""Cursor pagination contract for the CRUD list endpoints."""
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from base_feature_app.pagination import IdCursorPagination
+from base_feature_app.tests.factories import ProductFactory, SaleFactory
+
+NEXT_LINK_RE = re.compile(r'<([^>]+)>; rel="next"')
+
+
+def _next_link(response):
+    match = NEXT_LINK_RE.search(response.headers.get('Link', ''))
+    return match.group(1) if match else None
+
+
+@pytest.mark.django_db
+def test_list_products_first_page_is_plain_list_without_cursor(api_client):
+    """Clients that send no cursor keep receiving a JSON list, newest first."""
+    products = ProductFactory.create_batch(3)
+
+    response = api_client.get(reverse('list-products'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert isinstance(response.json(), list)
+    assert [item['id'] for item in response.json()] == [p.id for p in reversed(products)]
+    assert 'Link' not in response.headers
+
+
+@pytest.mark.django_db
+def test_list_products_follows_next_cursor_without_overlap(api_client):
+    """Walking the Link header visits every row exactly once."""
+    products = ProductFactory.create_batch(5)
+
+    first = api_client.get(reverse('list-products'), {'page_size': 2})
+    seen = [item['id'] for item in first.json()]
+    next_url = _next_link(first)
+    while next_url:
+        page = api_client.get(next_url)
+        seen.extend(item['id'] for item in page.json())
+        next_url = _next_link(page)
+
+    assert len(first.json()) == 2
+    assert seen == [p.id for p in reversed(products)]
+
+
+@pytest.mark.django_db
+def test_list_sales_page_size_is_capped(admin_client, monkeypatch):
+    """page_size above the configured maximum is clamped."""
+    monkeypatch.setattr(IdCursorPagination, 'max_page_size', 3)
+    SaleFactory.create_batch(5)
+
+    response = admin_client.get(reverse('list-sales'), {'page_size': 50})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 3
+    assert _next_link(response) is not None
+
+
+@pytest.mark.django_db
+def test_list_sales_never_issues_count_query(admin_client):
+    """Keyset pagination does not run COUNT(*) on the sales table."""
+    SaleFactory.create_batch(3)
+
+    with CaptureQueriesContext(connection) as ctx:
+        admin_client.get(reverse('list-sales'), {'page_size': 2})
+
+    assert not any('COUNT(' in query['sql'].upper() for query in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_list_users_invalid_cursor_returns_404(admin_client):
+    """A tampered cursor is rejected instead of silently restarting."""
+    response = admin_client.get(reverse('list-users'), {'cursor': 'not-a-cursor'})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
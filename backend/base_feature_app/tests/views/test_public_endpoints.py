@@ -58,6 +58,30 @@ def test_create_sale_validation_error(api_client):
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.django_db
+def test_create_sale_unknown_product_returns_400(api_client, product):
+    """Unknown product ids are a client error and leave nothing half-written."""
+    url = reverse('create-sale')
+    payload = {
+        'email': 'buyer@example.com',
+        'address': '123 Main St',
+        'city': 'City',
+        'state': 'State',
+        'postal_code': '12345',
+        'sold_products': [
+            {'product_id': product.id, 'quantity': 1},
+            {'product_id': 999999, 'quantity': 1},
+        ],
+    }
+
+    response = api_client.post(url, payload, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'sold_products' in response.json()
+    assert Sale.objects.count() == 0
+    assert SoldProduct.objects.count() == 0
+
+
 @pytest.mark.django_db
 def test_create_sale_success(api_client, product):
     """Verifies that a valid sale creation request creates a Sale and SoldProduct in the database."""
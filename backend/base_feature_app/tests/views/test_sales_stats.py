@@ -0,0 +1,53 @@
+"""Staff-only /api/sales/stats/ endpoint backed by the rollup tables."""
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from base_feature_app.models import DailySalesRollup, ProductSalesRollup
+from base_feature_app.tests.factories import ProductFactory
+
+
+@pytest.mark.django_db
+def test_sales_stats_requires_staff(authenticated_client):
+    response = authenticated_client.get(reverse('sales-stats'))
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_sales_stats_returns_range_from_rollups(admin_client):
+    """Totals, daily rows and rankings come back for the requested range."""
+    today = timezone.localdate()
+    product = ProductFactory(title='Lamp')
+    DailySalesRollup.objects.create(date=today, sale_count=1, item_count=1, units=2, revenue=Decimal('20.00'))
+    DailySalesRollup.objects.create(date=today - timedelta(days=40), sale_count=9, revenue=Decimal('99.00'))
+    ProductSalesRollup.objects.create(date=today, product=product, category='Home', units=2, revenue=Decimal('20.00'))
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = admin_client.get(reverse('sales-stats'))
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body['totals'] == {'sale_count': 1, 'item_count': 1, 'units': 2, 'revenue': '20.00'}
+    assert [row['date'] for row in body['daily']] == [today.isoformat()]
+    assert body['top_products'] == [{'product_id': product.id, 'title': 'Lamp', 'units': 2, 'revenue': '20.00'}]
+    assert body['top_categories'] == [{'category': 'Home', 'units': 2, 'revenue': '20.00'}]
+    assert not any('base_feature_app_sale' in q['sql'] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_sales_stats_rejects_inverted_and_oversized_ranges(admin_client, settings):
+    settings.SALES_STATS_MAX_DAYS = 7
+    url = reverse('sales-stats')
+
+    inverted = admin_client.get(url, {'start': '2026-02-01', 'end': '2026-01-01'})
+    oversized = admin_client.get(url, {'start': '2026-01-01', 'end': '2026-01-31'})
+
+    assert inverted.status_code == status.HTTP_400_BAD_REQUEST
+    assert oversized.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,6 +1,8 @@
 from datetime import timedelta
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -87,3 +89,60 @@ def test_staging_banner_does_not_expose_internal_duration_config(api_client, ban
     body = response.json()
     assert 'design_duration_days' not in body
     assert 'development_duration_days' not in body
+
+
+@pytest.mark.django_db
+def test_staging_banner_repeat_request_runs_no_queries(api_client, banner):
+    url = reverse('staging-banner')
+    api_client.get(url)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_staging_banner_save_invalidates_cached_singleton(api_client, banner):
+    url = reverse('staging-banner')
+    api_client.get(url)
+
+    banner.is_visible = False
+    banner.save()
+
+    assert api_client.get(url).json()['is_visible'] is False
+
+
+@pytest.mark.django_db
+def test_staging_banner_get_solo_creates_missing_row(db):
+    StagingPhaseBanner.objects.all().delete()
+
+    banner = StagingPhaseBanner.get_solo()
+
+    assert banner.pk == 1
+    assert StagingPhaseBanner.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_staging_banner_max_age_capped_by_next_countdown_change(api_client, banner, settings):
+    settings.STAGING_BANNER_MAX_AGE = 3600
+    banner.started_at = timezone.now() - timedelta(days=banner.design_duration_days) + timedelta(minutes=10)
+    banner.save()
+
+    response = api_client.get(reverse('staging-banner'))
+
+    assert 'public' in response['Cache-Control']
+    max_age = int(response['Cache-Control'].split('max-age=')[1].split(',')[0])
+    assert 0 < max_age <= 600
+
+
+@pytest.mark.django_db
+def test_staging_banner_max_age_defaults_without_countdown(api_client, banner, settings):
+    settings.STAGING_BANNER_MAX_AGE = 45
+    banner.started_at = None
+    banner.save()
+
+    response = api_client.get(reverse('staging-banner'))
+
+    assert 'max-age=45' in response['Cache-Control']
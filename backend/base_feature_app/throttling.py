@@ -0,0 +1,142 @@
+import hashlib
+import re
+import time
+
+from django.core.cache import cache as default_cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+RATE_RE = re.compile(r'^(\d+)/(\d*)([smhd])')
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """
+    Parse ``'<requests>/<period>'`` into ``(requests, seconds)``.
+
+    The period may carry a multiplier, e.g. ``'10/15m'`` allows ten requests
+    per fifteen minutes. Returns ``(None, None)`` for an empty rate.
+    """
+    if not rate:
+        return None, None
+    match = RATE_RE.match(rate)
+    if match is None:
+        raise ValueError(f'Invalid throttle rate: {rate!r}')
+    num, multiplier, period = match.groups()
+    return int(num), int(multiplier or 1) * PERIODS[period]
+
+
+class SlidingWindowRateThrottle(BaseThrottle):
+    """
+    Sliding-window counter throttle keyed by client IP and submitted email.
+
+    Each identity keeps one counter per fixed window in the default cache
+    (Redis in production, local memory otherwise). A request is allowed while
+    ``previous * overlap + current`` stays within the rate, where ``overlap``
+    is the share of the previous window still inside the sliding window.
+    Counters are bumped with atomic ``incr``, so concurrent workers cannot
+    overshoot; denied attempts count too and keep a flood locked out.
+
+    Rates come from ``DEFAULT_THROTTLE_RATES``: ``<scope>`` limits per IP and
+    ``<scope>_email`` (optional) per normalized ``email`` in the request body.
+    DRF runs throttles before the view body, so a throttled request never
+    reaches password hashing or the reCAPTCHA call, and answers 429 with a
+    ``Retry-After`` header.
+    """
+
+    scope = None
+    cache = default_cache
+    timer = time.time
+    cache_format = 'throttle:%(scope)s:%(ident)s:%(window)d'
+
+    def __init__(self):
+        self._wait = None
+
+    def get_rate(self, scope):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+
+    def get_email(self, request):
+        data = request.data
+        email = data.get('email') if hasattr(data, 'get') else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return hashlib.sha256(email.strip().lower().encode('utf-8')).hexdigest()
+
+    def get_limits(self, request):
+        """Yield ``(scope, ident, rate)`` for every identity to check."""
+        yield self.scope, self.get_ident(request), self.get_rate(self.scope)
+        email_scope = f'{self.scope}_email'
+        email_rate = self.get_rate(email_scope)
+        if email_rate:
+            email = self.get_email(request)
+            if email:
+                yield email_scope, email, email_rate
+
+    def allow_request(self, request, view):
+        waits = []
+        for scope, ident, rate in self.get_limits(request):
+            num_requests, duration = parse_rate(rate)
+            if num_requests is None or not ident:
+                continue
+            wait = self.hit(scope, ident, num_requests, duration)
+            if wait is not None:
+                waits.append(wait)
+        if waits:
+            self._wait = max(waits)
+            return False
+        return True
+
+    def hit(self, scope, ident, num_requests, duration):
+        """Count one request; return the seconds to wait if over the rate, else None."""
+        now = self.timer()
+        window = int(now // duration)
+        elapsed = now - window * duration
+        key = self.cache_format % {'scope': scope, 'ident': ident, 'window': window}
+        previous_key = self.cache_format % {'scope': scope, 'ident': ident, 'window': window - 1}
+
+        # Windows are read as "previous" for one more period after they close.
+        self.cache.add(key, 0, 2 * duration)
+        try:
+            current = self.cache.incr(key)
+        except ValueError:
+            # The counter expired between add() and incr().
+            self.cache.set(key, 1, 2 * duration)
+            current = 1
+        previous = self.cache.get(previous_key, 0)
+
+        overlap = (duration - elapsed) / duration
+        if previous * overlap + current <= num_requests:
+            return None
+        return self.compute_wait(previous, current, elapsed, num_requests, duration)
+
+    @staticmethod
+    def compute_wait(previous, current, elapsed, num_requests, duration):
+        # Seconds until one more request fits: first let the previous window
+        # slide out; if the current window alone is full, wait for it to do
+        # the same after it closes.
+        budget = num_requests - current - 1
+        if budget >= 0 and previous:
+            return max(duration * (1 - budget / previous) - elapsed, 0)
+        remaining = duration - elapsed
+        if num_requests <= 1:
+            return remaining + duration
+        return remaining + max(duration * (1 - (num_requests - 1) / current), 0)
+
+    def wait(self):
+        return self._wait
+
+
+class SignInRateThrottle(SlidingWindowRateThrottle):
+    scope = 'sign_in'
+
+
+class SignUpRateThrottle(SlidingWindowRateThrottle):
+    scope = 'sign_up'
+
+
+class GoogleLoginRateThrottle(SlidingWindowRateThrottle):
+    scope = 'google_login'
+
+
+class CaptchaRateThrottle(SlidingWindowRateThrottle):
+    scope = 'captcha'
@@ -5,5 +5,7 @@
 urlpatterns = [
     path('create-sale/', sale.create_sale, name='create-sale'),
     path('sales/', sale_crud.list_sales, name='list-sales'),
+    path('sales/export/', sale_crud.export_sales, name='export-sales'),
+    path('sales/stats/', sale_crud.sales_stats, name='sales-stats'),
     path('sales/<int:sale_id>/', sale_crud.retrieve_sale, name='retrieve-sale'),
 ]
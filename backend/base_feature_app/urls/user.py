@@ -4,6 +4,7 @@
 
 urlpatterns = [
     path('users/', user_crud.list_users, name='list-users'),
+    path('users/export/', user_crud.export_users, name='export-users'),
     path('users/create/', user_crud.create_user, name='create-user'),
     path('users/<int:user_id>/', user_crud.retrieve_user, name='retrieve-user'),
     path('users/<int:user_id>/update/', user_crud.update_user, name='update-user'),
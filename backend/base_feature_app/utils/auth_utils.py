@@ -3,6 +3,33 @@
 """
 from rest_framework_simplejwt.tokens import RefreshToken
 
+# User fields copied into tokens so safe requests can authenticate without
+# loading the user row (see base_feature_app.authentication).
+USER_CLAIMS = ('email', 'first_name', 'last_name', 'role', 'is_staff')
+TOKEN_VERSION_CLAIM = 'token_version'
+
+
+def add_user_claims(token, user):
+    """
+    Stamp the user's claims and token version onto ``token``.
+
+    :param token: simplejwt token to update in place.
+    :param user: User instance
+    :return: The same token.
+    """
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    token[TOKEN_VERSION_CLAIM] = user.token_version
+    return token
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """Refresh token whose derived access tokens carry the user's claims."""
+
+    @classmethod
+    def for_user(cls, user):
+        return add_user_claims(super().for_user(user), user)
+
 
 def generate_auth_tokens(user):
     """
@@ -11,7 +38,7 @@ def generate_auth_tokens(user):
     :param user: User instance
     :return: Dictionary with user info and JWT tokens.
     """
-    refresh = RefreshToken.for_user(user)
+    refresh = ClaimsRefreshToken.for_user(user)
 
     return {
         'user': {
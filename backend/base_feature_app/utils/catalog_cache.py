@@ -0,0 +1,181 @@
+"""
+Read-through response cache for the public catalog endpoints.
+
+Cached entries are keyed by the absolute request URL (scheme, host, path and
+query string — gallery URLs embed the host) under a per-scope version token.
+Invalidation never deletes entries: it swaps the version token of the
+affected scopes, so every key built afterwards misses and stale entries
+simply age out with the TTL.
+
+Scopes:
+    ``<resource>:list``       every list page of a resource
+    ``<resource>:<pk>``       the detail response of one object
+"""
+import hashlib
+from functools import wraps
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+KEY_PREFIX = 'catalog'
+CACHED_HEADERS = ('Link',)
+STATS_KEYS = {'hits': f'{KEY_PREFIX}:stats:hits', 'misses': f'{KEY_PREFIX}:stats:misses'}
+
+
+def get_cache():
+    """Return the cache backend configured for the catalog."""
+    return caches[getattr(settings, 'CATALOG_CACHE_ALIAS', 'default')]
+
+
+def _version_key(scope):
+    return f'{KEY_PREFIX}:version:{scope}'
+
+
+def get_scope_version(scope):
+    """
+    Return the current version token of ``scope``, creating one if missing.
+
+    Tokens are random rather than counters so an evicted version can never
+    resurrect entries written under an older one.
+    """
+    cache = get_cache()
+    key = _version_key(scope)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def _bump_scopes(scopes):
+    get_cache().set_many({_version_key(scope): uuid4().hex for scope in scopes}, None)
+
+
+def invalidate_scopes(*scopes):
+    """
+    Invalidate every cached response under ``scopes``.
+
+    Versions are swapped immediately (so the writer's own follow-up reads are
+    fresh) and again on commit, so a concurrent reader that cached the
+    pre-commit state in between is discarded as well.
+    """
+    _bump_scopes(scopes)
+    transaction.on_commit(lambda: _bump_scopes(scopes))
+
+
+def invalidate_object(resource, pk):
+    """Invalidate the list pages of ``resource`` and the detail of ``pk``."""
+    scopes = [f'{resource}:list']
+    if pk is not None:
+        scopes.append(f'{resource}:{pk}')
+    invalidate_scopes(*scopes)
+
+
+def invalidate_library(library_id):
+    """
+    Invalidate products and blogs whose media live in Library ``library_id``.
+
+    Called when attachments are added, removed or re-ranked.
+    """
+    from base_feature_app.models import Blog, Product
+
+    scopes = []
+    product_ids = list(Product.objects.filter(gallery_id=library_id).values_list('id', flat=True))
+    if product_ids:
+        scopes.append('products:list')
+        scopes.extend(f'products:{pk}' for pk in product_ids)
+    blog_ids = list(Blog.objects.filter(image_id=library_id).values_list('id', flat=True))
+    if blog_ids:
+        scopes.append('blogs:list')
+        scopes.extend(f'blogs:{pk}' for pk in blog_ids)
+    if scopes:
+        invalidate_scopes(*scopes)
+
+
+def build_cache_key(scope, absolute_url):
+    """Build the entry key for ``absolute_url`` under the current ``scope`` version."""
+    digest = hashlib.sha256(absolute_url.encode('utf-8')).hexdigest()
+    return f'{KEY_PREFIX}:{scope}:{get_scope_version(scope)}:{digest}'
+
+
+def _record(outcome):
+    cache = get_cache()
+    key = STATS_KEYS[outcome]
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def get_cache_stats():
+    """
+    Return the hit/miss counters of the catalog cache.
+
+    :return: Dict with ``hits``, ``misses`` and ``hit_ratio``.
+    """
+    values = get_cache().get_many(STATS_KEYS.values())
+    hits = values.get(STATS_KEYS['hits'], 0)
+    misses = values.get(STATS_KEYS['misses'], 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else 0.0,
+    }
+
+
+def reset_cache_stats():
+    """Reset the hit/miss counters."""
+    get_cache().delete_many(STATS_KEYS.values())
+
+
+def cached_catalog_response(resource, lookup_kwarg=None):
+    """
+    Cache successful GET responses of a catalog view.
+
+    Apply below ``@api_view``/``@permission_classes`` so permissions are
+    still checked on every request. Responses carry ``X-Cache: HIT|MISS``.
+
+    :param resource: Resource name used in scopes (``'products'``, ``'blogs'``).
+    :param lookup_kwarg: URL kwarg holding the object pk for detail views;
+        omit for list views.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+
+            if lookup_kwarg:
+                scope = f'{resource}:{kwargs[lookup_kwarg]}'
+            else:
+                scope = f'{resource}:list'
+            cache = get_cache()
+            key = build_cache_key(scope, request.build_absolute_uri())
+
+            entry = cache.get(key)
+            if entry is not None:
+                _record('hits')
+                response = Response(entry['data'], status=entry['status'], headers=entry['headers'])
+                response['X-Cache'] = 'HIT'
+                return response
+
+            _record('misses')
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200:
+                headers = {name: response[name] for name in CACHED_HEADERS if response.has_header(name)}
+                cache.set(
+                    key,
+                    {'data': response.data, 'status': response.status_code, 'headers': headers},
+                    getattr(settings, 'CATALOG_CACHE_TTL', 300),
+                )
+            response['X-Cache'] = 'MISS'
+            return response
+
+        return wrapper
+
+    return decorator
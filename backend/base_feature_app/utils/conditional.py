@@ -0,0 +1,119 @@
+"""
+Conditional GET (ETag / Last-Modified) support for catalog views.
+
+Validators are computed from timestamps the models already maintain, with a
+single aggregate or ``values_list`` query, before any serialization happens.
+Views are wrapped with Django's ``condition`` decorator, which answers
+``If-None-Match`` / ``If-Modified-Since`` with 304 and sets the headers on
+200 responses.
+
+List validators deliberately omit Last-Modified: deleting a row does not
+move ``MAX(updated_at)``, so only the ETag (which also folds in the row
+count) can describe a list reliably.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.views.decorators.http import condition
+
+STATE_ATTR = '_conditional_state'
+
+
+def _make_etag(*parts):
+    raw = '|'.join('' if part is None else str(part) for part in parts)
+    return hashlib.md5(raw.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def _memoized_state(request, compute):
+    # condition() calls the etag and last-modified functions separately; keep
+    # them to one query per request.
+    state = getattr(request, STATE_ATTR, None)
+    if state is None:
+        state = compute()
+        setattr(request, STATE_ATTR, state)
+    return state
+
+
+def list_state(model, library_field):
+    """
+    Return a state function for a list view of ``model``.
+
+    The ETag combines the absolute request URL (each host/page/filter is its own
+    representation), the newest ``updated_at``, the row count and the newest
+    ``updated`` of the media libraries.
+    """
+    def compute_state(request, *args, **kwargs):
+        def compute():
+            aggregate = model.objects.aggregate(
+                last_updated=Max('updated_at'),
+                total=Count('id'),
+                last_media_update=Max(f'{library_field}__updated'),
+            )
+            etag = _make_etag(
+                request.build_absolute_uri(),
+                aggregate['last_updated'],
+                aggregate['total'],
+                aggregate['last_media_update'],
+            )
+            return etag, None
+
+        return _memoized_state(request, compute)
+
+    return compute_state
+
+
+def detail_state(model, library_field, lookup_kwarg):
+    """
+    Return a state function for a detail view of ``model``.
+
+    Both validators come from the row's ``updated_at`` and its library's
+    ``updated``; a missing row yields no validators so the view can 404.
+    """
+    def compute_state(request, *args, **kwargs):
+        def compute():
+            row = (
+                model.objects.filter(pk=kwargs[lookup_kwarg])
+                .values_list('updated_at', f'{library_field}__updated')
+                .first()
+            )
+            if row is None:
+                return None, None
+            updated_at, media_updated = row
+            last_modified = max(filter(None, (updated_at, media_updated)), default=None)
+            return _make_etag(updated_at, media_updated), last_modified
+
+        return _memoized_state(request, compute)
+
+    return compute_state
+
+
+def banner_state(request, *args, **kwargs):
+    """
+    State function for the staging banner singleton.
+
+    The ETag is built from the serialized payload: ``days_remaining`` and
+    ``is_expired`` move with the clock, and bulk ``queryset.update`` calls do
+    not bump ``updated_at``, so the timestamp alone cannot describe the
+    banner. For the same reason no Last-Modified is emitted.
+    """
+    from base_feature_app.models import StagingPhaseBanner
+    from base_feature_app.serializers.staging_phase_banner import StagingPhaseBannerSerializer
+
+    def compute():
+        banner = StagingPhaseBanner.get_solo()
+        data = StagingPhaseBannerSerializer(banner).data
+        return _make_etag(banner.updated_at, *sorted(data.items())), None
+
+    return _memoized_state(request, compute)
+
+
+def conditional_response(state_func):
+    """
+    Wrap a view with ETag/Last-Modified validators from ``state_func``.
+
+    :param state_func: Callable ``(request, *args, **kwargs) -> (etag, last_modified)``.
+    """
+    return condition(
+        etag_func=lambda request, *args, **kwargs: state_func(request, *args, **kwargs)[0],
+        last_modified_func=lambda request, *args, **kwargs: state_func(request, *args, **kwargs)[1],
+    )
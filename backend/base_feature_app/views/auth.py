@@ -1,5 +1,5 @@
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
@@ -8,12 +8,14 @@
     authenticate_user,
     register_user,
 )
+from base_feature_app.services.recaptcha import verify_recaptcha
+from base_feature_app.throttling import GoogleLoginRateThrottle, SignInRateThrottle, SignUpRateThrottle
 from base_feature_app.utils.auth_utils import generate_auth_tokens
-from base_feature_app.views.captcha_views import verify_recaptcha
 
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([SignUpRateThrottle])
 def sign_up(request):
     """
     Register a new user with email and password.
@@ -47,6 +49,7 @@ def sign_up(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([SignInRateThrottle])
 def sign_in(request):
     """
     Sign in user with email and password.
@@ -77,6 +80,7 @@ def sign_in(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([GoogleLoginRateThrottle])
 def google_login(request):
     """
     Authenticate or register user with Google OAuth.
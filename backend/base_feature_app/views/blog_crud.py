@@ -2,22 +2,38 @@
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 
+from base_feature_app.filters import filter_queryset, search_queryset
 from base_feature_app.models import Blog
+from base_feature_app.pagination import IdCursorPagination
 from base_feature_app.permissions import IsAdminOrReadOnly
+from base_feature_app.serializers.attachments import ordered_attachments_prefetch
 from base_feature_app.serializers.blog_create_update import BlogCreateUpdateSerializer
 from base_feature_app.serializers.blog_detail import BlogDetailSerializer
 from base_feature_app.serializers.blog_list import BlogListSerializer
+from base_feature_app.utils.catalog_cache import cached_catalog_response
+from base_feature_app.utils.conditional import conditional_response, detail_state, list_state
 
 
 @api_view(['GET'])
 @permission_classes([IsAdminOrReadOnly])
+@conditional_response(list_state(Blog, 'image'))
+@cached_catalog_response('blogs')
 def list_blogs(request):
     """
-    Return a list of all blogs.
+    Return a cursor-paginated list of blogs (newest first).
+
+    Query params:
+        category: Exact-match filters.
+        search: Full-text match on title and description.
+        ordering: created_at (prefix ``-`` for descending).
     """
-    queryset = Blog.objects.all().order_by('-id')
-    serializer = BlogListSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    queryset = Blog.objects.select_related('image')
+    queryset = filter_queryset(queryset, request, ('category',))
+    queryset = search_queryset(queryset, request)
+    paginator = IdCursorPagination(ordering_fields=('created_at',))
+    page = paginator.paginate_queryset(queryset, request)
+    serializer = BlogListSerializer(page, many=True, context={'request': request})
+    return paginator.get_paginated_response(serializer.data)
 
 
 @api_view(['POST'])
@@ -36,12 +52,17 @@ def create_blog(request):
 
 @api_view(['GET'])
 @permission_classes([IsAdminOrReadOnly])
+@conditional_response(detail_state(Blog, 'image', 'blog_id'))
+@cached_catalog_response('blogs', lookup_kwarg='blog_id')
 def retrieve_blog(request, blog_id: int):
     """
     Return the detail of a single blog entry.
     """
+    queryset = Blog.objects.select_related('image').prefetch_related(
+        ordered_attachments_prefetch('image')
+    )
     try:
-        blog = Blog.objects.get(id=blog_id)
+        blog = queryset.get(id=blog_id)
     except Blog.DoesNotExist:
         return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
     serializer = BlogDetailSerializer(blog, context={'request': request})
@@ -3,14 +3,14 @@
 Provides endpoints to fetch the reCAPTCHA site key and verify captcha tokens.
 """
 
-import requests
 from django.conf import settings
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-RECAPTCHA_VERIFY_URL = 'https://www.google.com/recaptcha/api/siteverify'
+from base_feature_app.services.recaptcha import verify_recaptcha
+from base_feature_app.throttling import CaptchaRateThrottle
 
 
 @api_view(['GET'])
@@ -25,39 +25,9 @@ def get_site_key(request):
     return Response({'site_key': site_key})
 
 
-def verify_recaptcha(token: str) -> bool:
-    """Verify a reCAPTCHA token with Google's API.
-
-    Args:
-        token: The reCAPTCHA response token from the frontend.
-
-    Returns:
-        bool: True if verification succeeds, False otherwise.
-    """
-    secret_key = getattr(settings, 'RECAPTCHA_SECRET_KEY', '')
-    if not secret_key:
-        return True
-
-    if not token:
-        return False
-
-    try:
-        response = requests.post(
-            RECAPTCHA_VERIFY_URL,
-            data={
-                'secret': secret_key,
-                'response': token,
-            },
-            timeout=5,
-        )
-        result = response.json()
-        return result.get('success', False)
-    except requests.RequestException:
-        return False
-
-
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([CaptchaRateThrottle])
 def verify_captcha(request):
     """Verify a reCAPTCHA token.
 
@@ -2,22 +2,38 @@
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 
+from base_feature_app.filters import filter_queryset, search_queryset
 from base_feature_app.models import Product
+from base_feature_app.pagination import IdCursorPagination
 from base_feature_app.permissions import IsAdminOrReadOnly
+from base_feature_app.serializers.attachments import ordered_attachments_prefetch
 from base_feature_app.serializers.product_create_update import ProductCreateUpdateSerializer
 from base_feature_app.serializers.product_detail import ProductDetailSerializer
 from base_feature_app.serializers.product_list import ProductListSerializer
+from base_feature_app.utils.catalog_cache import cached_catalog_response
+from base_feature_app.utils.conditional import conditional_response, detail_state, list_state
 
 
 @api_view(['GET'])
 @permission_classes([IsAdminOrReadOnly])
+@conditional_response(list_state(Product, 'gallery'))
+@cached_catalog_response('products')
 def list_products(request):
     """
-    Return a paginated list of all products.
+    Return a cursor-paginated list of products (newest first).
+
+    Query params:
+        category, sub_category: Exact-match filters.
+        search: Full-text match on title and description.
+        ordering: price, created_at (prefix ``-`` for descending).
     """
-    queryset = Product.objects.all().order_by('-id')
-    serializer = ProductListSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    queryset = Product.objects.select_related('gallery')
+    queryset = filter_queryset(queryset, request, ('category', 'sub_category'))
+    queryset = search_queryset(queryset, request)
+    paginator = IdCursorPagination(ordering_fields=('price', 'created_at'))
+    page = paginator.paginate_queryset(queryset, request)
+    serializer = ProductListSerializer(page, many=True, context={'request': request})
+    return paginator.get_paginated_response(serializer.data)
 
 
 @api_view(['POST'])
@@ -36,12 +52,17 @@ def create_product(request):
 
 @api_view(['GET'])
 @permission_classes([IsAdminOrReadOnly])
+@conditional_response(detail_state(Product, 'gallery', 'product_id'))
+@cached_catalog_response('products', lookup_kwarg='product_id')
 def retrieve_product(request, product_id: int):
     """
     Return the detail of a single product.
     """
+    queryset = Product.objects.select_related('gallery').prefetch_related(
+        ordered_attachments_prefetch('gallery')
+    )
     try:
-        product = Product.objects.get(id=product_id)
+        product = queryset.get(id=product_id)
     except Product.DoesNotExist:
         return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
     serializer = ProductDetailSerializer(product, context={'request': request})
@@ -3,12 +3,16 @@
 from rest_framework.response import Response
 from rest_framework import status
 from base_feature_app.serializers import SaleSerializer
+from base_feature_app.services.idempotency import IDEMPOTENCY_HEADER, idempotent_response
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def create_sale(request):
     """
     Create a new sale with the provided data.
+
+    Clients may send an ``Idempotency-Key`` header; retries with the same key
+    and payload replay the first response instead of creating another sale.
     
     Args:
         request (HttpRequest): The request object containing the data for the sale.
@@ -17,8 +21,15 @@ def create_sale(request):
         Response: A response object containing the serialized sale data or errors.
     """
     if request.method == 'POST':
-        serializer = SaleSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key:
+            return idempotent_response('create-sale', key, request.data, lambda: _create_sale(request))
+        return _create_sale(request)
+
+
+def _create_sale(request):
+    serializer = SaleSerializer(data=request.data)
+    if serializer.is_valid():
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -1,22 +1,62 @@
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.response import Response
 
 from base_feature_app.models import Sale
+from base_feature_app.pagination import IdCursorPagination
 from base_feature_app.permissions import IsAdminUser
 from base_feature_app.serializers.sale_detail import SaleDetailSerializer
 from base_feature_app.serializers.sale_list import SaleListSerializer
+from base_feature_app.serializers.sales_stats import SalesStatsQuerySerializer, SalesStatsSerializer
+from base_feature_app.services import sales_rollup
+from base_feature_app.utils.export import CSVRenderer, NDJSONRenderer, streaming_export_response
 
 
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def list_sales(request):
     """
-    Return a list of all sales. Staff only.
+    Return a cursor-paginated list of sales (newest first). Staff only.
     """
     queryset = Sale.objects.all().order_by('-id')
-    serializer = SaleListSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    paginator = IdCursorPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    serializer = SaleListSerializer(page, many=True, context={'request': request})
+    return paginator.get_paginated_response(serializer.data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+@renderer_classes([NDJSONRenderer, CSVRenderer])
+def export_sales(request):
+    """
+    Stream all sales as NDJSON (default) or CSV (``?format=csv``). Staff only.
+    """
+    return streaming_export_response(
+        Sale.objects.all(),
+        SaleListSerializer.Meta.fields,
+        request.accepted_renderer.format,
+        'sales',
+    )
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def sales_stats(request):
+    """
+    Return revenue, units and top products/categories for a date range. Staff only.
+
+    Answered from the rollup tables, so cost depends on the number of days
+    in the range rather than on sale volume.
+
+    Query params:
+        start, end: Inclusive ``YYYY-MM-DD`` days; defaults to the last 30 days.
+    """
+    query = SalesStatsQuerySerializer(data=request.query_params)
+    if not query.is_valid():
+        return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+    stats = sales_rollup.get_stats(query.validated_data['start'], query.validated_data['end'])
+    return Response(SalesStatsSerializer(stats).data, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.utils.cache import patch_cache_control
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
@@ -5,10 +7,12 @@
 
 from base_feature_app.models import StagingPhaseBanner
 from base_feature_app.serializers.staging_phase_banner import StagingPhaseBannerSerializer
+from base_feature_app.utils.conditional import banner_state, conditional_response
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@conditional_response(banner_state)
 def staging_banner_state(request):
     """Public endpoint returning the current staging phase banner state.
 
@@ -18,4 +22,11 @@ def staging_banner_state(request):
     """
     banner = StagingPhaseBanner.get_solo()
     serializer = StagingPhaseBannerSerializer(banner)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    response = Response(serializer.data, status=status.HTTP_200_OK)
+    # Never let a browser hold the payload past the next countdown tick.
+    max_age = getattr(settings, 'STAGING_BANNER_MAX_AGE', 60)
+    seconds_until_change = banner.seconds_until_change
+    if seconds_until_change is not None:
+        max_age = min(max_age, seconds_until_change)
+    patch_cache_control(response, public=True, max_age=max_age)
+    return response
@@ -1,23 +1,42 @@
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.response import Response
 
 from base_feature_app.models import User
+from base_feature_app.pagination import IdCursorPagination
 from base_feature_app.permissions import IsAdminUser
 from base_feature_app.serializers.user_create_update import UserCreateUpdateSerializer
 from base_feature_app.serializers.user_detail import UserDetailSerializer
 from base_feature_app.serializers.user_list import UserListSerializer
+from base_feature_app.utils.export import CSVRenderer, NDJSONRenderer, streaming_export_response
 
 
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def list_users(request):
     """
-    Return a list of all users. Staff only.
+    Return a cursor-paginated list of users (newest first). Staff only.
     """
     queryset = User.objects.all().order_by('-id')
-    serializer = UserListSerializer(queryset, many=True, context={'request': request})
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    paginator = IdCursorPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    serializer = UserListSerializer(page, many=True, context={'request': request})
+    return paginator.get_paginated_response(serializer.data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+@renderer_classes([NDJSONRenderer, CSVRenderer])
+def export_users(request):
+    """
+    Stream all users as NDJSON (default) or CSV (``?format=csv``). Staff only.
+    """
+    return streaming_export_response(
+        User.objects.all(),
+        UserListSerializer.Meta.fields,
+        request.accepted_renderer.format,
+        'users',
+    )
 
 
 @api_view(['POST'])
@@ -11,6 +11,7 @@
 
 import os
 from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 
 from django.core.exceptions import ImproperlyConfigured
@@ -113,6 +114,9 @@ def get_list_env(var_name, default=None, separator=','):
 
 THUMBNAIL_DEFAULT_STORAGE = 'default'
 
+# Store identical attachment uploads once (content-addressed, reference counted).
+ATTACHMENTS_DEDUPLICATE = get_bool_env('DJANGO_ATTACHMENTS_DEDUPLICATE', default=False)
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -153,20 +157,64 @@ def get_list_env(var_name, default=None, separator=','):
     'x-csrftoken',
     'x-requested-with',
     'x-currency',
+    'idempotency-key',
+]
+
+CORS_EXPOSE_HEADERS = [
+    'link',
+    'idempotent-replayed',
 ]
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'base_feature_app.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 20,
+    'DEFAULT_PAGINATION_CLASS': 'base_feature_app.pagination.IdCursorPagination',
+    'PAGE_SIZE': int(get_env('DJANGO_API_PAGE_SIZE', '20')),
     'EXCEPTION_HANDLER': 'base_feature_app.views.error_handlers.custom_exception_handler',
+    # Reverse proxies in front of the app that append to X-Forwarded-For.
+    # Throttles key on the address the right-most trusted proxy saw; 0 uses
+    # REMOTE_ADDR and ignores the (client-controlled) header.
+    'NUM_PROXIES': int(get_env('DJANGO_NUM_PROXIES', '0')),
+    # Sliding-window limits for the public auth endpoints
+    # (base_feature_app.throttling): '<scope>' is per client IP,
+    # '<scope>_email' per submitted email. Format '<n>/<period>', e.g. '10/15m';
+    # an empty value disables that limit.
+    'DEFAULT_THROTTLE_RATES': {
+        'sign_in': get_env('DJANGO_THROTTLE_SIGN_IN', '30/m'),
+        'sign_in_email': get_env('DJANGO_THROTTLE_SIGN_IN_EMAIL', '10/15m'),
+        'sign_up': get_env('DJANGO_THROTTLE_SIGN_UP', '10/h'),
+        'sign_up_email': get_env('DJANGO_THROTTLE_SIGN_UP_EMAIL', '5/h'),
+        'google_login': get_env('DJANGO_THROTTLE_GOOGLE_LOGIN', '30/m'),
+        'captcha': get_env('DJANGO_THROTTLE_CAPTCHA', '30/m'),
+    },
 }
 
+# Upper bound for the ?page_size= query param on cursor-paginated list endpoints.
+API_MAX_PAGE_SIZE = int(get_env('DJANGO_API_MAX_PAGE_SIZE', '100'))
+
+# Rows fetched per keyset batch by the streaming NDJSON/CSV export endpoints.
+EXPORT_CHUNK_SIZE = int(get_env('DJANGO_EXPORT_CHUNK_SIZE', '2000'))
+
+# Seconds a stored Idempotency-Key response is replayed for (create-sale).
+IDEMPOTENCY_KEY_TTL = int(get_env('DJANGO_IDEMPOTENCY_KEY_TTL', '86400'))
+
+# Sales rollups: days rebuilt nightly from raw sales, and the widest range
+# accepted by /api/sales/stats/.
+SALES_ROLLUP_REBUILD_DAYS = int(get_env('DJANGO_SALES_ROLLUP_REBUILD_DAYS', '2'))
+SALES_STATS_MAX_DAYS = int(get_env('DJANGO_SALES_STATS_MAX_DAYS', '366'))
+
+# Sale ids removed per DELETE statement by SaleQuerySet.delete().
+SALE_DELETE_CHUNK_SIZE = int(get_env('DJANGO_SALE_DELETE_CHUNK_SIZE', '1000'))
+
+# Bulk Product/Blog deletes: rows per collector chunk, and attachment files
+# handed to each background delete_media_files task.
+MEDIA_DELETE_CHUNK_SIZE = int(get_env('DJANGO_MEDIA_DELETE_CHUNK_SIZE', '500'))
+MEDIA_DELETE_FILE_BATCH_SIZE = int(get_env('DJANGO_MEDIA_DELETE_FILE_BATCH_SIZE', '500'))
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(
         minutes=int(get_env('DJANGO_JWT_ACCESS_MINUTES', '15'))
@@ -177,10 +225,20 @@ def get_list_env(var_name, default=None, separator=','):
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    # Embed user claims and token_version so safe requests skip the user query.
+    'TOKEN_OBTAIN_SERIALIZER': 'base_feature_app.serializers.auth_tokens.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'base_feature_app.serializers.auth_tokens.ClaimsTokenRefreshSerializer',
 }
 
 GOOGLE_OAUTH_CLIENT_ID = get_env('DJANGO_GOOGLE_OAUTH_CLIENT_ID', '')
 
+# Google ID tokens are verified locally against this JWKS keyset. It is cached
+# for the response's max-age (DEFAULT_TTL when absent) and refetched early at
+# most once per MIN_REFRESH_INTERVAL when a token names an unknown key id.
+GOOGLE_JWKS_URL = get_env('DJANGO_GOOGLE_JWKS_URL', 'https://www.googleapis.com/oauth2/v3/certs')
+GOOGLE_JWKS_DEFAULT_TTL = int(get_env('DJANGO_GOOGLE_JWKS_DEFAULT_TTL', '3600'))
+GOOGLE_JWKS_MIN_REFRESH_INTERVAL = int(get_env('DJANGO_GOOGLE_JWKS_MIN_REFRESH_INTERVAL', '60'))
+
 ROOT_URLCONF = 'base_feature_project.urls'
 
 TEMPLATES = [
@@ -208,6 +266,37 @@ def get_list_env(var_name, default=None, separator=','):
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# Preferred password hasher: pbkdf2 (default), argon2 or bcrypt (both via the
+# Django extras in requirements.txt). The others stay listed so existing
+# hashes still verify; they are rehashed with the preferred one on the next
+# sign-in.
+PASSWORD_HASHER_CHOICES = {
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'argon2': 'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'bcrypt': 'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'pbkdf2_sha1': 'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+}
+PASSWORD_HASHER = get_env('DJANGO_PASSWORD_HASHER', 'pbkdf2')
+if PASSWORD_HASHER not in PASSWORD_HASHER_CHOICES:
+    raise ImproperlyConfigured(
+        f"DJANGO_PASSWORD_HASHER must be one of: {', '.join(PASSWORD_HASHER_CHOICES)}"
+    )
+# Fail at startup rather than on every sign-in when the library is missing.
+PASSWORD_HASHER_LIBRARIES = {'argon2': 'argon2', 'bcrypt': 'bcrypt'}
+if PASSWORD_HASHER in PASSWORD_HASHER_LIBRARIES and find_spec(PASSWORD_HASHER_LIBRARIES[PASSWORD_HASHER]) is None:
+    raise ImproperlyConfigured(
+        f"DJANGO_PASSWORD_HASHER={PASSWORD_HASHER} needs the '{PASSWORD_HASHER_LIBRARIES[PASSWORD_HASHER]}' "
+        "package; install requirements.txt (Django[argon2,bcrypt])."
+    )
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CHOICES[PASSWORD_HASHER],
+    *(path for name, path in PASSWORD_HASHER_CHOICES.items() if name != PASSWORD_HASHER),
+]
+# Hash and verify passwords for sign-in/sign-up in a pool of this many worker
+# processes, off the request thread. 0 hashes inline.
+PASSWORD_HASH_WORKERS = int(get_env('DJANGO_PASSWORD_HASH_WORKERS', '0'))
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
@@ -254,6 +343,16 @@ def get_list_env(var_name, default=None, separator=','):
 
 RECAPTCHA_SITE_KEY = get_env('RECAPTCHA_SITE_KEY', '')
 RECAPTCHA_SECRET_KEY = get_env('RECAPTCHA_SECRET_KEY', '')
+# siteverify calls share one keep-alive connection pool per process; verdicts
+# are cached per token so double-submits are not re-verified.
+RECAPTCHA_TIMEOUT = float(get_env('RECAPTCHA_TIMEOUT', '3'))
+RECAPTCHA_POOL_SIZE = int(get_env('RECAPTCHA_POOL_SIZE', '10'))
+RECAPTCHA_VERDICT_TTL = int(get_env('RECAPTCHA_VERDICT_TTL', '120'))
+# After BREAKER_THRESHOLD consecutive provider errors, skip Google for
+# BREAKER_COOLDOWN seconds. FAIL_OPEN decides whether logins pass meanwhile.
+RECAPTCHA_BREAKER_THRESHOLD = int(get_env('RECAPTCHA_BREAKER_THRESHOLD', '5'))
+RECAPTCHA_BREAKER_COOLDOWN = int(get_env('RECAPTCHA_BREAKER_COOLDOWN', '30'))
+RECAPTCHA_FAIL_OPEN = get_bool_env('RECAPTCHA_FAIL_OPEN', default=False)
 
 # ==============================================================================
 # DATABASE — override in settings_dev.py / settings_prod.py
@@ -266,6 +365,39 @@ def get_list_env(var_name, default=None, separator=','):
     }
 }
 
+# ==============================================================================
+# CACHE — local memory by default, Redis when DJANGO_CACHE_BACKEND=redis
+# ==============================================================================
+
+CACHE_BACKEND = get_env('DJANGO_CACHE_BACKEND', 'locmem')
+
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': get_env('DJANGO_CACHE_REDIS_URL', 'redis://localhost:6379/2'),
+            'KEY_PREFIX': 'base_feature_project',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'base_feature_project',
+        },
+    }
+
+# Read-through cache for the public product/blog endpoints
+# (base_feature_app.utils.catalog_cache).
+CATALOG_CACHE_ALIAS = 'default'
+CATALOG_CACHE_TTL = int(get_env('DJANGO_CATALOG_CACHE_TTL', '300'))
+
+# StagingPhaseBanner.get_solo(): seconds the row is kept in the shared cache
+# and in each process, and the Cache-Control max-age of the public endpoint.
+STAGING_BANNER_CACHE_TTL = int(get_env('DJANGO_STAGING_BANNER_CACHE_TTL', '300'))
+STAGING_BANNER_LOCAL_TTL = int(get_env('DJANGO_STAGING_BANNER_LOCAL_TTL', '5'))
+STAGING_BANNER_MAX_AGE = int(get_env('DJANGO_STAGING_BANNER_MAX_AGE', '60'))
+
 # ==============================================================================
 # HUEY — task queue
 # ==============================================================================
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Content-addressed storage for attachment files.
+
+With ``ATTACHMENTS_DEDUPLICATE`` enabled, uploads are hashed (SHA-256) and
+stored once under ``attachments/blobs/<xx>/<hash><ext>``. Every attachment
+with the same bytes points at that blob, so it is stored, backed up and
+thumbnailed once. The attachments referencing a blob are its reference count:
+the file is deleted only when the last of them goes.
+"""
+import hashlib
+from os import path
+
+from django.conf import settings
+
+BLOB_DIRECTORY = 'attachments/blobs'
+
+
+def deduplication_enabled():
+	return getattr(settings, 'ATTACHMENTS_DEDUPLICATE', False)
+
+
+def hash_file(file):
+	"""Return the SHA-256 hex digest of ``file``, read chunk by chunk, and rewind it."""
+	digest = hashlib.sha256()
+	file.seek(0)
+	for chunk in file.chunks():
+		digest.update(chunk)
+	file.seek(0)
+	return digest.hexdigest()
+
+
+def blob_path(content_hash, filename):
+	return path.join(BLOB_DIRECTORY, content_hash[:2], content_hash + path.splitext(filename)[1].lower())
+
+
+def is_blob_name(name):
+	return bool(name) and name.startswith(BLOB_DIRECTORY + '/')
+
+
+def blob_hash(name):
+	return path.splitext(path.basename(name))[0]
+
+
+def referenced_blobs(names, exclude_pk=None):
+	"""Return the subset of ``names`` that are blobs still used by an attachment."""
+	from .models import Attachment
+
+	blob_names = [name for name in names if is_blob_name(name)]
+	if not blob_names:
+		return set()
+	references = Attachment.objects.filter(
+		content_hash__in={blob_hash(name) for name in blob_names},
+		file__in=blob_names,
+	)
+	if exclude_pk is not None:
+		references = references.exclude(pk=exclude_pk)
+	return set(references.values_list('file', flat=True))
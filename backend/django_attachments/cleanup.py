@@ -1,12 +1,14 @@
 import logging
 import os
 
-from django.core.files.storage import storages
+from django.core.files.storage import default_storage, storages
 from django.db import models
 from django.db.models.signals import post_delete, pre_save
 from easy_thumbnails.conf import settings
 from easy_thumbnails.files import get_thumbnailer
 
+from .blobs import referenced_blobs
+
 logger = logging.getLogger('django.db.models')
 
 def delete_files(sender, instance, *args, **kwargs): #pylint: disable=unused-argument
@@ -14,6 +16,8 @@ def delete_files(sender, instance, *args, **kwargs): #pylint: disable=unused-arg
         if not isinstance(field, models.FileField):
             continue
         file_to_delete = getattr(instance, field.name)
+        if file_to_delete.name in referenced_blobs([file_to_delete.name], exclude_pk=instance.pk):
+            continue
         delete_file(file_to_delete)
 
 def delete_old_files(sender, instance, *args, **kwargs): #pylint: disable=unused-argument
@@ -30,7 +34,7 @@ def delete_old_files(sender, instance, *args, **kwargs): #pylint: disable=unused
             continue
         old_file = getattr(old_instance, field.name)
         new_file = getattr(instance, field.name)
-        if new_file != old_file:
+        if new_file != old_file and old_file.name not in referenced_blobs([old_file.name], exclude_pk=instance.pk):
             delete_file(old_file)
 
 def delete_file(file_instance):
@@ -58,6 +62,48 @@ def remove_empty_directories(path):
         if parent_directory != path:  # Ensure we don't go beyond the root directory
             remove_empty_directories(parent_directory)
 
+def delete_files_batch(names, storage=None):
+    """
+    Delete many stored files together with their thumbnails.
+
+    Thumbnails are resolved with one query against the easy_thumbnails cache
+    instead of one per source, and every affected directory is checked for
+    emptiness once, however many files it held.
+
+    Returns the number of files (sources and thumbnails) removed.
+    """
+    from easy_thumbnails.models import Source, Thumbnail
+
+    names = set(name for name in names if name)
+    # Blobs shared with attachments that still exist are kept.
+    names = list(names - referenced_blobs(names))
+    if not names:
+        return 0
+    storage = storage or default_storage
+    thumbnail_storage = storages[settings.THUMBNAIL_DEFAULT_STORAGE]
+
+    thumbnail_names = list(Thumbnail.objects.filter(source__name__in=names).values_list('name', flat=True))
+    directories = set()
+    deleted = 0
+    for file_storage, name in [(thumbnail_storage, n) for n in thumbnail_names] + [(storage, n) for n in names]:
+        try:
+            file_storage.delete(name)
+            deleted += 1
+        except (IOError, NotImplementedError):
+            logger.error('File not deleted: %s', name)
+            continue
+        try:
+            directories.add(file_storage.path(os.path.dirname(name)))
+        except NotImplementedError:
+            pass
+    Source.objects.filter(name__in=names).delete()
+
+    # Deepest first, so a parent is only listed after its children are gone.
+    for directory in sorted(directories, key=len, reverse=True):
+        if os.path.isdir(directory):
+            remove_empty_directories(directory)
+    return deleted
+
 def register_cleaner_for_model(model_cls):
     post_delete.connect(delete_files, sender=model_cls)
     pre_save.connect(delete_old_files, sender=model_cls)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from django import forms
-from django.forms.models import modelformset_factory
+from django.forms.models import BaseModelFormSet, modelformset_factory
 from django.utils.translation import gettext_lazy as _
 
 from .models import Attachment
@@ -47,9 +47,26 @@ def save(self, commit=True):
 		return obj
 
 
+class BaseAttachmentUpdateFormSet(BaseModelFormSet):
+	def save(self, commit=True):
+		if not commit:
+			return super().save(commit=False)
+		libraries = [form.instance.library for form in self.forms if form.instance.pk]
+		for form in self.deleted_forms:
+			if form.instance.pk:
+				self.delete_existing(form.instance)
+		# One CASE update for all ranks (and the primary attachment) instead
+		# of one UPDATE per form.
+		instances = [form.instance for form in self.ordered_forms if form.instance.pk]
+		if libraries:
+			libraries[0].reorder([obj.pk for obj in instances])
+		return instances
+
+
 AttachmentUpdateFormSet = modelformset_factory(
 	Attachment,
 	AttachmentUpdateForm,
+	formset=BaseAttachmentUpdateFormSet,
 	can_order=True,
 	can_delete=True,
 	extra=0
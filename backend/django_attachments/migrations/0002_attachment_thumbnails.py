@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_attachments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='thumbnails',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Thumbnails'),
+        ),
+        migrations.AddField(
+            model_name='attachment',
+            name='thumbnails_ready',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Thumbnails ready'),
+        ),
+    ]
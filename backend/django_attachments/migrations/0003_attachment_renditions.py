@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_attachments', '0002_attachment_thumbnails'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='renditions',
+            field=models.JSONField(blank=True, default=list, editable=False, verbose_name='Renditions'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_attachments', '0003_attachment_renditions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('created', models.DateTimeField(db_index=True, editable=False, verbose_name='Created')),
+                ('updated', models.DateTimeField(db_index=True, editable=False, verbose_name='Updated')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('original_name', models.CharField(max_length=255, verbose_name='Original name')),
+                ('size', models.BigIntegerField(verbose_name='File size')),
+                ('received', models.BigIntegerField(default=0, verbose_name='Received bytes')),
+                ('library', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='django_attachments.library', verbose_name='Library')),
+            ],
+            options={
+                'verbose_name': 'Upload session',
+                'verbose_name_plural': 'Upload sessions',
+            },
+        ),
+    ]
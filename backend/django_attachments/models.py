@@ -1,17 +1,17 @@
 # -*- coding: utf-8 -*-
 import mimetypes
-from io import BytesIO
+import uuid
 from os import path
 from uuid import uuid4
 
-from PIL import Image
-from django.db import models
-from django.db.models import F, Max, Subquery, OuterRef
+from django.db import models, transaction
+from django.db.models import Case, F, IntegerField, Max, OuterRef, Subquery, Value, When
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from easy_thumbnails.fields import ThumbnailerField
 
-from .utils import parse_mimetype
+from .blobs import blob_path, deduplication_enabled, hash_file
+from .utils import get_image_size, parse_mimetype
 
 
 class TimestampModelMixin(models.Model):
@@ -20,7 +20,7 @@ class TimestampModelMixin(models.Model):
 
 	def save(self, *args, **kwargs):
 		self.updated = timezone.now()
-		if not self.id and not self.created:
+		if not self.created:
 			self.created = self.updated
 		return super().save(*args, **kwargs)
 
@@ -29,6 +29,8 @@ class Meta:
 
 
 def upload_path_handler(instance, filename):
+	if instance.content_hash and deduplication_enabled():
+		return blob_path(instance.content_hash, filename)
 	pk = instance.library.pk
 	filename = str(uuid4()) + path.splitext(filename)[1]
 	return path.join('attachments', "{0:02x}".format(pk % 256), str(pk), filename)
@@ -73,6 +75,36 @@ def __str__(self):
 		else:
 			return 'Library'
 
+	def reorder(self, attachment_ids):
+		"""
+		Rank the library's attachments in the order of ``attachment_ids``.
+
+		All ranks are rewritten by one ``UPDATE ... CASE`` and the primary
+		attachment is recomputed in the same transaction, with the library row
+		locked so concurrent reorders, uploads and moves cannot interleave.
+		Attachments missing from ``attachment_ids`` (e.g. uploaded meanwhile)
+		keep their relative order after the listed ones.
+
+		Raises ValueError if an id does not belong to this library.
+		"""
+		attachment_ids = list(dict.fromkeys(int(pk) for pk in attachment_ids))
+		with transaction.atomic():
+			Library.objects.select_for_update().filter(pk=self.pk).values_list('pk', flat=True).get()
+			current = list(self.attachment_set.order_by('rank', 'pk').values_list('pk', flat=True))
+			unknown = set(attachment_ids) - set(current)
+			if unknown:
+				raise ValueError('Attachments %s do not belong to library %s.' % (sorted(unknown), self.pk))
+			listed = set(attachment_ids)
+			ordering = attachment_ids + [pk for pk in current if pk not in listed]
+			if ordering:
+				Attachment.objects.filter(library=self, pk__in=ordering).update(rank=Case(
+					*[When(pk=pk, then=Value(rank)) for rank, pk in enumerate(ordering)],
+					default=F('rank'),
+					output_field=IntegerField(),
+				))
+			Library.objects.filter(pk=self.pk).update_primary_image()
+		self.primary_attachment_id = ordering[0] if ordering else None
+
 
 class AttachmentQuerySet(models.QuerySet):
 	def images(self):
@@ -129,6 +161,30 @@ class Attachment(TimestampModelMixin, models.Model):
 		verbose_name=_("Options"),
 		blank=True
 	)
+	content_hash = models.CharField(
+		verbose_name=_("Content hash"),
+		max_length=64,
+		blank=True,
+		db_index=True,
+		editable=False
+	)
+	thumbnails = models.JSONField(
+		verbose_name=_("Thumbnails"),
+		default=dict,
+		blank=True,
+		editable=False
+	)
+	renditions = models.JSONField(
+		verbose_name=_("Renditions"),
+		default=list,
+		blank=True,
+		editable=False
+	)
+	thumbnails_ready = models.BooleanField(
+		verbose_name=_("Thumbnails ready"),
+		default=False,
+		editable=False
+	)
 
 	class Meta:
 		verbose_name = _("Attachment")
@@ -165,21 +221,58 @@ def save(self, *args, **kwargs):
 		else:
 			if self.pk is None:
 				self._rank_queryset().filter(rank__gte=self.rank).update(rank=F('rank')+1)
+		if self._file_changed():
+			self._update_file_metadata()
+		result = super().save(*args, **kwargs)
+		self._loaded_file_name = self.file.name
+		return result
+
+	@classmethod
+	def from_db(cls, db, field_names, values):
+		instance = super().from_db(db, field_names, values)
+		if 'file' in field_names:
+			instance._loaded_file_name = values[field_names.index('file')]
+		return instance
+
+	def _file_changed(self):
+		if self.pk is None or not self.file or not self.file._committed:
+			return True
+		return self.file.name != getattr(self, '_loaded_file_name', None)
+
+	def _update_file_metadata(self):
+		# Thumbnails of a previous file no longer apply.
+		self.thumbnails = {}
+		self.renditions = []
+		self.thumbnails_ready = False
+		self.content_hash = ''
+		if self.file and not self.file._committed and deduplication_enabled():
+			twin = self._use_existing_blob()
+			if twin is not None:
+				for field in ('filesize', 'image_width', 'image_height', 'thumbnails', 'renditions', 'thumbnails_ready'):
+					setattr(self, field, getattr(twin, field))
+				return
 		if self.file:
 			self.filesize = self.file.size
-			source = BytesIO(self.file.read())
-			try:
-				image = Image.open(source)
-				self.image_width, self.image_height = image.size
-			except IOError:
-				pass
-			finally:
-				self.file.seek(0)
+			self.image_width, self.image_height = get_image_size(self.file)
 		else:
 			self.filesize = -1
 			self.image_width = None
 			self.image_height = None
-		return super().save(*args, **kwargs)
+
+	def _use_existing_blob(self):
+		"""
+		Hash the new upload and point at its blob when the bytes are already stored.
+
+		Returns another attachment of the same blob (whose metadata and
+		thumbnails can be reused) or None when the blob has to be written.
+		"""
+		self.content_hash = hash_file(self.file)
+		name = blob_path(self.content_hash, self.file.name)
+		if not self.file.storage.exists(name):
+			return None
+		self.file.name = name
+		self.file._committed = True
+		return Attachment.objects.filter(content_hash=self.content_hash, file=name).exclude(pk=self.pk).first()
 
 	def delete(self, *args, **kwargs):
 		self._rank_queryset().filter(rank__gt=self.rank).update(rank=F('rank')-1)
@@ -197,3 +290,35 @@ def move_to(self, position):
 
 	def _rank_queryset(self):
 		return Attachment.objects.filter(library=self.library).order_by('rank')
+
+
+class UploadSession(TimestampModelMixin, models.Model):
+	id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+	library = models.ForeignKey(
+		Library,
+		verbose_name=_("Library"),
+		on_delete=models.CASCADE
+	)
+	original_name = models.CharField(
+		max_length=255,
+		verbose_name=_("Original name")
+	)
+	size = models.BigIntegerField(
+		verbose_name=_("File size")
+	)
+	received = models.BigIntegerField(
+		verbose_name=_("Received bytes"),
+		default=0
+	)
+
+	class Meta:
+		verbose_name = _("Upload session")
+		verbose_name_plural = _("Upload sessions")
+
+	def __str__(self):
+		return self.original_name
+
+	@property
+	def temp_path(self):
+		from .uploads import get_temp_dir
+		return path.join(get_temp_dir(), '%s.part' % self.pk.hex)
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+from django.dispatch import Signal
+
+
+# Sent with ``library`` after attachments were re-ranked through queryset
+# updates, which bypass ``post_save``.
+attachments_reordered = Signal()
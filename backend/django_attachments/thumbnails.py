@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Thumbnail pre-generation for attachments.
+
+Thumbnails for every configured alias (plus the admin widget preview) are
+rendered once, out of the request path, and their storage names are kept on
+``Attachment.thumbnails``. The alias renditions, with their real dimensions,
+are cached on ``Attachment.renditions`` for responsive ``srcset`` payloads.
+Readers build URLs from those names with ``thumbnail_urls`` and
+``rendition_urls`` and never open or stat the stored files.
+"""
+import logging
+
+from django.core.files.storage import storages
+from easy_thumbnails.alias import aliases
+from easy_thumbnails.conf import settings
+from easy_thumbnails.exceptions import EasyThumbnailsError
+from easy_thumbnails.files import get_thumbnailer
+
+logger = logging.getLogger(__name__)
+
+ALIAS_TARGET = 'django_attachments.Attachment.file'
+WIDGET_THUMBNAIL_OPTIONS = {
+	'thumbnail': {'crop': True, 'size': (100, 100)},
+}
+
+
+def get_thumbnail_options():
+	"""Return ``{key: options}`` for every thumbnail rendered ahead of time."""
+	options = dict(WIDGET_THUMBNAIL_OPTIONS)
+	options.update(aliases.all(target=ALIAS_TARGET))
+	return options
+
+
+def generate_thumbnails(attachment):
+	"""
+	Render all pre-generated thumbnails of ``attachment`` and mark it ready.
+
+	The row is updated with ``update()`` (no ``post_save``) and only while it
+	still points at the same file, so a replacement uploaded meanwhile keeps
+	its own pending state.
+
+	Returns True when the attachment was marked ready.
+	"""
+	if not attachment.is_image or not attachment.file:
+		return False
+	thumbnailer = get_thumbnailer(attachment.file)
+	thumbnailer.thumbnail_storage = storages[settings.THUMBNAIL_DEFAULT_STORAGE]
+	alias_names = set(aliases.all(target=ALIAS_TARGET))
+	names = {}
+	renditions = []
+	for key, options in get_thumbnail_options().items():
+		try:
+			thumbnail = thumbnailer.get_thumbnail(options)
+		except (EasyThumbnailsError, IOError):
+			logger.warning('Thumbnail %s not generated for %s', key, attachment.file.name)
+			continue
+		names[key] = thumbnail.name
+		if key in alias_names:
+			renditions.append({
+				'alias': key,
+				'name': thumbnail.name,
+				'width': thumbnail.width,
+				'height': thumbnail.height,
+			})
+	renditions.sort(key=lambda rendition: (rendition['width'], rendition['alias']))
+	updated = type(attachment).objects.filter(pk=attachment.pk, file=attachment.file.name).update(
+		thumbnails=names,
+		renditions=renditions,
+		thumbnails_ready=True,
+	)
+	attachment.thumbnails = names
+	attachment.renditions = renditions
+	attachment.thumbnails_ready = bool(updated)
+	return bool(updated)
+
+
+def thumbnail_urls(attachment):
+	"""
+	Return ``{key: url}`` of the pre-generated thumbnails of ``attachment``.
+
+	Empty until the attachment is ready; never touches the image itself.
+	"""
+	if not attachment.thumbnails_ready:
+		return {}
+	storage = storages[settings.THUMBNAIL_DEFAULT_STORAGE]
+	return {key: storage.url(name) for key, name in attachment.thumbnails.items()}
+
+
+def rendition_urls(attachment):
+	"""
+	Return the cached alias renditions of ``attachment``, narrowest first.
+
+	Each item is ``{'alias', 'url', 'width', 'height'}``; empty until the
+	attachment is ready.
+	"""
+	if not attachment.thumbnails_ready:
+		return []
+	storage = storages[settings.THUMBNAIL_DEFAULT_STORAGE]
+	return [
+		{
+			'alias': rendition['alias'],
+			'url': storage.url(rendition['name']),
+			'width': rendition['width'],
+			'height': rendition['height'],
+		}
+		for rendition in attachment.renditions
+	]
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Chunked, resumable uploads.
+
+A client starts an ``UploadSession`` with the file name and total size, sends
+the bytes in parts at explicit offsets and completes the session once every
+byte arrived. Parts are streamed into one sparse file in
+``ATTACHMENTS_UPLOAD_TEMP_DIR`` at their offsets, so memory per request is
+bounded by ``STREAM_BLOCK_SIZE`` and an interrupted transfer resumes from
+``UploadSession.received``. On completion the assembled file is handed to the
+upload form as a temporary upload: file system storage moves it into the
+``upload_path_handler`` location and other storages stream-copy it.
+
+Settings:
+  - ATTACHMENTS_UPLOAD_TEMP_DIR: Directory for partial uploads
+  - ATTACHMENTS_UPLOAD_MAX_PART_SIZE: Largest accepted part in bytes (8 MB)
+  - ATTACHMENTS_UPLOAD_MAX_SIZE: Largest accepted file in bytes (1 GB)
+  - ATTACHMENTS_UPLOAD_SESSION_TTL: Seconds an idle session is kept (1 day)
+"""
+import os
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import UploadSession
+
+STREAM_BLOCK_SIZE = 64 * 1024
+
+
+class UploadError(Exception):
+	def __init__(self, message, status=400, offset=None):
+		super().__init__(message)
+		self.status = status
+		self.offset = offset
+
+
+class AssembledUpload(UploadedFile):
+	"""Completed session file, exposed like Django's ``TemporaryUploadedFile``."""
+
+	def __init__(self, session):
+		self.path = session.temp_path
+		super().__init__(
+			open(self.path, 'rb'),
+			name=session.original_name,
+			size=session.size,
+		)
+
+	def temporary_file_path(self):
+		return self.path
+
+
+def get_temp_dir():
+	temp_dir = getattr(settings, 'ATTACHMENTS_UPLOAD_TEMP_DIR', None) or os.path.join(
+		settings.FILE_UPLOAD_TEMP_DIR or tempfile.gettempdir(), 'django_attachments'
+	)
+	os.makedirs(temp_dir, exist_ok=True)
+	return temp_dir
+
+
+def start_upload(library, original_name, size):
+	max_size = getattr(settings, 'ATTACHMENTS_UPLOAD_MAX_SIZE', 1024 ** 3)
+	if not original_name:
+		raise UploadError('Missing file name.')
+	if size < 0 or size > max_size:
+		raise UploadError('File size must be between 0 and %d bytes.' % max_size)
+	session = UploadSession.objects.create(library=library, original_name=original_name[:255], size=size)
+	# Reserve the temp file so parts can be written at any offset.
+	open(session.temp_path, 'wb').close()
+	return session
+
+
+def write_part(session_id, library, offset, stream, length):
+	"""
+	Write ``length`` bytes from ``stream`` at ``offset`` of the session file.
+
+	Parts may be re-sent (``offset`` below the received size) but never leave
+	a gap. The session row is locked only to validate the offset; the bytes
+	are streamed with no transaction open, and ``received`` is then advanced
+	with a conditional ``GREATEST`` update, so parallel parts of one upload
+	never move it backwards. Returns the updated session.
+	"""
+	max_part_size = getattr(settings, 'ATTACHMENTS_UPLOAD_MAX_PART_SIZE', 8 * 1024 * 1024)
+	with transaction.atomic():
+		session = get_session(session_id, library, lock=True)
+		if offset < 0 or offset > session.received:
+			raise UploadError('Unexpected offset.', status=409, offset=session.received)
+	if length > max_part_size:
+		raise UploadError('Parts must be at most %d bytes.' % max_part_size, status=413)
+	if offset + length > session.size:
+		raise UploadError('Part exceeds the declared file size.', offset=session.received)
+	written = 0
+	try:
+		with open(session.temp_path, 'r+b') as fp:
+			fp.seek(offset)
+			while written < length:
+				block = stream.read(min(STREAM_BLOCK_SIZE, length - written))
+				if not block:
+					break
+				fp.write(block)
+				written += len(block)
+	except FileNotFoundError:
+		# Finished or discarded while this part was in flight.
+		raise UploadError('Unknown upload.', status=404)
+	updated = UploadSession.objects.filter(pk=session.pk).update(
+		received=Greatest(F('received'), offset + written),
+		updated=timezone.now(),
+	)
+	if not updated:
+		raise UploadError('Unknown upload.', status=404)
+	session.refresh_from_db(fields=['received', 'updated'])
+	if written < length:
+		raise UploadError('Incomplete part.', offset=session.received)
+	return session
+
+
+def get_session(session_id, library, lock=False):
+	queryset = UploadSession.objects.filter(library=library)
+	if lock:
+		queryset = queryset.select_for_update()
+	try:
+		return queryset.get(pk=session_id)
+	except (UploadSession.DoesNotExist, ValidationError, ValueError):
+		raise UploadError('Unknown upload.', status=404)
+
+
+def finish_upload(session_id, library, save):
+	"""
+	Turn a fully received session into an attachment via ``save(upload)``.
+
+	The session row stays locked until the attachment is saved and the
+	session removed, so a concurrent finish of the same upload waits and
+	then gets "Unknown upload" instead of creating a second attachment. If
+	``save`` raises, the session and its temp file are kept so the client
+	can retry.
+	"""
+	with transaction.atomic():
+		session = get_session(session_id, library, lock=True)
+		if session.received != session.size:
+			raise UploadError('Upload is incomplete.', status=409, offset=session.received)
+		upload = AssembledUpload(session)
+		try:
+			result = save(upload)
+		finally:
+			upload.close()
+		discard_session(session)
+	return result
+
+
+def discard_session(session):
+	try:
+		os.remove(session.temp_path)
+	except FileNotFoundError:
+		pass
+	session.delete()
+
+
+def purge_stale_uploads():
+	"""Delete sessions idle for longer than ``ATTACHMENTS_UPLOAD_SESSION_TTL``."""
+	ttl = getattr(settings, 'ATTACHMENTS_UPLOAD_SESSION_TTL', 86400)
+	stale = UploadSession.objects.filter(updated__lt=timezone.now() - timedelta(seconds=ttl))
+	count = 0
+	for session in stale:
+		discard_session(session)
+		count += 1
+	return count
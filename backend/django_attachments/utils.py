@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import mimetypes
 import os
+from functools import lru_cache
 from io import BytesIO
 
 from PIL import Image
@@ -44,19 +45,61 @@ def resized_picture_field(self, image_field, max_image_size=None, force_image_ty
 	return image_field
 
 
-def parse_mimetype(filename):
-	mimetype = (mimetypes.guess_type(filename)[0] or '')[:200]
+def get_image_size(file):
+	"""
+	Return ``(width, height)`` of an image file, or ``(None, None)``.
+
+	Pillow's ``Image.open`` only parses the header straight from the handle;
+	pixel data is never decoded and the file is never buffered whole. The
+	handle is rewound afterwards.
+	"""
+	try:
+		with Image.open(file) as image:
+			return image.size
+	except (IOError, SyntaxError, Image.DecompressionBombError):
+		return None, None
+	finally:
+		file.seek(0)
+
+
+MIMETYPE_ICON_DIR = 'django_attachments/img/mimetypes/'
+DEFAULT_MIMETYPE_ICON = MIMETYPE_ICON_DIR + 'application/octet-stream.png'
+
+
+@lru_cache(maxsize=None)
+def get_mimetype_icons():
+	"""
+	Return the ``type/subtype`` names that have an icon, built on first use.
+
+	Lists every static finder once instead of running ``finders.find`` (a
+	walk over all finders) for each file. Call ``cache_clear()`` after adding
+	icons at runtime.
+	"""
+	icons = set()
+	for finder in finders.get_finders():
+		for static_path, __ in finder.list(None):
+			static_path = static_path.replace(os.sep, '/')
+			if static_path.startswith(MIMETYPE_ICON_DIR) and static_path.endswith('.png'):
+				icons.add(static_path[len(MIMETYPE_ICON_DIR):-len('.png')])
+	return frozenset(icons)
+
+
+@lru_cache(maxsize=1024)
+def _mimetype_icon(mimetype):
+	# Keyed on the guessed type, not the (mostly unique) file name, so a few
+	# hundred entries cover every upload.
 	mime_components = [d for d in mimetype.split('/') if d != '..' and d != '']
-	if mime_components:
-		mime_url_part = '/'.join(mime_components)
-		safe_mimetype = os.path.join(*mime_components)
-		mime_url = 'django_attachments/img/mimetypes/%s.png' % mime_url_part
-		result = finders.find(os.path.join('django_attachments', 'img', 'mimetypes', safe_mimetype) + '.png')
+	mime_name = '/'.join(mime_components)
+	if mime_components and mime_name in get_mimetype_icons():
+		mime_url = MIMETYPE_ICON_DIR + mime_name + '.png'
 	else:
-		result = None
-	if result is None:
-		mime_url = 'django_attachments/img/mimetypes/application/octet-stream.png'
+		mime_url = DEFAULT_MIMETYPE_ICON
+	return static(mime_url)
+
+
+def parse_mimetype(filename):
+	mimetype = (mimetypes.guess_type(filename)[0] or '')[:200]
 	return {
 		'mimetype': mimetype,
-		'mimetype_url': static(mime_url)
+		'mimetype_url': _mimetype_icon(mimetype),
 	}
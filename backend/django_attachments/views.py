@@ -9,16 +9,20 @@
 from easy_thumbnails.files import get_thumbnailer
 
 from .forms import AttachmentUploadForm, AttachmentUpdateFormSet
-from .models import Attachment
+from .models import Attachment, Library
+from .signals import attachments_reordered
+from .thumbnails import WIDGET_THUMBNAIL_OPTIONS, thumbnail_urls
+from .uploads import UploadError, finish_upload, get_session, start_upload, write_part
 from .utils import parse_mimetype, check_ajax
 
 
+CHUNKED_UPLOAD_ACTIONS = ('upload_start', 'upload_part', 'upload_status', 'upload_finish')
+
+
 class AttachmentEditableMixin(object):
 	upload_form_class = AttachmentUploadForm
 	update_form_class = AttachmentUpdateFormSet
-	thumbnail_options = {
-		'thumbnail': {'crop': True, 'size': (100, 100)},
-	}
+	thumbnail_options = WIDGET_THUMBNAIL_OPTIONS
 
 	def can_upload_attachment(self):
 		return True
@@ -74,7 +78,10 @@ def get_context_data(self, **kwargs):
 		return ctx
 
 	def post(self, request, *args, **kwargs):
-		action = self.request.POST.get('action')
+		# Upload parts carry a raw body, so their action is in the query string.
+		action = self.request.POST.get('action') or self.request.GET.get('action')
+		if action in CHUNKED_UPLOAD_ACTIONS and self.upload_form:
+			return self.chunked_upload(action)
 		if action == 'upload' and self.upload_form:
 			if self.upload_form.is_valid():
 				return self.upload_form_valid(self.upload_form)
@@ -108,6 +115,47 @@ def upload_form_valid(self, form):
 			return JsonResponse({'attachments': attachments})
 		return HttpResponseRedirect(self.request.get_full_path())
 
+	def chunked_upload(self, action):
+		"""
+		Resumable upload protocol, see ``django_attachments.uploads``.
+
+		- ``upload_start`` (``filename``, ``size``) opens a session;
+		- ``upload_part`` (``?upload=&offset=`` and the raw bytes as body)
+		  stores one part;
+		- ``upload_status`` (``upload``) reports the offset to resume from;
+		- ``upload_finish`` (``upload``) validates the file with the upload
+		  form and answers like a regular upload.
+		"""
+		library = self.get_library()
+		if library.pk is None:
+			library.save()
+		try:
+			if action == 'upload_start':
+				session = start_upload(library, self.request.POST.get('filename', ''), int(self.request.POST['size']))
+			elif action == 'upload_part':
+				session = write_part(
+					self.request.GET.get('upload'),
+					library,
+					int(self.request.GET['offset']),
+					self.request,
+					int(self.request.META.get('CONTENT_LENGTH') or 0),
+				)
+			elif action == 'upload_status':
+				session = get_session(self.request.POST.get('upload'), library)
+			else:
+				return finish_upload(self.request.POST.get('upload'), library, self.chunked_upload_finish)
+		except UploadError as e:
+			return JsonResponse({'errors': {'file': [str(e)]}, 'offset': e.offset}, status=e.status)
+		except (KeyError, ValueError):
+			return JsonResponse({'errors': {'file': ['Invalid upload parameters.']}}, status=400)
+		return JsonResponse({'upload': str(session.pk), 'offset': session.received, 'size': session.size})
+
+	def chunked_upload_finish(self, upload):
+		form = self.upload_form_class(data={}, files={'file': upload}, library=self.get_library())
+		if form.is_valid():
+			return self.upload_form_valid(form)
+		return self.upload_form_invalid(form)
+
 	def upload_form_invalid(self, form):
 		if check_ajax(self.request):
 			return JsonResponse({'errors': json.loads(form.errors.as_json())})
@@ -115,7 +163,7 @@ def upload_form_invalid(self, form):
 
 	def update_form_valid(self, form):
 		form.save()
-		self.update_primary_attachment()
+		attachments_reordered.send(sender=Library, library=self.get_library())
 		if check_ajax(self.request):
 			return self.render_json_attachments()
 		return HttpResponseRedirect(self.request.get_full_path())
@@ -152,15 +200,25 @@ def serialize_attachemnts(self):
 			if attachment.is_image:
 				attachment_data['image_width'] = attachment.image_width
 				attachment_data['image_height'] = attachment.image_height
-				thumbnailer = get_thumbnailer(attachment.file)
+				# Pre-generated thumbnails are served by name; pending ones are
+				# None until the background task has rendered them.
+				ready = thumbnail_urls(attachment)
 				for key, options in self.thumbnail_options.items():
-					try:
-						attachment_data[key] = thumbnailer.get_thumbnail(options).url
-					except EasyThumbnailsError:
+					if key in ready:
+						attachment_data[key] = ready[key]
+					elif attachment.thumbnails_ready:
+						attachment_data[key] = self.render_thumbnail(attachment, options)
+					else:
 						attachment_data[key] = None
 			attachments_data.append(attachment_data)
 		return attachments_data
 
+	def render_thumbnail(self, attachment, options):
+		try:
+			return get_thumbnailer(attachment.file).get_thumbnail(options).url
+		except EasyThumbnailsError:
+			return None
+
 	def render_json_attachments(self):
 		return JsonResponse({'attachments': self.serialize_attachemnts()})
 
@@ -168,8 +226,4 @@ def update_primary_attachment(self):
 		library = self.get_library()
 		if not library.pk:
 			return
-		library.refresh_from_db()
-		first_attachment = library.attachment_set.order_by('rank').first()
-		if library.primary_attachment != first_attachment:
-			library.primary_attachment = first_attachment
-			library.save()
+		Library.objects.filter(pk=library.pk).update_primary_image()
@@ -1,6 +1,6 @@
 import { ref, computed } from "vue";
 import { defineStore } from "pinia";
-import { get_request } from "./services/request_http";
+import { get_all_request } from "./services/request_http";
 
 const normalizeMediaUrl = (url) => {
   if (!url || typeof url !== 'string') return url;
@@ -29,7 +29,7 @@ export const useBlogStore = defineStore("blog", () => {
     if (dataLoaded.value) return;
 
     try {
-      const response = await get_request("blogs/");
+      const response = await get_all_request("blogs/");
       blogs.value = Array.isArray(response.data)
         ? response.data.map((b) => ({ ...b, image_url: normalizeMediaUrl(b.image_url) }))
         : [];
@@ -1,6 +1,6 @@
 import { ref, computed } from "vue";
 import { defineStore } from "pinia";
-import { create_request, get_request } from "./services/request_http";
+import { create_request, get_all_request } from "./services/request_http";
 
 const normalizeMediaUrl = (url) => {
   if (!url || typeof url !== 'string') return url;
@@ -63,7 +63,7 @@ export const useProductStore = defineStore("productStore", () => {
     if (dataLoaded.value) return;
 
     try {
-      const response = await get_request("products/");
+      const response = await get_all_request("products/");
       products.value = Array.isArray(response.data)
         ? response.data.map((p) => ({
             ...p,
@@ -47,6 +47,43 @@ export async function get_request(url) {
   return await makeRequest("GET", url);
 }
 
+const NEXT_LINK_RE = /<([^>]+)>\s*;\s*rel="next"/;
+const ALL_PAGES_SIZE = 100;
+
+/**
+ * Next page URL from the RFC 8288 ``Link`` header of a paginated response.
+ * @param {object} response - Response of a list endpoint.
+ * @returns {string|null} - URL relative to the API base URL, or null on the last page.
+ */
+function nextPageUrl(response) {
+  const match = NEXT_LINK_RE.exec(response.headers?.link || "");
+  if (!match) return null;
+  // The backend links absolute URLs; stay on the client's origin and base URL.
+  const { pathname, search } = new URL(match[1], window.location.origin);
+  const base = api.defaults?.baseURL || "/";
+  return (pathname.startsWith(base) ? pathname.slice(base.length) : pathname) + search;
+}
+
+/**
+ * Get request that follows the ``Link`` header through every page of a list endpoint.
+ * @param {string} url - Endpoint.
+ * @returns {object} - First response, with the rows of all pages as data.
+ */
+export async function get_all_request(url) {
+  const separator = url.includes("?") ? "&" : "?";
+  const response = await get_request(`${url}${separator}page_size=${ALL_PAGES_SIZE}`);
+  if (!Array.isArray(response.data)) return response;
+
+  const data = [...response.data];
+  let next = nextPageUrl(response);
+  while (next) {
+    const page = await get_request(next);
+    if (Array.isArray(page.data)) data.push(...page.data);
+    next = nextPageUrl(page);
+  }
+  return { ...response, data };
+}
+
 /**
  * Create request.
  * @param {string} url - Endpoint.
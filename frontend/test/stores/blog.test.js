@@ -3,10 +3,10 @@ import { useBlogStore } from "@/stores/blog";
 
 // Mock the request_http module
 jest.mock("@/stores/services/request_http", () => ({
-  get_request: jest.fn(),
+  get_all_request: jest.fn(),
 }));
 
-import { get_request } from "@/stores/services/request_http";
+import { get_all_request } from "@/stores/services/request_http";
 
 describe("Blog Store", () => {
   beforeEach(() => {
@@ -64,13 +64,13 @@ describe("Blog Store", () => {
         { id: 2, title: "Blog 2", category: "Health", description: "Description 2" },
       ];
 
-      get_request.mockResolvedValue({ data: mockBlogs });
+      get_all_request.mockResolvedValue({ data: mockBlogs });
 
       await store.fetchBlogs();
 
       expect(store.blogs).toEqual(mockBlogs);
       expect(store.dataLoaded).toBe(true);
-      expect(get_request).toHaveBeenCalledWith("blogs/");
+      expect(get_all_request).toHaveBeenCalledWith("blogs/");
     });
 
     test("should not fetch if data already loaded", async () => {
@@ -79,12 +79,12 @@ describe("Blog Store", () => {
 
       await store.fetchBlogs();
 
-      expect(get_request).not.toHaveBeenCalled();
+      expect(get_all_request).not.toHaveBeenCalled();
     });
 
     test("should handle non-array response", async () => {
       const store = useBlogStore();
-      get_request.mockResolvedValue({ data: null });
+      get_all_request.mockResolvedValue({ data: null });
 
       await store.fetchBlogs();
 
@@ -96,7 +96,7 @@ describe("Blog Store", () => {
       const store = useBlogStore();
       const consoleErrorSpy = jest.spyOn(console, "error").mockImplementation(() => {});
 
-      get_request.mockRejectedValue(new Error("Network error"));
+      get_all_request.mockRejectedValue(new Error("Network error"));
 
       await store.fetchBlogs();
 
@@ -111,7 +111,7 @@ describe("Blog Store", () => {
 
     test("should handle empty array response", async () => {
       const store = useBlogStore();
-      get_request.mockResolvedValue({ data: [] });
+      get_all_request.mockResolvedValue({ data: [] });
 
       await store.fetchBlogs();
 
@@ -128,7 +128,7 @@ describe("Blog Store", () => {
         { id: 4, title: "Blog 4", image_url: null },
       ];
 
-      get_request.mockResolvedValue({ data: mockBlogs });
+      get_all_request.mockResolvedValue({ data: mockBlogs });
 
       await store.fetchBlogs();
 
@@ -3,11 +3,11 @@ import { useProductStore } from "@/stores/product";
 
 // Mock the request_http module
 jest.mock("@/stores/services/request_http", () => ({
-  get_request: jest.fn(),
+  get_all_request: jest.fn(),
   create_request: jest.fn(),
 }));
 
-import { get_request, create_request } from "@/stores/services/request_http";
+import { get_all_request, create_request } from "@/stores/services/request_http";
 
 describe("Product Store", () => {
   beforeEach(() => {
@@ -81,7 +81,7 @@ describe("Product Store", () => {
         { id: 2, title: "Product 2", category: "Cat2", sub_category: "Sub2", gallery_urls: [] },
       ];
 
-      get_request.mockResolvedValue({ data: mockProducts });
+      get_all_request.mockResolvedValue({ data: mockProducts });
 
       await store.fetchProducts();
 
@@ -96,14 +96,14 @@ describe("Product Store", () => {
 
       await store.fetchProducts();
 
-      expect(get_request).not.toHaveBeenCalled();
+      expect(get_all_request).not.toHaveBeenCalled();
     });
 
     test("should handle fetch error", async () => {
       const store = useProductStore();
       const consoleErrorSpy = jest.spyOn(console, "error").mockImplementation(() => {});
 
-      get_request.mockRejectedValue(new Error("Network error"));
+      get_all_request.mockRejectedValue(new Error("Network error"));
 
       await store.fetchProducts();
 
@@ -114,7 +114,7 @@ describe("Product Store", () => {
 
     test("should handle non-array response data", async () => {
       const store = useProductStore();
-      get_request.mockResolvedValue({ data: { message: "not-array" } });
+      get_all_request.mockResolvedValue({ data: { message: "not-array" } });
 
       await store.fetchProducts();
 
@@ -147,7 +147,7 @@ describe("Product Store", () => {
         },
       ];
 
-      get_request.mockResolvedValue({ data: mockProducts });
+      get_all_request.mockResolvedValue({ data: mockProducts });
 
       await store.fetchProducts();
 
@@ -233,7 +233,7 @@ describe("Product Store", () => {
         { id: 3, category: "Decor", sub_category: "Trending" },
       ];
 
-      get_request.mockResolvedValue({ data: mockProducts });
+      get_all_request.mockResolvedValue({ data: mockProducts });
 
       await store.fetchProducts();
 
@@ -249,11 +249,11 @@ describe("Product Store", () => {
       ];
 
       store.dataLoaded = false;
-      get_request.mockResolvedValue({ data: mockProducts });
+      get_all_request.mockResolvedValue({ data: mockProducts });
 
       await store.fetchUniqueCategoriesAndSubCategories();
 
-      expect(get_request).toHaveBeenCalled();
+      expect(get_all_request).toHaveBeenCalled();
       expect(store.categories).toHaveLength(1);
     });
 
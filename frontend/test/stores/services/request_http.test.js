@@ -1,5 +1,13 @@
 import api from '@/services/http/client';
-import { create_request, delete_request, get_request, makeRequest, patch_request, update_request } from '@/stores/services/request_http';
+import {
+  create_request,
+  delete_request,
+  get_all_request,
+  get_request,
+  makeRequest,
+  patch_request,
+  update_request,
+} from '@/stores/services/request_http';
 
 jest.mock('@/services/http/client', () => {
   const apiFn = jest.fn();
@@ -29,6 +37,32 @@ describe('request_http service', () => {
     expect(result).toBe(response);
   });
 
+  test('get_all_request follows the Link header through every page', async () => {
+    api.defaults = { baseURL: '/api/' };
+    api.get
+      .mockResolvedValueOnce({
+        data: [{ id: 3 }, { id: 2 }],
+        headers: { link: '<http://backend:8000/api/products/?cursor=abc&page_size=100>; rel="next"' },
+      })
+      .mockResolvedValueOnce({ data: [{ id: 1 }], headers: {} });
+
+    const result = await get_all_request('products/');
+
+    expect(api.get).toHaveBeenNthCalledWith(1, 'products/?page_size=100');
+    expect(api.get).toHaveBeenNthCalledWith(2, 'products/?cursor=abc&page_size=100');
+    expect(result.data).toEqual([{ id: 3 }, { id: 2 }, { id: 1 }]);
+  });
+
+  test('get_all_request returns non-list responses unchanged', async () => {
+    const response = { data: { detail: 'not a list' }, headers: {} };
+    api.get.mockResolvedValue(response);
+
+    const result = await get_all_request('users/?role=admin');
+
+    expect(api.get).toHaveBeenCalledWith('users/?role=admin&page_size=100');
+    expect(result).toBe(response);
+  });
+
   test('create_request calls api.post with url and params', async () => {
     const response = { status: 201 };
     api.post.mockResolvedValue(response);